@@ -11,11 +11,22 @@ if not st.session_state.get("attached"):
     st.stop()
 
 sap: Sap2000Wrapper = st.session_state["SAP"]
+catalog = sap.Table.catalog
 st.divider()
 with st.expander("Tables Tables"):
     _all = st.checkbox("Show All")
-    if _all:
-        st.table(sap.Table.list_all())
+    query = st.text_input("Search Tables")
+    if query:
+        st.table(catalog.find(query, limit=25))
+    elif _all:
+        st.table(catalog.list_all())
     else:
-        st.table(sap.Table.list_available())
+        st.table(catalog.list_available())
+st.divider()
+with st.expander("Table Fields"):
+    TableKey = st.selectbox(
+        "Table", [table.TableKey for table in catalog.list_available()]
+    )
+    if TableKey:
+        st.table(catalog.fields(TableKey))
 st.divider()
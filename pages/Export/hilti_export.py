@@ -93,23 +93,19 @@ def main():
                 basefile = None
             anchor = load_hilti_class(basefile=basefile)
 
-            sap.Results.Setup.clear_casecombo()
-
-            for case in cases:
-                sap.Results.Setup.select_case(casename=case)
-
-            for combo in combos:
-                sap.Results.Setup.select_combo(comboname=combo)
-
-            _current_units = sap.Model.units
-            sap.Model.set_units(value="N_mm_C")
+            if sap.Results.Setup.select(cases=cases, combos=combos) is None:
+                st.error("Could not select the load cases and combos for output")
+                return ""
 
             # Delete Existing Load Combinations
             anchor.Model.Loads.Combos.data["LoadCombinationEntity"] = None
 
-            for rxn in sap.Results.joint_reactions(
-                jointname=st.session_state["_hilti_values_extracted"]
-            ):
+            with sap.Model.units_scope("N_mm_C"):
+                reactions = sap.Results.joint_reactions(
+                    jointname=st.session_state["_hilti_values_extracted"]
+                )
+
+            for rxn in reactions:
                 anchor.Model.Loads.Combos.add(
                     Fx=-rxn[f"F{x_axis}"],
                     Fy=-rxn[f"F{y_axis}"],
@@ -120,7 +116,6 @@ def main():
                     LoadType="Seismic",
                     Comment=rxn["LoadCase"],
                 )
-            sap.Model.set_units(value=_current_units)
 
             anchor.Model.apply()
             _xml = anchor.xml_content()
@@ -0,0 +1,70 @@
+"""Benchmark the parsing of SapOAPI joint result arrays.
+
+Compares `parse_results` and the DataFrame built from it against the
+per-row dict loop used before, on synthetic time-history style results
+(one row per joint, case and step).
+
+Usage:
+    uv run python scripts/benchmark_results.py
+"""
+
+import time
+from collections.abc import Callable
+
+from ak_sap.Results.constants import JOINT_RESULT_FIELDS
+from ak_sap.Results.main import (
+    joint_displacements_parse,
+    joint_results_frame,
+    parse_results,
+)
+
+ROWS = (10_000, 100_000, 1_000_000)
+FIELDS = JOINT_RESULT_FIELDS["displacements"]
+
+
+def legacy_joint_displacements_parse(ret: list) -> list[dict]:
+    """Per-row implementation used before `parse_results`."""
+    names = ("ObjectName", "ElementName", "LoadCase", "StepType", "StepNum", *FIELDS)
+    return [
+        {name: ret[i + 1][idx] for i, name in enumerate(names)} for idx in range(ret[0])
+    ]
+
+
+def make_ret(rows: int) -> list:
+    """Builds the return value of `JointDispl` for a time-history case."""
+    joints = tuple(str(i % 1000) for i in range(rows))
+    steps = tuple(float(i // 1000) for i in range(rows))
+    values = tuple(i * 1e-6 for i in range(rows))
+    return [
+        rows,
+        joints,
+        joints,
+        ("TH",) * rows,
+        ("Step",) * rows,
+        steps,
+        *(values,) * len(FIELDS),
+        0,
+    ]
+
+
+def timeit(func: Callable, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'rows':>10} {'output':>18} {'time (s)':>10}")
+    for rows in ROWS:
+        ret = make_ret(rows)
+        for label, func, args in (
+            ("legacy list[dict]", legacy_joint_displacements_parse, (ret,)),
+            ("list[dict]", joint_displacements_parse, (ret,)),
+            ("structured array", parse_results, (ret, FIELDS)),
+            ("DataFrame", joint_results_frame, (ret, FIELDS)),
+        ):
+            print(f"{rows:>10,} {label:>18} {timeit(func, *args):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
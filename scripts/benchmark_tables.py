@@ -0,0 +1,99 @@
+"""Benchmark the conversion of database table data to and from SapOAPI arrays.
+
+Compares the reshape-based engine in `ak_sap.Database.tables` against the
+previous per-cell loops on synthetic joint-coordinate style tables, both for
+`GetTableForDisplayArray` output and for the `SetTableForEditingArray` input
+built by `flatten_dataframe`.
+
+Usage:
+    uv run python scripts/benchmark_tables.py
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pandas as pd
+
+from ak_sap.Database.tables import (
+    _array_to_list_of_dicts,
+    _array_to_pandas,
+    flatten_dataframe,
+)
+
+ROWS = (10_000, 100_000, 1_000_000)
+HEADERS = ("Joint", "CoordSys", "CoordType", "XorR", "Y", "Z", "SpecialJt", "GUID")
+
+
+def legacy_array_to_pandas(headers: tuple, array: tuple) -> pd.DataFrame:
+    """Per-cell implementation used before the reshape-based engine."""
+    num_fields = len(headers)
+    df_data: dict[str, list] = {header: [] for header in headers}
+    for array_idx, value in enumerate(array):
+        df_data[headers[array_idx % num_fields]].append(value)
+    return pd.DataFrame(df_data)
+
+
+def legacy_array_to_list_of_dicts(headers: tuple, array: tuple) -> list[dict[str, Any]]:
+    """Per-cell implementation used before the reshape-based engine."""
+    num_fields = len(headers)
+    list_of_dicts = []
+    for i in range(len(array) // num_fields):
+        list_of_dicts.append(
+            {headers[j]: array[i * num_fields + j] for j in range(num_fields)}
+        )
+    return list_of_dicts
+
+
+def legacy_flatten_dataframe(df: pd.DataFrame) -> tuple:
+    """Row-wise implementation used before the columnar flatten."""
+    df = df.fillna("")
+    df = df.astype(str)
+    flattened_list = []
+    for _, row in df.iterrows():
+        flattened_list.extend(row.values)
+    return tuple(value if value != "" else None for value in flattened_list)
+
+
+def make_array(rows: int) -> tuple:
+    """Builds a flat row-major tuple of strings, as returned by SapOAPI."""
+    data: list[str] = []
+    for i in range(rows):
+        data.extend(
+            (str(i), "GLOBAL", "Cartesian", f"{i * 0.5}", f"{i * 0.25}", "0", "No", "")
+        )
+    return tuple(data)
+
+
+def timeit(func: Callable, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    print(
+        f"{'rows':>10} {'output':>14} {'legacy (s)':>12} {'current (s)':>12} {'speedup':>9}"
+    )
+    for rows in ROWS:
+        array = make_array(rows)
+        for label, legacy, current in (
+            ("DataFrame", legacy_array_to_pandas, _array_to_pandas),
+            ("list[dict]", legacy_array_to_list_of_dicts, _array_to_list_of_dicts),
+        ):
+            t_legacy = timeit(legacy, HEADERS, array)
+            t_current = timeit(current, HEADERS, array)
+            print(
+                f"{rows:>10,} {label:>14} {t_legacy:>12.3f} {t_current:>12.3f} {t_legacy / t_current:>8.1f}x"
+            )
+
+        df = _array_to_pandas(HEADERS, array)
+        t_legacy = timeit(legacy_flatten_dataframe, df)
+        t_current = timeit(flatten_dataframe, df)
+        print(
+            f"{rows:>10,} {'flatten':>14} {t_legacy:>12.3f} {t_current:>12.3f} {t_legacy / t_current:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Benchmark the `array` and `csvfile` transports of `Table.get`.
+
+`record` attaches to a running SAP2000 session and, for each table, times
+`GetTableForDisplayArray` and `GetTableForDisplayCSVFile`. The raw array and
+the CSV file are saved alongside the timings. `replay` times the parsing
+side of both transports on a recording, without SAP2000, and reports the
+total (recorded COM time + parse time) per transport. `synthetic` writes a
+recording of generated joint-coordinate tables, with no COM timings, to try
+the parsers locally.
+
+Usage:
+    uv run python scripts/benchmark_transports.py record recording "Joint Coordinates" "Connectivity - Frame"
+    uv run python scripts/benchmark_transports.py synthetic recording
+    uv run python scripts/benchmark_transports.py replay recording
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+from ak_sap.Database.table_constants import CSV_TRANSPORT_MIN_ROWS
+from ak_sap.Database.tables import _TABLE_UNITS, _array_to_pandas, _csv_to_pandas
+
+INDEX = "recording.json"
+SYNTHETIC_ROWS = (10_000, 100_000, 1_000_000)
+SYNTHETIC_HEADERS = ("Joint", "CoordSys", "CoordType", "XorR", "Y", "Z", "SpecialJt")
+
+
+def record(folder: Path, TableKeys: list[str]) -> None:
+    """Times both transports against the attached model and saves their output."""
+    from ak_sap import Sap2000Wrapper
+
+    sap = Sap2000Wrapper(attach_to_exist=True)
+    DatabaseTables = sap.SapModel.DatabaseTables
+    index = {}
+    with sap.Model.units_scope(_TABLE_UNITS):
+        for i, TableKey in enumerate(TableKeys):
+            start = time.perf_counter()
+            _data = DatabaseTables.GetTableForDisplayArray(TableKey, "", "")
+            t_array = time.perf_counter() - start
+            assert _data[-1] == 0, f"GetTableForDisplayArray returned {_data[-1]}"
+
+            csv_file = f"{i:04d}.csv"
+            start = time.perf_counter()
+            ret = DatabaseTables.GetTableForDisplayCSVFile(
+                TableKey, "", "", 0, str((folder / csv_file).resolve())
+            )
+            t_csv = time.perf_counter() - start
+            assert ret[-1] == 0, f"GetTableForDisplayCSVFile returned {ret[-1]}"
+
+            index[TableKey] = _save(folder, i, _data[2], _data[4], csv_file)
+            index[TableKey].update(com_array_s=t_array, com_csvfile_s=t_csv)
+            print(f"Recorded {TableKey}: {index[TableKey]['rows']:,} rows")
+    (folder / INDEX).write_text(json.dumps(index, indent=2))
+
+
+def synthetic(folder: Path) -> None:
+    """Writes a recording of generated tables, for parse-only comparisons."""
+    index = {}
+    for i, rows in enumerate(SYNTHETIC_ROWS):
+        array: list[str] = []
+        for j in range(rows):
+            array.extend(
+                (str(j), "GLOBAL", "Cartesian", f"{j * 0.5}", f"{j * 0.25}", "0", "No")
+            )
+        csv_file = f"{i:04d}.csv"
+        _array_to_pandas(SYNTHETIC_HEADERS, tuple(array)).to_csv(
+            folder / csv_file, index=False
+        )
+        index[f"Synthetic {rows:,}"] = _save(
+            folder, i, SYNTHETIC_HEADERS, array, csv_file
+        )
+    (folder / INDEX).write_text(json.dumps(index, indent=2))
+
+
+def _save(folder: Path, i: int, headers, array, csv_file: str) -> dict:
+    array_file = f"{i:04d}.json"
+    (folder / array_file).write_text(
+        json.dumps({"headers": list(headers), "array": list(array)})
+    )
+    return {
+        "rows": len(array) // max(len(headers), 1),
+        "array": array_file,
+        "csvfile": csv_file,
+        "com_array_s": 0.0,
+        "com_csvfile_s": 0.0,
+    }
+
+
+def replay(folder: Path) -> None:
+    """Times the parse step of both transports on a recording."""
+    index = json.loads((folder / INDEX).read_text())
+    print(
+        f"{'table':>32} {'rows':>10} {'array (s)':>10} {'csvfile (s)':>12}"
+        f" {'speedup':>8} {'auto':>8}"
+    )
+    for TableKey, entry in index.items():
+        raw = json.loads((folder / entry["array"]).read_text())
+        headers, array = tuple(raw["headers"]), tuple(raw["array"])
+
+        start = time.perf_counter()
+        _array_to_pandas(headers, array)
+        t_array = entry["com_array_s"] + time.perf_counter() - start
+
+        start = time.perf_counter()
+        _csv_to_pandas(folder / entry["csvfile"])
+        t_csv = entry["com_csvfile_s"] + time.perf_counter() - start
+
+        auto = "csvfile" if entry["rows"] >= CSV_TRANSPORT_MIN_ROWS else "array"
+        print(
+            f"{TableKey[:32]:>32} {entry['rows']:>10,} {t_array:>10.3f} {t_csv:>12.3f}"
+            f" {t_array / t_csv:>7.1f}x {auto:>8}"
+        )
+
+
+def main():
+    command, folder, *TableKeys = sys.argv[1:]
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    if command == "record":
+        record(folder, TableKeys)
+    elif command == "synthetic":
+        synthetic(folder)
+    replay(folder)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 from typing import Literal
 
 from ak_sap.utils import MasterClass
-from ak_sap.utils.decorators import smooth_sap_do
+from ak_sap.utils.decorators import modifies_model, smooth_sap_do
 
 
 class Analyze(MasterClass):
@@ -23,6 +23,7 @@ class Analyze(MasterClass):
         super().__init__(mySapObject=mySapObject)
         self.__Analyze = mySapObject.SapModel.Analyze
 
+    @modifies_model
     @smooth_sap_do
     def create_model(self) -> bool:
         """Creates the analysis model.
@@ -34,6 +35,7 @@ class Analyze(MasterClass):
         """
         return self.__Analyze.CreateAnalyzeModel()
 
+    @modifies_model
     @smooth_sap_do
     def run(self):
         """Runs the analysis.
@@ -63,6 +65,7 @@ class Analyze(MasterClass):
         """
         return get_run_flag(ret=self.__Analyze.GetRunCaseFlag()), 0  # type: ignore
 
+    @modifies_model
     @smooth_sap_do
     def set_run_flag(self, case: str, status: bool):
         """Sets the run flag for load cases.
@@ -82,6 +85,7 @@ class Analyze(MasterClass):
         """
         return get_solver(ret=self.__Analyze.GetSolverOption_3()), 0  # type: ignore
 
+    @modifies_model
     @smooth_sap_do
     def set_solver(
         self,
@@ -4,4 +4,6 @@ This module provides an interface for accessing and manipulating various
 database tables associated with a SAP2000 model.
 """
 
+from .model_database import ModelDatabase as ModelDatabase
+from .table_snapshot import TableSnapshot as TableSnapshot
 from .tables import Table as Table
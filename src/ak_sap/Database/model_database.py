@@ -0,0 +1,277 @@
+import hashlib
+import sqlite3
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Self
+
+import pandas as pd
+
+from ak_sap.utils import log
+
+from .table_constants import SQLITE_INDEX_FIELDS
+from .table_structured_data import DatabaseTable, FieldData
+
+_TABLES = "_ak_sap_tables"
+"""Metadata table listing the exported database tables"""
+_FIELDS = "_ak_sap_fields"
+"""Metadata table holding the field data of the exported tables"""
+_INFO = "_ak_sap_info"
+"""Metadata table holding the model path and units of the export"""
+
+
+class ModelDatabase:
+    """Offline SQLite copy of the model's database tables.
+
+    Written by `Table.export_sqlite`. Every table is stored under its TableKey
+    with typed columns, and with indexes on object and case key fields
+    (see `SQLITE_INDEX_FIELDS`). A content hash is kept for each table, so a
+    re-export only rewrites the tables that changed. Queries return
+    DataFrames and need no SAP2000 session.
+
+    Usage:
+        with ModelDatabase("model.sqlite") as db:
+            db.query('SELECT * FROM "Frame Section Assignments" WHERE AnalSect = ?', ["W310X39"])
+
+    Attributes:
+        path (Path): The SQLite file.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Opens or creates a ModelDatabase.
+
+        Args:
+            path (str | Path): Path of the SQLite file.
+        """
+        self.path = Path(path)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.executescript(
+            f"""
+            CREATE TABLE IF NOT EXISTS {_TABLES} (
+                TableKey TEXT PRIMARY KEY, TableName TEXT, ImportType TEXT,
+                Rows INTEGER, Hash TEXT, Updated TEXT
+            );
+            CREATE TABLE IF NOT EXISTS {_FIELDS} (
+                TableKey TEXT, FieldKey TEXT, FieldName TEXT, Description TEXT,
+                UnitsStr TEXT, isImportable INTEGER, PRIMARY KEY (TableKey, FieldKey)
+            );
+            CREATE TABLE IF NOT EXISTS {_INFO} (Key TEXT PRIMARY KEY, Value TEXT);
+            """
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"Instance of Database `ModelDatabase` of {len(self)} tables at {self.path}"
+        )
+
+    def __repr__(self) -> str:
+        return f"ModelDatabase(path={str(self.path)!r})"
+
+    def __len__(self) -> int:
+        return self.connection.execute(f"SELECT COUNT(*) FROM {_TABLES}").fetchone()[0]
+
+    def __contains__(self, TableKey: str) -> bool:
+        return self._hash(TableKey) is not None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the SQLite connection."""
+        self.connection.close()
+
+    @property
+    def info(self) -> dict[str, str]:
+        """Returns the model path, units and time of the last export."""
+        return dict(
+            self.connection.execute(f"SELECT Key, Value FROM {_INFO}").fetchall()
+        )
+
+    @property
+    def units(self) -> str:
+        """Returns the units the table data is stored in."""
+        return self.info.get("units", "")
+
+    def list_all(self) -> list[DatabaseTable]:
+        """Lists all of the tables stored in the database.
+
+        Returns:
+            list[DatabaseTable]: A list of the stored database tables.
+        """
+        rows = self.connection.execute(
+            f"SELECT TableKey, TableName, ImportType, Rows FROM {_TABLES} ORDER BY TableKey"
+        ).fetchall()
+        return [
+            DatabaseTable(
+                TableKey=TableKey,
+                TableName=TableName,
+                ImportType=ImportType,
+                IsEmpty=num_rows == 0,
+            )
+            for TableKey, TableName, ImportType, num_rows in rows
+        ]
+
+    def get_table_fields(self, TableKey: str) -> list[FieldData]:
+        """Retrieves the fields of a stored table.
+
+        Args:
+            TableKey (str): The key identifier for the table.
+
+        Returns:
+            list[FieldData]: A list of field data in the specified table.
+        """
+        rows = self.connection.execute(
+            f"SELECT FieldKey, FieldName, Description, UnitsStr, isImportable"
+            f" FROM {_FIELDS} WHERE TableKey = ? ORDER BY rowid",
+            (TableKey,),
+        ).fetchall()
+        return [
+            FieldData(
+                FieldKey=FieldKey,
+                FieldName=FieldName,
+                Description=Description,
+                UnitsStr=UnitsStr,
+                isImportable=bool(isImportable),
+            )
+            for FieldKey, FieldName, Description, UnitsStr, isImportable in rows
+        ]
+
+    def query(self, sql: str, params: list | dict | None = None) -> pd.DataFrame:
+        """Runs a SQL query against the stored tables.
+
+        Table names are the TableKeys and need double quotes,
+        e.g. `SELECT * FROM "Joint Coordinates"`.
+
+        Args:
+            sql (str): The SQL query.
+            params (list | dict | None): Values bound to `?` or `:name` placeholders.
+
+        Returns:
+            pd.DataFrame: The query result.
+        """
+        log.debug(f"Querying {self.path.name}: {sql}")
+        return pd.read_sql_query(sql, self.connection, params=params)
+
+    def get(
+        self,
+        TableKey: str,
+        fields: list[str] | None = None,
+        where: str = "",
+        params: list | dict | None = None,
+    ) -> pd.DataFrame:
+        """Reads a stored table.
+
+        Args:
+            TableKey (str): The key identifier for the table.
+            fields (list[str] | None): Field keys to read. All fields if None.
+            where (str): Optional SQL condition, e.g. `"Joint = ?"`.
+            params (list | dict | None): Values bound to the placeholders in `where`.
+
+        Returns:
+            pd.DataFrame: Stored data of the table.
+        """
+        assert TableKey in self, f"`{TableKey}` is not in the database at {self.path}"
+        columns = ", ".join(_quote(field) for field in fields) if fields else "*"
+        sql = f"SELECT {columns} FROM {_quote(TableKey)}"
+        if where:
+            sql += f" WHERE {where}"
+        return self.query(sql, params=params)
+
+    def is_current(self, TableKey: str, digest: str) -> bool:
+        """Returns True if the stored table has the given content hash."""
+        return self._hash(TableKey) == digest
+
+    def write(
+        self,
+        table: DatabaseTable,
+        data: pd.DataFrame,
+        fields: list[FieldData],
+        digest: str,
+    ) -> None:
+        """Replaces a stored table and indexes its key fields.
+
+        Args:
+            table (DatabaseTable): Table being written.
+            data (pd.DataFrame): Data of the table.
+            fields (list[FieldData]): Field data of the table.
+            digest (str): Content hash of the table, see `table_digest`.
+        """
+        with self.connection:
+            self._drop(table.TableKey)
+            data.to_sql(table.TableKey, self.connection, index=False)
+            for column in data.columns:
+                if column in SQLITE_INDEX_FIELDS:
+                    self.connection.execute(
+                        f"CREATE INDEX {_quote(f'ix_{table.TableKey}_{column}')}"
+                        f" ON {_quote(table.TableKey)} ({_quote(column)})"
+                    )
+            self.connection.execute(
+                f"INSERT INTO {_TABLES} VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    table.TableKey,
+                    table.TableName,
+                    table.ImportType,
+                    len(data),
+                    digest,
+                    datetime.now().isoformat(timespec="seconds"),
+                ),
+            )
+            self.connection.executemany(
+                f"INSERT INTO {_FIELDS} VALUES (?, ?, ?, ?, ?, ?)",
+                [(table.TableKey, *asdict(field).values()) for field in fields],
+            )
+
+    def prune(self, keep: set[str]) -> list[str]:
+        """Drops stored tables that are not in `keep`.
+
+        Args:
+            keep (set[str]): TableKeys to keep.
+
+        Returns:
+            list[str]: The TableKeys that were dropped.
+        """
+        dropped = [t.TableKey for t in self.list_all() if t.TableKey not in keep]
+        with self.connection:
+            for TableKey in dropped:
+                self._drop(TableKey)
+        return dropped
+
+    def set_info(self, **info: Any) -> None:
+        """Stores export details, such as the model path and units."""
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO {_INFO} VALUES (?, ?)",
+                [(key, str(value)) for key, value in info.items()],
+            )
+
+    def _hash(self, TableKey: str) -> str | None:
+        row = self.connection.execute(
+            f"SELECT Hash FROM {_TABLES} WHERE TableKey = ?", (TableKey,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _drop(self, TableKey: str) -> None:
+        self.connection.execute(f"DROP TABLE IF EXISTS {_quote(TableKey)}")
+        self.connection.execute(
+            f"DELETE FROM {_TABLES} WHERE TableKey = ?", (TableKey,)
+        )
+        self.connection.execute(
+            f"DELETE FROM {_FIELDS} WHERE TableKey = ?", (TableKey,)
+        )
+
+
+def table_digest(headers: tuple, array: tuple) -> str:
+    """Returns a content hash of a raw table, as returned by `GetTableForDisplayArray`."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\x1f".join(map(str, headers)).encode())
+    digest.update(b"\x1e")
+    digest.update("\x1f".join(map(str, array)).encode())
+    return digest.hexdigest()
+
+
+def _quote(identifier: str) -> str:
+    """Quotes a table or column name for SQLite."""
+    return '"' + identifier.replace('"', '""') + '"'
@@ -0,0 +1,91 @@
+from typing import TYPE_CHECKING, Self
+
+import pandas as pd
+
+from ak_sap.utils import log
+
+from .table_diff import TableDiff
+from .table_structured_data import ApplyResult
+
+if TYPE_CHECKING:
+    from .tables import Table
+
+
+class TableBatch:
+    """Transaction of edits to several database tables, applied once.
+
+    Created through `Table.batch()`. Every `update` stages a table with
+    `SetTableForEditingArray`; leaving the `with` block imports all of them
+    with a single `ApplyEditedTables` call. If the block raises, or the
+    import reports errors, the staged tables are discarded.
+
+    Attributes:
+        staged (dict[str, TableDiff | None]): Staged TableKeys and, for diff updates, their changes.
+        result (ApplyResult | None): Outcome of the import, once the block exits.
+    """
+
+    def __init__(self, table: "Table") -> None:
+        """Initializes the TableBatch.
+
+        Args:
+            table (Table): The `Table` module the edits are made through.
+        """
+        self._table = table
+        self._edited: dict[str, pd.DataFrame] = {}
+        self.staged: dict[str, TableDiff | None] = {}
+        self.result: ApplyResult | None = None
+
+    def __str__(self) -> str:
+        return (
+            f"Instance of Database `TableBatch` with {len(self.staged)} staged tables"
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is not None:
+            log.error(f"Discarding {len(self.staged)} staged tables after: {exc!r}")
+            self._table.discard()
+            return False
+        if not self.staged:
+            return False
+
+        self.result = self._table.apply()
+        if self.result is None or not self.result.ok:
+            log.error(
+                f"Import of {list(self.staged)} failed. Discarding staged tables."
+            )
+            self._table.discard()
+            return False
+        for TableKey, data in self._edited.items():
+            self._table._track(TableKey=TableKey, data=data)
+        return False
+
+    def update(
+        self,
+        TableKey: str,
+        data: pd.DataFrame,
+        diff: bool = False,
+        keys: list[str] | None = None,
+    ) -> TableDiff | None:
+        """Stages new values for a database table.
+
+        Args:
+            TableKey (str): The key identifier for the table.
+            data (pd.DataFrame): The DataFrame containing data to update.
+            diff (bool): If True, only stage rows changed since the last tracked `get`.
+            keys (list[str] | None): Columns that identify a row when diffing.
+
+        Returns:
+            TableDiff | None: The staged changes, if `diff` is True.
+
+        Raises:
+            AssertionError: If the table could not be staged. The batch is discarded.
+        """
+        log.info(f"Staging the values for TableKey: {TableKey}")
+        changes = self._table._stage(TableKey=TableKey, data=data, diff=diff, keys=keys)
+        if changes is None or not changes.is_empty:
+            self.staged[TableKey] = changes
+            self._edited[TableKey] = data
+        return changes
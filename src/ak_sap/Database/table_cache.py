@@ -0,0 +1,131 @@
+import sys
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+from ak_sap.utils import log
+from ak_sap.utils.revision import revisions
+
+
+@dataclass
+class CacheInfo:
+    """Represents the usage statistics of a `TableCache`.
+
+    Attributes:
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that required a call to SAP2000.
+        entries (int): Number of tables currently held.
+        size_bytes (int): Approximate memory held by the cached tables.
+        max_bytes (int): Memory cap after which least recently used tables are evicted.
+    """
+
+    hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+
+class TableCache:
+    """In-process LRU cache of raw database table arrays.
+
+    Entries hold the field keys and flat data tuple returned by
+    `GetTableForDisplayArray`. Both are immutable, so hits are shared safely
+    between callers. The cache clears itself whenever the global
+    `model_revision` moves, i.e. after any wrapper call that modifies the model,
+    or the `output_revision` moves, since result tables follow the output selection.
+
+    Attributes:
+        max_bytes (int): Memory cap for the cached tables.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that were not cached.
+    """
+
+    def __init__(self, max_bytes: int = 512 * 2**20) -> None:
+        """Initializes the TableCache.
+
+        Args:
+            max_bytes (int): Memory cap in bytes. Defaults to 512 MiB.
+        """
+        self.max_bytes: int = max_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[Hashable, tuple[tuple, tuple, int]] = OrderedDict()
+        self._size: int = 0
+        self._revision: tuple[int, int] = revisions()
+
+    def __len__(self) -> int:
+        self._check_revision()
+        return len(self._entries)
+
+    def __str__(self) -> str:
+        return f"Instance of Database `TableCache`. {self.info}"
+
+    def _check_revision(self) -> None:
+        if self._revision != revisions():
+            log.debug(
+                "Model or output modified since tables were cached. Clearing cache."
+            )
+            self.clear()
+
+    def get(self, key: Hashable) -> tuple[tuple, tuple] | None:
+        """Retrieves a cached table.
+
+        Args:
+            key (Hashable): Cache key of the table.
+
+        Returns:
+            tuple[tuple, tuple] | None: The field keys and flat data, or None if not cached.
+        """
+        self._check_revision()
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0], entry[1]
+
+    def put(self, key: Hashable, headers: tuple, array: tuple) -> None:
+        """Stores a table, evicting the least recently used tables beyond `max_bytes`.
+
+        Args:
+            key (Hashable): Cache key of the table.
+            headers (tuple): Field keys of the table.
+            array (tuple): Flat, row-major table data.
+        """
+        self._check_revision()
+        size = _sizeof(headers) + _sizeof(array)
+        if size > self.max_bytes:
+            log.debug(f"Table of {size} bytes exceeds the cache cap. Not cached.")
+            return
+        if key in self._entries:
+            self._size -= self._entries.pop(key)[2]
+        self._entries[key] = (headers, array, size)
+        self._size += size
+        while self._size > self.max_bytes:
+            _, (*_, evicted_size) = self._entries.popitem(last=False)
+            self._size -= evicted_size
+
+    def clear(self) -> None:
+        """Drops every cached table. Hit and miss counters are kept."""
+        self._entries.clear()
+        self._size = 0
+        self._revision = revisions()
+
+    @property
+    def info(self) -> CacheInfo:
+        """Returns the usage statistics of the cache."""
+        self._check_revision()
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            entries=len(self._entries),
+            size_bytes=self._size,
+            max_bytes=self.max_bytes,
+        )
+
+
+def _sizeof(values: tuple) -> int:
+    """Approximate memory held by a tuple of scalar values."""
+    return sys.getsizeof(values) + sum(map(sys.getsizeof, values))
@@ -0,0 +1,212 @@
+import difflib
+from typing import TYPE_CHECKING
+
+from ak_sap.utils import log
+from ak_sap.utils.revision import model_revision
+
+from .table_structured_data import DatabaseTable, FieldData
+
+if TYPE_CHECKING:
+    from .tables import Table
+
+
+class TableCatalog:
+    """Session index of the database tables and their fields.
+
+    The table list is retrieved from SAP2000 on first use and the fields of
+    each table the first time they are requested. Both are kept until the
+    global `model_revision` moves, i.e. after a wrapper call that modifies
+    the model, so repeated lookups (e.g. on every GUI rerun) make no COM calls.
+    Changing the output selection does not modify the model, so the catalog
+    is kept across `Results.Setup` selection calls.
+
+    Tables are indexed by TableKey and TableName, fields by FieldKey and
+    FieldName.
+    """
+
+    def __init__(self, table: "Table") -> None:
+        """Initializes the TableCatalog.
+
+        Args:
+            table (Table): The `Table` module the catalog is built from.
+        """
+        self._table = table
+        self._tables: dict[str, DatabaseTable] | None = None
+        self._available: set[str] | None = None
+        self._names: dict[str, str] = {}
+        self._fields: dict[str, dict[str, FieldData]] = {}
+        self._revision: int = model_revision.value
+
+    def __str__(self) -> str:
+        return f"Instance of Database `TableCatalog` of {len(self)} tables"
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def __contains__(self, TableKey: str) -> bool:
+        return TableKey in self._index()
+
+    def _check_revision(self) -> None:
+        if self._revision != model_revision.value:
+            log.debug(
+                "Model modified since tables were indexed. Clearing table catalog."
+            )
+            self.clear()
+
+    def _index(self) -> dict[str, DatabaseTable]:
+        self._check_revision()
+        if self._tables is None:
+            self._tables = {table.TableKey: table for table in self._table.list_all()}
+            self._names = {
+                table.TableName: table.TableKey for table in self._tables.values()
+            }
+        return self._tables
+
+    def clear(self) -> None:
+        """Drops the index. It is rebuilt on the next lookup."""
+        self._tables = None
+        self._available = None
+        self._names = {}
+        self._fields = {}
+        self._revision = model_revision.value
+
+    def list_all(self) -> list[DatabaseTable]:
+        """Lists all of the tables along with their import type and emptiness status.
+
+        Returns:
+            list[DatabaseTable]: A list of all database tables in the model.
+        """
+        return list(self._index().values())
+
+    def list_available(self) -> list[DatabaseTable]:
+        """Lists all available tables along with their import type.
+
+        Returns:
+            list[DatabaseTable]: A list of available database tables in the model.
+        """
+        self._check_revision()
+        if self._available is None:
+            self._available = {table.TableKey for table in self._table.list_available()}
+        return [table for key, table in self._index().items() if key in self._available]
+
+    def resolve(self, name: str) -> str | None:
+        """Returns the TableKey of a table, looked up by TableKey or TableName.
+
+        Args:
+            name (str): TableKey or TableName of the table.
+
+        Returns:
+            str | None: The TableKey, or None if no table matches.
+        """
+        tables = self._index()
+        if name in tables:
+            return name
+        return self._names.get(name)
+
+    def fields(self, TableKey: str) -> list[FieldData]:
+        """Retrieves the fields of a table, from SAP2000 only on first use.
+
+        Args:
+            TableKey (str): The key identifier for the table.
+
+        Returns:
+            list[FieldData]: A list of field data in the specified table.
+        """
+        self._check_revision()
+        if TableKey not in self._fields:
+            if not (fields := self._table.get_table_fields(TableKey)):
+                return fields
+            self._fields[TableKey] = {field.FieldKey: field for field in fields}
+        return list(self._fields[TableKey].values())
+
+    def field(self, TableKey: str, name: str) -> FieldData | None:
+        """Looks up a single field of a table by FieldKey or FieldName.
+
+        Args:
+            TableKey (str): The key identifier for the table.
+            name (str): FieldKey or FieldName of the field.
+
+        Returns:
+            FieldData | None: The field, or None if the table has no such field.
+        """
+        fields = self.fields(TableKey)
+        by_key = self._fields.get(TableKey, {})
+        if name in by_key:
+            return by_key[name]
+        return next((field for field in fields if field.FieldName == name), None)
+
+    def find(
+        self, query: str, limit: int = 10, cutoff: float = 0.6
+    ) -> list[DatabaseTable]:
+        """Searches tables by TableKey and TableName.
+
+        Tables starting with the query are listed first, then tables containing
+        it. If neither matches, close matches are returned instead, to allow for
+        misspelt queries. Matching is case-insensitive.
+
+        Args:
+            query (str): Text to search for.
+            limit (int): Maximum number of tables returned.
+            cutoff (float): Similarity ratio in [0, 1] required for a close match.
+
+        Returns:
+            list[DatabaseTable]: The matching tables, best match first.
+        """
+        tables = self._index()
+        return [tables[key] for key in _search(query, self._labels(), limit, cutoff)]
+
+    def find_fields(
+        self, TableKey: str, query: str, limit: int = 10, cutoff: float = 0.6
+    ) -> list[FieldData]:
+        """Searches the fields of a table by FieldKey and FieldName.
+
+        Args:
+            TableKey (str): The key identifier for the table.
+            query (str): Text to search for.
+            limit (int): Maximum number of fields returned.
+            cutoff (float): Similarity ratio in [0, 1] required for a close match.
+
+        Returns:
+            list[FieldData]: The matching fields, best match first.
+        """
+        fields = {field.FieldKey: field for field in self.fields(TableKey)}
+        labels = {
+            **{key: key for key in fields},
+            **{field.FieldName: key for key, field in fields.items()},
+        }
+        return [fields[key] for key in _search(query, labels, limit, cutoff)]
+
+    def _labels(self) -> dict[str, str]:
+        """Maps every TableKey and TableName to its TableKey."""
+        return {**{key: key for key in self._index()}, **self._names}
+
+
+def _search(query: str, labels: dict[str, str], limit: int, cutoff: float) -> list[str]:
+    """Ranks keys by prefix and substring matches of their labels, else fuzzy matches.
+
+    Args:
+        query (str): Text to search for.
+        labels (dict[str, str]): Searchable labels mapped to the key they identify.
+        limit (int): Maximum number of keys returned.
+        cutoff (float): Similarity ratio required for a fuzzy match.
+
+    Returns:
+        list[str]: Unique matching keys, best match first.
+    """
+    query = query.strip().lower()
+    lowered: dict[str, list[str]] = {}
+    for label, key in labels.items():
+        lowered.setdefault(label.lower(), []).append(key)
+
+    prefix = [label for label in lowered if label.startswith(query)]
+    contains = [label for label in lowered if query in label and label not in prefix]
+    ranked = sorted(prefix) + sorted(contains)
+    if not ranked:
+        ranked = difflib.get_close_matches(query, list(lowered), n=limit, cutoff=cutoff)
+
+    matches: list[str] = []
+    for label in ranked:
+        for key in lowered[label]:
+            if key not in matches:
+                matches.append(key)
+    return matches[:limit]
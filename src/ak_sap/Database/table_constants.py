@@ -1,3 +1,4 @@
+import re
 from typing import Literal
 
 ImportType_Literals = Literal[
@@ -6,3 +7,45 @@ ImportType_Literals = Literal[
     "importable and interactive importable when he model is unlocked",
     "importable and interactive importable when he model is unlocked and locked",
 ]
+
+LABEL_FIELD_PATTERN = re.compile(
+    r"^(Joint|Point|Frame|Area|Link|Cable|Tendon|Solid|Elem|Obj|Name|Label|Story|Group)"
+    r"|(Name|Jt|JtI|JtJ)$"
+    r"|^(OutputCase|LoadCase|LoadPat|AnalSect|DesignSect|Material)$"
+)
+"""Unitless field keys holding object, case or section names, which stay labels even when they look numeric"""
+
+CATEGORY_MAX_RATIO = 0.5
+"""Text fields with at most this ratio of unique values to rows are stored as `category`"""
+
+TableTransport_Literals = Literal["array", "csvfile", "auto"]
+"""How table data is transferred from SAP2000: COM arrays or an intermediate CSV file"""
+
+CSV_TRANSPORT_MIN_ROWS = 100_000
+"""Row count from which the `auto` transport reads a table through a CSV file.
+
+Parsing the CSV file locally is about 2x slower than reshaping an array that
+is already marshalled, but the array transport first converts every cell
+from a COM VARIANT in Python, which the CSV file skips. The threshold is
+meant to be tuned with `scripts/benchmark_transports.py record` against a
+live model. Row counts are only known once a table has been read, so the
+first read of a table and group always uses the array transport."""
+
+CSV_HEADER_SEARCH_ROWS = 5
+"""Leading rows of a table CSV file searched for the field row"""
+
+UNITLESS_LABELS = ("Text", "Unitless", "Yes/No")
+"""Unit labels that a units row may hold for fields without units"""
+
+SQLITE_INDEX_FIELDS = (
+    "Joint",
+    "Frame",
+    "Area",
+    "Link",
+    "Section",
+    "AnalSect",
+    "LoadCase",
+    "LoadPat",
+    "OutputCase",
+)
+"""Field keys indexed when tables are exported to a `ModelDatabase`"""
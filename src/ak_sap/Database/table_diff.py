@@ -0,0 +1,103 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class TableDiff:
+    """Represents the row-level changes between two versions of a database table.
+
+    Attributes:
+        keys (list[str]): Key columns used to match rows.
+        inserted (np.ndarray): Boolean mask over the edited rows that are new.
+        changed (np.ndarray): Boolean mask over the edited rows that differ from the baseline.
+        removed (pd.DataFrame): Key values of baseline rows missing from the edited table.
+        changed_fields (dict[str, int]): Number of changed values in each field.
+    """
+
+    keys: list[str]
+    inserted: np.ndarray
+    changed: np.ndarray
+    removed: pd.DataFrame
+    changed_fields: dict[str, int] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        fields = ", ".join(f"{k}: {v}" for k, v in self.changed_fields.items())
+        return (
+            f"{self.inserted.sum()} inserted, {self.changed.sum()} changed"
+            f"{f' ({fields})' if fields else ''}, {len(self.removed)} removed"
+            f" (not deleted), {self.unchanged} unchanged rows. Keys: {self.keys}"
+        )
+
+    @property
+    def unchanged(self) -> int:
+        """Returns the number of edited rows identical to the baseline."""
+        return int((~(self.inserted | self.changed)).sum())
+
+    @property
+    def is_empty(self) -> bool:
+        """Returns True if there are no inserted or changed rows to push."""
+        return not (self.inserted.any() or self.changed.any())
+
+    def rows(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Returns the inserted and changed rows of the edited table, in order."""
+        return data[self.inserted | self.changed]
+
+
+def diff_tables(old: pd.DataFrame, new: pd.DataFrame, keys: list[str]) -> TableDiff:
+    """Compares an edited table against its baseline by key columns.
+
+    Values are compared as the text sent to SapOAPI, so a column read as text
+    and edited as numbers only counts as changed if its text differs.
+
+    Args:
+        old (pd.DataFrame): Baseline table, as returned by `Table.get`.
+        new (pd.DataFrame): Edited table.
+        keys (list[str]): Columns that identify a row.
+
+    Returns:
+        TableDiff: Row-level changes from `old` to `new`.
+    """
+    missing = [k for k in keys if k not in old.columns or k not in new.columns]
+    assert not missing, f"Key columns {missing} not found in both tables"
+    old_text, new_text = _as_text(old), _as_text(new)
+    assert not old_text.duplicated(subset=keys).any(), (
+        f"Key columns {keys} do not identify baseline rows uniquely"
+    )
+
+    old_index = pd.MultiIndex.from_frame(old_text[keys])
+    new_index = pd.MultiIndex.from_frame(new_text[keys])
+    position = old_index.get_indexer(new_index)
+    inserted = position == -1
+
+    common = [c for c in new.columns if c in old.columns and c not in keys]
+    added = [c for c in new.columns if c not in old.columns]
+    differs = (
+        old_text[common].to_numpy()[position[~inserted]]
+        != new_text[common].to_numpy()[~inserted]
+    )
+    changed = np.zeros(len(new), dtype=bool)
+    changed[~inserted] = differs.any(axis=1) | bool(added)
+
+    changed_fields = {
+        column: int(count)
+        for column, count in zip(common, differs.sum(axis=0))
+        if count
+    }
+    changed_fields.update({column: int((~inserted).sum()) for column in added})
+    return TableDiff(
+        keys=list(keys),
+        inserted=inserted,
+        changed=changed,
+        removed=old_text.loc[~old_index.isin(new_index), keys].reset_index(drop=True),
+        changed_fields=changed_fields,
+    )
+
+
+def _as_text(df: pd.DataFrame) -> pd.DataFrame:
+    """Stringifies a table the way `flatten_dataframe` does, with nulls as ''."""
+    values = df.to_numpy(dtype=object)
+    text = values.astype(str).astype(object)
+    text[pd.isna(values)] = ""
+    return pd.DataFrame(text, columns=df.columns)
@@ -0,0 +1,152 @@
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from ak_sap.utils import log
+from ak_sap.utils.revision import revisions
+
+from .table_structured_data import FieldData
+
+if TYPE_CHECKING:
+    from .tables import Table
+
+
+class LazyTable:
+    """Proxy of a database table that retrieves columns on first access.
+
+    Created through `Table.lazy()`. Field data is retrieved up front. Column
+    data is only requested from SAP2000 when a column is first accessed.
+    Columns that are accessed together, or queued with `prefetch`, are
+    retrieved with a single projected `GetTableForDisplayArray` call.
+    Retrieved columns are memoized until the model or the output selection
+    is modified.
+
+    Usage:
+        sections = sap.Table.lazy("Frame Section Properties 01 - General")
+        sections[["SectionName", "Area", "I33"]]  # One call for three columns
+        sections["Area"]  # Served from memory
+
+    Attributes:
+        TableKey (str): The key identifier for the table.
+        group (str): Name of the group the rows are limited to. All objects if blank.
+        typed (bool): If True, columns are converted using the table schema.
+        fields (list[FieldData]): Field data of the table.
+    """
+
+    def __init__(
+        self, table: "Table", TableKey: str, group: str = "", typed: bool = False
+    ) -> None:
+        """Initializes the LazyTable.
+
+        Args:
+            table (Table): The `Table` module the columns are retrieved through.
+            TableKey (str): The key identifier for the table.
+            group (str): Name of an existing group to limit the rows to. All objects if blank.
+            typed (bool): If True, converts columns using the table schema.
+        """
+        self._table = table
+        self.TableKey = TableKey
+        self.group = group
+        self.typed = typed
+        self.fields: list[FieldData] = table._schema(TableKey)
+        self._columns: dict[str, pd.Series] = {}
+        self._pending: list[str] = []
+        self._revision: tuple[int, int] = revisions()
+
+    def __str__(self) -> str:
+        return (
+            f"Instance of Database `LazyTable` for {self.TableKey}. "
+            f"{len(self._columns)} of {len(self.fields)} fields retrieved"
+        )
+
+    def __repr__(self) -> str:
+        return f"LazyTable(TableKey={self.TableKey!r}, group={self.group!r})"
+
+    def __contains__(self, FieldKey: str) -> bool:
+        return FieldKey in self.columns
+
+    def __len__(self) -> int:
+        if not self.fields:
+            return 0
+        if not self._loaded():
+            self._load([self.columns[0]])
+        return len(next(iter(self._columns.values())))
+
+    def __getitem__(self, key: str | list[str]) -> pd.Series | pd.DataFrame:
+        if isinstance(key, str):
+            self._load([key])
+            return self._columns[key]
+        self._load(list(key))
+        return pd.DataFrame({FieldKey: self._columns[FieldKey] for FieldKey in key})
+
+    @property
+    def columns(self) -> list[str]:
+        """Returns the field keys of the table."""
+        return [field.FieldKey for field in self.fields]
+
+    @property
+    def loaded(self) -> list[str]:
+        """Returns the field keys of the columns retrieved so far."""
+        return list(self._loaded())
+
+    def prefetch(self, fields: Iterable[str]) -> "LazyTable":
+        """Queues columns to be retrieved along with the next accessed column.
+
+        Args:
+            fields (Iterable[str]): Field keys to queue.
+
+        Returns:
+            LazyTable: The same proxy, for chaining.
+        """
+        for FieldKey in fields:
+            self._check_field(FieldKey)
+            if FieldKey not in self._pending:
+                self._pending.append(FieldKey)
+        return self
+
+    def to_frame(self, fields: list[str] | None = None) -> pd.DataFrame:
+        """Returns the table as a DataFrame.
+
+        Args:
+            fields (list[str] | None): Field keys to include. All fields if None.
+
+        Returns:
+            pd.DataFrame: The requested columns, in the requested order.
+        """
+        return self[fields if fields is not None else self.columns]
+
+    def _loaded(self) -> dict[str, pd.Series]:
+        if self._revision != revisions():
+            log.debug(f"Model or output modified since {self.TableKey} was read.")
+            self._columns.clear()
+            self._revision = revisions()
+        return self._columns
+
+    def _check_field(self, FieldKey: str) -> None:
+        if FieldKey not in self:
+            raise KeyError(
+                f"`{FieldKey}` not found in `{self.TableKey}`. Available fields: {self.columns}"
+            )
+
+    def _load(self, fields: list[str]) -> None:
+        """Retrieves the requested and queued columns that are not loaded yet."""
+        for FieldKey in fields:
+            self._check_field(FieldKey)
+        loaded = self._loaded()
+        missing = [
+            FieldKey
+            for FieldKey in dict.fromkeys([*fields, *self._pending])
+            if FieldKey not in loaded
+        ]
+        self._pending.clear()
+        if not missing:
+            return
+        log.debug(f"Retrieving {missing} from TableKey: {self.TableKey}")
+        df = self._table.get(
+            TableKey=self.TableKey, fields=missing, group=self.group, typed=self.typed
+        )
+        assert isinstance(df, pd.DataFrame) and not (
+            df.empty and len(df.columns) == 0
+        ), f"Could not retrieve {missing} from `{self.TableKey}`"
+        loaded.update({FieldKey: df[FieldKey] for FieldKey in missing})
@@ -0,0 +1,198 @@
+import json
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from ak_sap.utils import log
+from ak_sap.utils.files import slugify
+
+from .table_structured_data import DatabaseTable, FieldData
+
+MANIFEST = "manifest.json"
+"""Name of the index file written at the root of a snapshot directory"""
+
+
+def _feather():
+    """Returns the `pyarrow.feather` module, which snapshots are stored with."""
+    try:
+        from pyarrow import feather
+    except ImportError as e:
+        raise ImportError(
+            "Table snapshots require `pyarrow`. Install it with `uv sync --extra arrow`."
+        ) from e
+    return feather
+
+
+class SnapshotWriter:
+    """Writes database tables into a columnar snapshot directory.
+
+    Each table is stored as an uncompressed Feather (Arrow IPC) file, so it
+    can be memory-mapped on read. `manifest.json` indexes the tables along
+    with their field data.
+    """
+
+    def __init__(self, path: str | Path, model: str = "", units: str = "") -> None:
+        """Initializes the SnapshotWriter.
+
+        Args:
+            path (str | Path): Directory to write the snapshot into. Created if missing.
+            model (str): Path of the model the tables were extracted from.
+            units (str): Units the table data is stored in.
+        """
+        self._feather = _feather()
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.manifest: dict[str, Any] = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "model": model,
+            "units": units,
+            "tables": {},
+        }
+
+    def add(self, table: DatabaseTable, data: pd.DataFrame, fields: list[FieldData]):
+        """Writes a single table to the snapshot.
+
+        Args:
+            table (DatabaseTable): Table being written.
+            data (pd.DataFrame): Data of the table.
+            fields (list[FieldData]): Field data of the table.
+        """
+        previous = self.manifest["tables"].get(table.TableKey)
+        filename = (
+            previous["file"]
+            if previous is not None
+            else f"{len(self.manifest['tables']):04d}-{slugify(table.TableKey)}.feather"
+        )
+        self._feather.write_feather(
+            data.reset_index(drop=True),
+            self.path / filename,
+            compression="uncompressed",
+        )
+        self.manifest["tables"][table.TableKey] = {
+            "TableName": table.TableName,
+            "ImportType": table.ImportType,
+            "file": filename,
+            "rows": len(data),
+            "fields": [asdict(field) for field in fields],
+        }
+
+    def close(self) -> Path:
+        """Writes the manifest and removes table files left over from earlier snapshots.
+
+        Returns:
+            Path: The path of the snapshot directory.
+        """
+        with open(self.path / MANIFEST, "w") as f:
+            json.dump(self.manifest, f, indent=2)
+        written = {entry["file"] for entry in self.manifest["tables"].values()}
+        for stale in self.path.glob("[0-9][0-9][0-9][0-9]-*.feather"):
+            if stale.name in written:
+                continue
+            try:
+                stale.unlink()
+            except OSError as e:
+                log.warning(f"Could not remove stale snapshot file {stale}\n{e}")
+        log.info(
+            f"Snapshot of {len(self.manifest['tables'])} tables saved to {self.path}"
+        )
+        return self.path
+
+
+class TableSnapshot:
+    """Offline reader for a snapshot written by `Table.snapshot`.
+
+    Exposes the same lookups as the `Table` module, without a SAP2000
+    session. Table files are memory-mapped, so only the columns that are
+    accessed are read from disk.
+
+    Attributes:
+        path (Path): The snapshot directory.
+        manifest (dict): The snapshot index.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initializes the TableSnapshot.
+
+        Args:
+            path (str | Path): Directory of a snapshot written by `Table.snapshot`.
+        """
+        self._feather = _feather()
+        self.path = Path(path)
+        with open(self.path / MANIFEST) as f:
+            self.manifest: dict[str, Any] = json.load(f)
+
+    def __str__(self) -> str:
+        return (
+            f"Instance of Database `TableSnapshot` of {len(self)} tables at {self.path}"
+        )
+
+    def __repr__(self) -> str:
+        return f"TableSnapshot(path={str(self.path)!r})"
+
+    def __len__(self) -> int:
+        return len(self.manifest["tables"])
+
+    def __contains__(self, TableKey: str) -> bool:
+        return TableKey in self.manifest["tables"]
+
+    @property
+    def units(self) -> str:
+        """Returns the units the table data was stored in."""
+        return self.manifest["units"]
+
+    def list_all(self) -> list[DatabaseTable]:
+        """Lists all of the tables stored in the snapshot.
+
+        Returns:
+            list[DatabaseTable]: A list of the stored database tables.
+        """
+        return [
+            DatabaseTable(
+                TableKey=TableKey,
+                TableName=entry["TableName"],
+                ImportType=entry["ImportType"],
+                IsEmpty=entry["rows"] == 0,
+            )
+            for TableKey, entry in self.manifest["tables"].items()
+        ]
+
+    def get_table_fields(self, TableKey: str) -> list[FieldData]:
+        """Retrieves the fields of a stored table.
+
+        Args:
+            TableKey (str): The key identifier for the table.
+
+        Returns:
+            list[FieldData]: A list of field data in the specified table.
+        """
+        return [FieldData(**field) for field in self._entry(TableKey)["fields"]]
+
+    def get(
+        self, TableKey: str, dataframe: bool = True, fields: list[str] | None = None
+    ) -> pd.DataFrame | list[dict[str, Any]]:
+        """Extracts data from a stored table.
+
+        Args:
+            TableKey (str): The key identifier for the table.
+            dataframe (bool): If True, returns data as a DataFrame.
+                             If False, returns data as a list of dictionaries.
+            fields (list[str] | None): Field keys to read. All fields if None.
+
+        Returns:
+            pd.DataFrame | list[dict[str, Any]]: Stored data of the table.
+        """
+        table = self._feather.read_table(
+            self.path / self._entry(TableKey)["file"],
+            columns=list(fields) if fields else None,
+            memory_map=True,
+        )
+        if dataframe:
+            return table.to_pandas()
+        return table.to_pylist()
+
+    def _entry(self, TableKey: str) -> dict[str, Any]:
+        assert TableKey in self, f"`{TableKey}` is not in the snapshot at {self.path}"
+        return self.manifest["tables"][TableKey]
@@ -37,3 +37,34 @@ class FieldData:
     Description: str
     UnitsStr: str
     isImportable: bool
+
+
+@dataclass
+class ApplyResult:
+    """Represents the outcome of interactively importing edited tables.
+
+    Attributes:
+        NumFatalErrors (int): Number of fatal errors during the import.
+        NumErrorMsgs (int): Number of error messages logged during the import.
+        NumWarnMsgs (int): Number of warning messages logged during the import.
+        NumInfoMsgs (int): Number of informational messages logged during the import.
+        ImportLog (str): The import log returned by SAP2000.
+    """
+
+    NumFatalErrors: int
+    NumErrorMsgs: int
+    NumWarnMsgs: int
+    NumInfoMsgs: int
+    ImportLog: str
+
+    @property
+    def ok(self) -> bool:
+        """Returns True if the import reported no fatal errors or errors."""
+        return self.NumFatalErrors == 0 and self.NumErrorMsgs == 0
+
+    @property
+    def messages(self) -> list[str]:
+        """Returns the non-blank lines of the import log."""
+        return [
+            line.strip() for line in (self.ImportLog or "").splitlines() if line.strip()
+        ]
@@ -1,12 +1,39 @@
+import csv
+import sqlite3
+import tempfile
 import typing
+from collections.abc import Generator
+from datetime import datetime
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
+from comtypes import COMError
 
 from ak_sap.utils import log
-
-from .table_constants import ImportType_Literals
-from .table_structured_data import DatabaseTable, FieldData
+from ak_sap.utils.decorators import modifies_model
+
+from .model_database import ModelDatabase, table_digest
+from .table_batch import TableBatch
+from .table_cache import CacheInfo, TableCache
+from .table_catalog import TableCatalog
+from .table_constants import (
+    CATEGORY_MAX_RATIO,
+    CSV_HEADER_SEARCH_ROWS,
+    CSV_TRANSPORT_MIN_ROWS,
+    LABEL_FIELD_PATTERN,
+    UNITLESS_LABELS,
+    ImportType_Literals,
+    TableTransport_Literals,
+)
+from .table_diff import TableDiff, diff_tables
+from .table_lazy import LazyTable
+from .table_snapshot import SnapshotWriter, TableSnapshot
+from .table_structured_data import ApplyResult, DatabaseTable, FieldData
+
+_TABLE_UNITS = "N_m_C"
+"""Units in which table data is extracted"""
 
 
 class Table:
@@ -19,6 +46,8 @@ class Table:
         mySapObject: The main SAP2000 object.
         SapModel: The SAP2000 model object.
         DatabaseTables: The SAP2000 database tables interface.
+        cache (TableCache | None): Opt-in cache of extracted tables. See `enable_cache`.
+        catalog (TableCatalog): Session index of table and field names, with search.
     """
 
     def __init__(self, mySapObject, Model) -> None:
@@ -32,6 +61,10 @@ class Table:
         self.SapModel = self.mySapObject.SapModel
         self.Model = Model
         self.DatabaseTables = self.SapModel.DatabaseTables
+        self.cache: TableCache | None = None
+        self.catalog = TableCatalog(table=self)
+        self._baselines: dict[str, pd.DataFrame] = {}
+        self._row_counts: dict[tuple[str, str], int] = {}
         log.debug("Instance of `Table` module initialized.")
 
     def __str__(self) -> str:
@@ -46,6 +79,30 @@ class Table:
                 msg=f"Exception faced when deleting {self.__class__.__name__}\n{e}"
             )
 
+    def enable_cache(self, max_bytes: int = 512 * 2**20) -> None:
+        """Enables the in-process cache of extracted tables.
+
+        Tables are cached by (TableKey, fields, group, units) and evicted least
+        recently used first once `max_bytes` is exceeded. The cache is cleared
+        by `update`, `apply`, `discard`, analysis runs and any other wrapper
+        call that modifies the model.
+
+        Args:
+            max_bytes (int): Memory cap for cached tables. Defaults to 512 MiB.
+        """
+        log.info(f"Enabling table cache with a {max_bytes} byte cap")
+        self.cache = TableCache(max_bytes=max_bytes)
+
+    def disable_cache(self) -> None:
+        """Disables and drops the in-process cache of extracted tables."""
+        log.info("Disabling table cache")
+        self.cache = None
+
+    @property
+    def cache_info(self) -> CacheInfo | None:
+        """Returns hit/miss counters and size of the table cache, if enabled."""
+        return self.cache.info if self.cache is not None else None
+
     def list_all(self) -> list[DatabaseTable]:
         """Lists all of the tables along with their import type and emptiness status.
 
@@ -130,8 +187,98 @@ class Table:
             log.critical(str(e) + f"Return data: {_table_data}")
         return tables
 
+    def _schema(self, TableKey: str) -> list[FieldData]:
+        """Returns the fields of a table, indexed by the catalog."""
+        return self.catalog.fields(TableKey)
+
+    def _validate_fields(self, TableKey: str, fields: list[str]) -> None:
+        """Asserts that every requested field key exists in the specified table."""
+        available = [field.FieldKey for field in self._schema(TableKey)]
+        missing = [field for field in fields if field not in available]
+        assert not missing, (
+            f"Fields {missing} not found in `{TableKey}`. Available fields: {available}"
+        )
+
+    def _fetch(
+        self, TableKey: str, fields: list[str] | None = None, group: str = ""
+    ) -> tuple[tuple, tuple]:
+        """Retrieves the raw display array of a table in `_TABLE_UNITS`.
+
+        Args:
+            TableKey (str): The key identifier for the table.
+            fields (list[str] | None): Field keys to retrieve. All fields if None.
+            group (str): Name of an existing group to limit the rows to. All objects if blank.
+
+        Returns:
+            tuple[tuple, tuple]: The field keys and the flat, row-major table data.
+        """
+        key = (TableKey, tuple(fields) if fields else None, group, _TABLE_UNITS)
+        if self.cache is not None and (cached := self.cache.get(key)) is not None:
+            log.debug(f"TableKey: {TableKey} served from table cache")
+            return cached
+
+        if fields:
+            self._validate_fields(TableKey=TableKey, fields=fields)
+        with self.Model.units_scope(_TABLE_UNITS):
+            _data = self.DatabaseTables.GetTableForDisplayArray(
+                TableKey, list(fields) if fields else "", group
+            )
+        assert _data[-1] == 0, f"GetTableForDisplayArray returned {_data[-1]}"
+
+        headers, array = tuple(_data[2]), tuple(_data[4])
+        if headers:
+            self._row_counts[(TableKey, group)] = len(array) // len(headers)
+        if self.cache is not None:
+            self.cache.put(key, headers=headers, array=array)
+        return headers, array
+
+    def _fetch_csv(
+        self, TableKey: str, fields: list[str] | None = None, group: str = ""
+    ) -> pd.DataFrame:
+        """Retrieves a table in `_TABLE_UNITS` through a CSV file written by SAP2000.
+
+        Args:
+            TableKey (str): The key identifier for the table.
+            fields (list[str] | None): Field keys to retrieve. All fields if None.
+            group (str): Name of an existing group to limit the rows to. All objects if blank.
+
+        Returns:
+            pd.DataFrame: The table, with the same text values as the array transport.
+        """
+        if fields:
+            self._validate_fields(TableKey=TableKey, fields=fields)
+        with tempfile.TemporaryDirectory(prefix="ak_sap_") as folder:
+            csv_path = Path(folder) / "table.csv"
+            with self.Model.units_scope(_TABLE_UNITS):
+                _data = self.DatabaseTables.GetTableForDisplayCSVFile(
+                    TableKey, list(fields) if fields else "", group, 0, str(csv_path)
+                )
+            assert _data[-1] == 0, f"GetTableForDisplayCSVFile returned {_data[-1]}"
+            df = _csv_to_pandas(csv_path, fields=self._schema(TableKey))
+        self._row_counts[(TableKey, group)] = len(df)
+        return df
+
+    def _choose_transport(
+        self, TableKey: str, group: str, transport: TableTransport_Literals
+    ) -> TableTransport_Literals:
+        """Resolves the `auto` transport from the row count last seen for the table."""
+        if transport != "auto":
+            assert transport in typing.get_args(TableTransport_Literals), (
+                f"{transport=} must be one of {typing.get_args(TableTransport_Literals)}"
+            )
+            return transport
+        rows = self._row_counts.get((TableKey, group), 0)
+        return "csvfile" if rows >= CSV_TRANSPORT_MIN_ROWS else "array"
+
     def get(
-        self, TableKey: str, dataframe: bool = True
+        self,
+        TableKey: str,
+        dataframe: bool = True,
+        fields: list[str] | None = None,
+        group: str = "",
+        typed: bool = False,
+        track_changes: bool = False,
+        transport: TableTransport_Literals = "array",
     ) -> pd.DataFrame | list[dict[str, Any]]:
         """Extracts data from a specified table.
 
@@ -139,43 +286,315 @@ class Table:
             TableKey (str): The key identifier for the table.
             dataframe (bool): If True, returns data as a DataFrame.
                              If False, returns data as a list of dictionaries.
+            fields (list[str] | None): Field keys to retrieve, checked against
+                             `get_table_fields`. All fields if None.
+            group (str): Name of an existing group; only its objects are returned.
+                             All objects if blank.
+            typed (bool): If True, converts DataFrame columns using the table schema:
+                             fields with units to float64, integer counts to int32
+                             and repeated labels to category.
+            track_changes (bool): If True, keeps a copy of the returned DataFrame
+                             as the baseline for `update(..., diff=True)`.
+            transport (TableTransport_Literals): `array` marshals the table through
+                             COM arrays. `csvfile` has SAP2000 write a CSV file that is
+                             parsed by pandas, which skips the per-cell COM conversion
+                             but bypasses the table cache. `auto` uses `csvfile` for
+                             tables last seen with at least `CSV_TRANSPORT_MIN_ROWS`
+                             rows; a table not read before in the session, for the
+                             same group, uses `array`.
 
         Returns:
             pd.DataFrame | list[dict[str, Any]]: Extracted data from the table.
         """
         log.debug(f"Extracting data for TableKey: {TableKey}")
-        _data: list = []
-        _current_units = self.Model.units
-        self.Model.set_units(value="N_m_C")
         try:
-            _data = self.DatabaseTables.GetTableForDisplayArray(TableKey, "", "")
-            assert _data[-1] == 0
-            if dataframe:
-                df = _array_to_pandas(headers=_data[2], array=_data[4])
-                log.debug(f"Info of retrieved dataframe: \n{df.info(verbose=True)}")
-                self.Model.set_units(value=_current_units)
-                return df
+            transport = self._choose_transport(
+                TableKey=TableKey, group=group, transport=transport
+            )
+            if transport == "csvfile":
+                df = self._fetch_csv(TableKey=TableKey, fields=fields, group=group)
+                if not dataframe:
+                    return df.to_dict(orient="records")
             else:
-                data = _array_to_list_of_dicts(headers=_data[2], array=_data[4])
-                self.Model.set_units(value=_current_units)
-                return data
+                headers, array = self._fetch(
+                    TableKey=TableKey, fields=fields, group=group
+                )
+                if not dataframe:
+                    return _array_to_list_of_dicts(headers=headers, array=array)
+                df = _array_to_pandas(headers=headers, array=array)
+            if typed:
+                df = _apply_schema(df=df, schema=self._schema(TableKey))
+            if track_changes:
+                self._baselines[TableKey] = df.copy()
+            log.debug(
+                f"Retrieved {len(df)} rows x {len(df.columns)} fields via {transport}"
+            )
+            return df
         except Exception as e:
-            self.Model.set_units(value=_current_units)
-            log.critical(str(e) + f"\ndata: {_data}")
+            log.critical(str(e) + f"\nTableKey: {TableKey}")
             if dataframe:
                 return pd.DataFrame()
             else:
                 return []
 
-    def update(self, TableKey: str, data: pd.DataFrame, apply: bool = True):
+    def get_many(
+        self,
+        TableKeys: list[str],
+        dataframe: bool = True,
+        group: str = "",
+        typed: bool = False,
+        transport: TableTransport_Literals = "array",
+    ) -> dict[str, pd.DataFrame | list[dict[str, Any]]]:
+        """Extracts data from several tables with a single switch of model units.
+
+        Args:
+            TableKeys (list[str]): The key identifiers of the tables.
+            dataframe (bool): If True, returns data as DataFrames.
+                             If False, returns data as lists of dictionaries.
+            group (str): Name of an existing group; only its objects are returned.
+                             All objects if blank.
+            typed (bool): If True, converts DataFrame columns using each table schema.
+            transport (TableTransport_Literals): Transport used for each table. See `get`.
+
+        Returns:
+            dict[str, pd.DataFrame | list[dict[str, Any]]]: Extracted data keyed by TableKey.
+        """
+        log.debug(f"Extracting data for {len(TableKeys)} tables")
+        with self.Model.units_scope(_TABLE_UNITS):
+            return {
+                TableKey: self.get(
+                    TableKey=TableKey,
+                    dataframe=dataframe,
+                    group=group,
+                    typed=typed,
+                    transport=transport,
+                )
+                for TableKey in TableKeys
+            }
+
+    def iter_chunks(
+        self,
+        TableKey: str,
+        rows: int = 50_000,
+        fields: list[str] | None = None,
+        group: str = "",
+    ) -> Generator[pd.DataFrame, Any, None]:
+        """Extracts data from a specified table as a stream of DataFrame chunks.
+
+        Only the raw table array and the chunk being consumed are held in
+        memory, so large tables can be piped to disk without building the
+        whole DataFrame.
+
+        Args:
+            TableKey (str): The key identifier for the table.
+            rows (int): Maximum number of rows per chunk.
+            fields (list[str] | None): Field keys to retrieve. All fields if None.
+            group (str): Name of an existing group to limit the rows to. All objects if blank.
+
+        Yields:
+            pd.DataFrame: Consecutive row slices of the table.
+        """
+        assert rows > 0, f"{rows=} must be a positive integer"
+        log.debug(f"Streaming data for TableKey: {TableKey} in chunks of {rows} rows")
+        try:
+            headers, array = self._fetch(TableKey=TableKey, fields=fields, group=group)
+            step = rows * _check_array(headers=headers, array=array)
+        except (AssertionError, COMError) as e:
+            log.critical(str(e) + f"\nTableKey: {TableKey}")
+            return
+        for start in range(0, len(array), step):
+            yield _array_to_pandas(headers=headers, array=array[start : start + step])
+
+    def lazy(self, TableKey: str, group: str = "", typed: bool = False) -> LazyTable:
+        """Returns a proxy of a table that retrieves columns on first access.
+
+        Only the field data is retrieved up front. Columns accessed together,
+        or queued with `prefetch`, are retrieved in one projected call and
+        kept until the model is modified.
+
+        Usage:
+            sections = sap.Table.lazy("Frame Section Properties 01 - General")
+            sections[["SectionName", "Area"]]
+            sections.prefetch(["I33", "I22"])["S33"]  # Retrieves all three at once
+
+        Args:
+            TableKey (str): The key identifier for the table.
+            group (str): Name of an existing group to limit the rows to. All objects if blank.
+            typed (bool): If True, converts columns using the table schema.
+
+        Returns:
+            LazyTable: The table proxy.
+        """
+        return LazyTable(table=self, TableKey=TableKey, group=group, typed=typed)
+
+    def snapshot(self, path: str | Path, typed: bool = True) -> TableSnapshot:
+        """Saves every non-empty table to a columnar snapshot directory.
+
+        Each table is written as a Feather file, indexed by a `manifest.json`.
+        The snapshot is read back with `TableSnapshot`, which needs no SAP2000
+        session. Requires `pyarrow`.
+
+        Args:
+            path (str | Path): Directory to write the snapshot into.
+            typed (bool): If True, stores columns with schema-driven dtypes.
+
+        Returns:
+            TableSnapshot: Reader for the written snapshot.
+        """
+        tables = [table for table in self.list_all() if not table.IsEmpty]
+        log.info(f"Saving snapshot of {len(tables)} tables to {path}")
+        writer = SnapshotWriter(
+            path=path, model=str(self.Model.filepath), units=_TABLE_UNITS
+        )
+        with self.Model.units_scope(_TABLE_UNITS):
+            for table in tables:
+                df = self.get(TableKey=table.TableKey, typed=typed)
+                assert isinstance(df, pd.DataFrame)
+                if df.empty:
+                    continue
+                writer.add(table=table, data=df, fields=self._schema(table.TableKey))
+        return TableSnapshot(path=writer.close())
+
+    def export_sqlite(self, path: str | Path, typed: bool = True) -> ModelDatabase:
+        """Exports every non-empty table to a SQLite file for offline queries.
+
+        Tables are stored under their TableKey with typed columns, and key
+        fields such as Joint, Frame, Section and OutputCase are indexed.
+        Exporting to an existing file only rewrites the tables whose content
+        changed, and drops the tables that are now empty. Every table is still
+        read from SAP2000 to compare its content, unless the table cache is
+        enabled (see `enable_cache`) and the model was not modified since the
+        table was last read.
+
+        Usage:
+            db = sap.Table.export_sqlite("model.sqlite")
+            db.query('SELECT * FROM "Joint Coordinates" WHERE Z > ?', [10])
+
+        Args:
+            path (str | Path): Path of the SQLite file.
+            typed (bool): If True, stores columns with schema-driven dtypes.
+
+        Returns:
+            ModelDatabase: Query interface for the exported file.
+        """
+        tables = [table for table in self.list_all() if not table.IsEmpty]
+        log.info(f"Exporting {len(tables)} tables to {path}")
+        db = ModelDatabase(path=path)
+        written = 0
+        with self.Model.units_scope(_TABLE_UNITS):
+            for table in tables:
+                try:
+                    headers, array = self._fetch(TableKey=table.TableKey)
+                    digest = table_digest(headers=headers, array=array)
+                    if db.is_current(TableKey=table.TableKey, digest=digest):
+                        continue
+                    df = _array_to_pandas(headers=headers, array=array)
+                    fields = self._schema(table.TableKey)
+                    if typed:
+                        df = _apply_schema(df=df, schema=fields)
+                    db.write(table=table, data=df, fields=fields, digest=digest)
+                    written += 1
+                except (AssertionError, COMError, sqlite3.Error) as e:
+                    log.critical(str(e) + f"\nTableKey: {table.TableKey}")
+        dropped = db.prune(keep={table.TableKey for table in tables})
+        db.set_info(
+            model=self.Model.filepath,
+            units=_TABLE_UNITS,
+            exported=datetime.now().isoformat(timespec="seconds"),
+        )
+        log.info(
+            f"{written} tables written, {len(tables) - written} unchanged, "
+            f"{len(dropped)} dropped"
+        )
+        return db
+
+    @modifies_model
+    def update(
+        self,
+        TableKey: str,
+        data: pd.DataFrame,
+        apply: bool = True,
+        diff: bool = False,
+        keys: list[str] | None = None,
+    ) -> TableDiff | None:
         """Updates values in the specified database table.
 
         Args:
             TableKey (str): The key identifier for the table.
             data (pd.DataFrame): The DataFrame containing data to update.
             apply (bool): If True, apply the changes immediately.
+            diff (bool): If True, only rows that are inserted or changed since the
+                last `get(..., track_changes=True)` of this table are sent.
+            keys (list[str] | None): Columns that identify a row when diffing.
+                Defaults to the first column.
+
+        Returns:
+            TableDiff | None: The changes that were sent, if `diff` is True. None if
+                `diff` is False, or if the table could not be staged (no tracked
+                data to diff against, or rejected by SAP2000). A failed staging is
+                logged as critical and nothing is applied.
         """
         log.info(f"Updating the values for TableKey: {TableKey}")
+        try:
+            changes = self._stage(TableKey=TableKey, data=data, diff=diff, keys=keys)
+        except Exception as e:
+            log.critical(str(e))
+            return None
+        if (
+            apply
+            and not (changes is not None and changes.is_empty)
+            and (result := self.apply()) is not None
+            and result.ok
+        ):
+            self._track(TableKey=TableKey, data=data)
+        return changes
+
+    def batch(self) -> TableBatch:
+        """Starts a transaction that applies edits to several tables at once.
+
+        Tables updated within the `with` block are staged, then imported with a
+        single `ApplyEditedTables` call on exit. Staged edits are discarded if
+        the block raises or the import reports errors.
+
+        Usage:
+            with sap.Table.batch() as batch:
+                batch.update(TableKey="Joint Coordinates", data=joints)
+                batch.update(TableKey="Connectivity - Frame", data=frames)
+            batch.result
+
+        Returns:
+            TableBatch: The transaction context manager.
+        """
+        return TableBatch(table=self)
+
+    def _stage(
+        self,
+        TableKey: str,
+        data: pd.DataFrame,
+        diff: bool = False,
+        keys: list[str] | None = None,
+    ) -> TableDiff | None:
+        """Stores edited table data in the table list, without applying it.
+
+        Raises:
+            AssertionError: If there is no baseline to diff against or SAP2000
+                rejects the table data.
+        """
+        changes: TableDiff | None = None
+        if diff:
+            baseline = self._baselines.get(TableKey)
+            assert baseline is not None, (
+                f"No tracked data for TableKey: {TableKey}. "
+                "Call `get(..., track_changes=True)` before a diff update."
+            )
+            changes = diff_tables(
+                old=baseline, new=data, keys=keys or [str(data.columns[0])]
+            )
+            log.info(f"Changes to TableKey: {TableKey}: {changes}")
+            if changes.is_empty:
+                return changes
+            data = changes.rows(data)
+
         TableVersion: int = 1
         *_, ret = self.DatabaseTables.SetTableForEditingArray(
             TableKey,
@@ -184,19 +603,23 @@ class Table:
             len(data),
             flatten_dataframe(data),
         )
-        try:
-            assert ret == 0
-        except Exception as e:
-            log.critical(str(e) + f"Return Data: {_}")
-            return
-        if apply:
-            self.apply()
+        assert ret == 0, f"SetTableForEditingArray returned {ret} for `{TableKey}`"
+        return changes
+
+    def _track(self, TableKey: str, data: pd.DataFrame) -> None:
+        """Moves the diff baseline of a tracked table to its applied data."""
+        if TableKey in self._baselines:
+            self._baselines[TableKey] = data.copy()
 
-    def apply(self):
+    @modifies_model
+    def apply(self) -> ApplyResult | None:
         """Applies changes made to the database tables.
 
         Instructs the program to interactively import all of the tables stored
         in the table list.
+
+        Returns:
+            ApplyResult | None: Message counts and import log, or None if the call failed.
         """
         log.info("Applying table changes to database")
         NumFatalErrors, NumErrorMsgs, NumWarnMsgs, NumInfoMsgs, ImportLog, ret = (
@@ -212,9 +635,18 @@ class Table:
             else:
                 log.debug(ImportLog)
             assert ret == 0
+            return ApplyResult(
+                NumFatalErrors=NumFatalErrors,
+                NumErrorMsgs=NumErrorMsgs,
+                NumWarnMsgs=NumWarnMsgs,
+                NumInfoMsgs=NumInfoMsgs,
+                ImportLog=ImportLog,
+            )
         except Exception as e:
             log.critical(str(e) + f"Import Log: {ImportLog}")
+            return None
 
+    @modifies_model
     def discard(self):
         """Clears all tables that were stored in the table list."""
         log.info("Discarding all table changes that are not applied.")
@@ -225,44 +657,133 @@ class Table:
 
 
 def flatten_dataframe(df: pd.DataFrame) -> tuple:
-    """Convert values of a dataframe to single-dimension array for SapOAPI"""
-    df = df.fillna("")
-    df = df.astype(str)
+    """Convert values of a dataframe to single-dimension array for SapOAPI.
 
-    flattened_list = []
-    for _, row in df.iterrows():
-        flattened_list.extend(row.values)
+    Values are stringified column-wise and flattened in row-major order;
+    nulls and empty strings are sent as `None`."""
+    values = df.to_numpy(dtype=object)
+    flattened = values.astype(str).astype(object)
+    flattened[pd.isna(values) | (flattened == "")] = None
+    return tuple(flattened.ravel())
 
-    modified_list = [value if value != "" else None for value in flattened_list]
-    return tuple(modified_list)
 
+def _apply_schema(df: pd.DataFrame, schema: list[FieldData]) -> pd.DataFrame:
+    """Converts the text columns of a table to compact dtypes using its field data.
 
-def _array_to_pandas(headers: tuple, array: tuple) -> pd.DataFrame:
-    """Given the table headers as tuple and table data as a single tuple;
-    Returns table as a dataframe."""
+    Fields with units become float64 and unitless integer fields become int32,
+    provided every non-blank value is numeric. Object names such as `Joint`
+    or `Frame` stay labels. Text fields with repeated values become `category`.
+    """
+    units = {field.FieldKey: field.UnitsStr for field in schema}
+    converted: dict[str, pd.Series] = {}
+    for column in df.columns:
+        values = df[column]
+        if pd.api.types.is_numeric_dtype(values) or len(values) == 0:
+            continue
+        blank = values.isna() | (values.astype(str) == "")
+        numeric = pd.to_numeric(values.where(~blank), errors="coerce")
+        is_label = not units.get(column) and LABEL_FIELD_PATTERN.search(str(column))
+        if not is_label and numeric.notna().sum() == (~blank).sum() and (~blank).any():
+            integral = not units.get(column) and not blank.any()
+            integral = integral and bool((numeric % 1 == 0).all())
+            if integral and numeric.abs().max() < 2**31:
+                converted[column] = numeric.astype("int32")
+            else:
+                converted[column] = numeric.astype("float64")
+        elif values.nunique() <= CATEGORY_MAX_RATIO * len(values):
+            converted[column] = values.astype("category")
+    return df.assign(**converted) if converted else df
+
+
+def _check_array(headers: tuple, array: tuple) -> int:
+    """Asserts the flat table array holds whole rows; Returns the number of fields."""
     num_fields = len(headers)
-    assert (
-        len(array) % num_fields == 0
-    ), f"Array length ({len(array)}) is not divisible by header length ({num_fields})"
+    assert len(array) % num_fields == 0, (
+        f"Array length ({len(array)}) is not divisible by header length ({num_fields})"
+    )
+    return num_fields
 
-    df_data: dict[str, list] = {header: [] for header in headers}
-    for array_idx, value in enumerate(array):
-        _header: str = headers[array_idx % num_fields]
-        df_data[_header].append(value)
-    return pd.DataFrame(df_data)
 
+def _array_to_rows(headers: tuple, array: tuple) -> np.ndarray:
+    """Given the table headers as tuple and table data as a single tuple;
+    Returns the table as a 2D object array of shape (rows, fields).
 
-def _array_to_list_of_dicts(headers: tuple, array: tuple) -> list[dict[str, Any]]:
+    The flat row-major tuple returned by SapOAPI is copied once into a NumPy
+    object array and reshaped, so no Python-level loop runs per cell."""
+    num_fields = _check_array(headers=headers, array=array)
+    values = np.fromiter(array, dtype=object, count=len(array))
+    return values.reshape(-1, num_fields)
+
+
+def _array_to_pandas(headers: tuple, array: tuple) -> pd.DataFrame:
     """Given the table headers as tuple and table data as a single tuple;
-    Returns table as a list of dictionaries."""
-    num_fields = len(headers)
-    assert (
-        len(array) % num_fields == 0
-    ), f"Array length ({len(array)}) is not divisible by header length ({num_fields})"
+    Returns table as a dataframe.
+
+    Columns are built from lists, so pandas infers their dtypes exactly as it
+    did when the table was assembled value by value."""
+    values = _array_to_rows(headers=headers, array=array)
+    return pd.DataFrame(
+        {header: values[:, j].tolist() for j, header in enumerate(headers)}
+    )
+
+
+def _csv_to_pandas(
+    path: str | Path, fields: list[FieldData] | None = None
+) -> pd.DataFrame:
+    """Reads a table CSV file written by SapOAPI; Returns table as a dataframe.
+
+    The field row may be preceded by a `TABLE:` title line and followed by a
+    row of units, as in SAP2000 table exports. With the field data of the
+    table, the field row is the first row of known field keys or names (names
+    are renamed to keys), and a following row is dropped as units when none
+    of its fields with units hold a number. Every value is read as text, with
+    blanks kept as empty strings, so the result matches `_array_to_pandas`
+    for the same table."""
+    fields = fields or []
+    names = {field.FieldName: field.FieldKey for field in fields}
+    known = {field.FieldKey for field in fields} | set(names)
+    with open(path, newline="") as f:
+        head = [row for _, row in zip(range(CSV_HEADER_SEARCH_ROWS), csv.reader(f))]
+    header = 0
+    for i, row in enumerate(head):
+        cells = [cell.strip() for cell in row if cell.strip()]
+        if not cells or cells[0].upper().startswith("TABLE:"):
+            header = i + 1
+            continue
+        if not known or set(cells) <= known:
+            header = i
+            break
+
+    df = pd.read_csv(
+        path, skiprows=header, dtype=str, keep_default_na=False, engine="c"
+    )
+    df = df.rename(columns=lambda column: names.get(column.strip(), column.strip()))
+    if len(df) and _is_units_row(df.iloc[0], fields=fields):
+        df = df.iloc[1:].reset_index(drop=True)
+    return df
+
+
+def _is_units_row(row: pd.Series, fields: list[FieldData]) -> bool:
+    """Returns True if a CSV row holds the units of the fields rather than values."""
+    units = {field.FieldKey: field.UnitsStr for field in fields}
+    if all(
+        cell.strip() in {"", units.get(column, ""), *UNITLESS_LABELS}
+        for column, cell in row.items()
+    ) and any(cell.strip() for cell in row):
+        return True
+    with_units = [column for column in row.index if units.get(column)]
+    if not with_units:
+        return False
+    cells = row[with_units].str.strip()
+    numeric = pd.to_numeric(cells[cells != ""], errors="coerce")
+    return bool((cells != "").any() and numeric.isna().all())
 
-    list_of_dicts = []
-    for i in range(len(array) // num_fields):
-        row_dict = {headers[j]: array[i * num_fields + j] for j in range(num_fields)}
-        list_of_dicts.append(row_dict)
 
-    return list_of_dicts
+def _array_to_list_of_dicts(headers: tuple, array: tuple) -> list[dict[str, Any]]:
+    """Given the table headers as tuple and table data as a single tuple;
+    Returns table as a list of dictionaries."""
+    num_fields = _check_array(headers=headers, array=array)
+    # Building the dicts dominates here, so rows are grouped straight off the
+    # tuple iterator instead of going through an intermediate array.
+    rows = zip(*[iter(array)] * num_fields)
+    return [dict(zip(headers, row)) for row in rows]
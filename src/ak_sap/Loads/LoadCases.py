@@ -1,7 +1,7 @@
 import typing
 
 from ak_sap.utils import MasterClass
-from ak_sap.utils.decorators import smooth_sap_do
+from ak_sap.utils.decorators import modifies_model, smooth_sap_do
 
 from .constants import LoadCaseType, LoadPatternType
 
@@ -30,6 +30,7 @@ class LoadCase(MasterClass):
             _ret = self.__LoadCases.Count(_value)
         return _ret
 
+    @modifies_model
     @smooth_sap_do
     def rename(self, old_name: str, new_name: str):
         """changes the name of an existing load case."""
@@ -44,6 +45,7 @@ class LoadCase(MasterClass):
         _, loadcases, _ret = self.__LoadCases.GetNameList_1()
         return *loadcases, _ret
 
+    @modifies_model
     @smooth_sap_do
     def delete(self, name: str):
         assert name in self.list_all(), (
@@ -71,6 +73,7 @@ class LoadCase(MasterClass):
             _value["SubType"] = None
         return (_value, 0)  # type: ignore
 
+    @modifies_model
     @smooth_sap_do
     def set_type(self, name: str, casetype: LoadCaseType):
         assert name in self.list_all(), (
@@ -1,6 +1,11 @@
+import typing
+
 from ak_sap.utils import MasterClass
 from ak_sap.utils.decorators import smooth_sap_do
 
+from .constants import ComboType
+from .types import ComboDefinition
+
 
 class LoadCombo(MasterClass):
     def __init__(self, mySapObject) -> None:
@@ -14,3 +19,52 @@ class LoadCombo(MasterClass):
     def list_all(self) -> tuple[str]:
         """retrieves the names of all defined response combinations"""
         return self.__RespCombo.GetNameList()[1:]
+
+    @smooth_sap_do
+    def get_type(self, name: str) -> ComboType:
+        """retrieves the combination type of a response combination."""
+        _type, _ret = self.__RespCombo.GetTypeOAPI(name)
+        return typing.get_args(ComboType)[_type], _ret
+
+    @smooth_sap_do
+    def get(self, name: str) -> ComboDefinition:
+        """retrieves the type, load cases, nested combinations and scale factors of a response combination."""
+        return combo_definition(
+            name=name,
+            combo_type=self.__RespCombo.GetTypeOAPI(name),
+            case_list=self.__RespCombo.GetCaseList(name),
+        ), 0
+
+    def get_all(self) -> dict[str, ComboDefinition]:
+        """retrieves the definitions of all response combinations, keyed by name."""
+        return {
+            name: definition
+            for name in self.list_all() or ()
+            if (definition := self.get(name)) is not None
+        }
+
+
+def combo_definition(name: str, combo_type: list, case_list: list) -> ComboDefinition:
+    """Parses the SapOAPI return values of `GetTypeOAPI` and `GetCaseList`.
+
+    Args:
+        name (str): name of the response combination.
+        combo_type (list): return value of `GetTypeOAPI`, i.e. (ComboType, ret).
+        case_list (list): return value of `GetCaseList`, i.e. (NumberItems, CNameType, CName, SF, ret).
+
+    Returns:
+        ComboDefinition: the combination definition.
+    """
+    assert combo_type[-1] == 0, f"GetTypeOAPI returned {combo_type[-1]}"
+    assert case_list[-1] == 0, f"GetCaseList returned {case_list[-1]}"
+    definition = ComboDefinition(
+        name=name, combo_type=typing.get_args(ComboType)[combo_type[0]]
+    )
+    if case_list[0] == 0:
+        return definition
+    for _type, _name, _sf in zip(*case_list[1:4]):
+        if _type == 1:
+            definition.combos[_name] = _sf
+        else:
+            definition.cases[_name] = _sf
+    return definition
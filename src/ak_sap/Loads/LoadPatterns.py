@@ -1,7 +1,7 @@
 import typing
 
 from ak_sap.utils import MasterClass
-from ak_sap.utils.decorators import smooth_sap_do
+from ak_sap.utils.decorators import modifies_model, smooth_sap_do
 
 from .constants import LoadPatternType
 
@@ -21,6 +21,7 @@ class LoadPattern(MasterClass):
         """returns the number of defined load patterns."""
         return self.__LoadPatterns.Count()
 
+    @modifies_model
     @smooth_sap_do
     def add(
         self,
@@ -35,16 +36,19 @@ class LoadPattern(MasterClass):
             name, chosen_pattern, selfwt_multiplier, add_case
         )
 
+    @modifies_model
     @smooth_sap_do
     def rename(self, old_name: str, new_name: str):
         """applies a new name to a load pattern."""
         return self.__LoadPatterns.ChangeName(old_name, new_name)
 
+    @modifies_model
     @smooth_sap_do
     def delete(self, name: str):
         """deletes the specified load pattern."""
         return self.__LoadPatterns.Delete(name)
 
+    @modifies_model
     @smooth_sap_do
     def set_loadtype(self, name: str, pattern_type: LoadPatternType):
         """assigns a load type to a load pattern."""
@@ -58,6 +62,7 @@ class LoadPattern(MasterClass):
         chosen_pattern = typing.get_args(LoadPatternType)[value[0] - 1]
         return chosen_pattern, 0  # type: ignore
 
+    @modifies_model
     @smooth_sap_do
     def set_selfwt_multiplier(self, name: str, selfwt_multiplier: float):
         return self.__LoadPatterns.SetSelfWtMultiplier(name, selfwt_multiplier)
@@ -1,5 +1,5 @@
 from ak_sap.utils import MasterClass
-from ak_sap.utils.decorators import smooth_sap_do
+from ak_sap.utils.decorators import modifies_model, smooth_sap_do
 
 
 class Eigen(MasterClass):
@@ -22,6 +22,7 @@ class Eigen(MasterClass):
         """
         return self.ModalEigen.GetInitialCase(case_name)
 
+    @modifies_model
     @smooth_sap_do
     def set_initial_case(self, case_name: str, initial_case: str):
         """sets the initial condition for the specified load case.
@@ -47,6 +48,7 @@ class Eigen(MasterClass):
         """retrieves the max and min number of modes requested for the specified load case."""
         return self.ModalEigen.GetNumberModes(case_name)
 
+    @modifies_model
     @smooth_sap_do
     def set_number_modes(self, case_name: str, max: int, min: int):
         """sets the number of modes requested for the specified load case."""
@@ -64,6 +66,7 @@ class Eigen(MasterClass):
         }
         return _values, 0  # type: ignore
 
+    @modifies_model
     @smooth_sap_do
     def set_parameters(
         self,
@@ -82,6 +85,7 @@ class Eigen(MasterClass):
             int(AllowAutoFreqShift),
         )
 
+    @modifies_model
     @smooth_sap_do
     def set_case(self, case_name: str):
         """Initializes a modal eigen load case.
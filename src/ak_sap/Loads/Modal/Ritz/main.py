@@ -1,5 +1,5 @@
 from ak_sap.utils import MasterClass
-from ak_sap.utils.decorators import smooth_sap_do
+from ak_sap.utils.decorators import modifies_model, smooth_sap_do
 
 
 class Ritz(MasterClass):
@@ -22,6 +22,7 @@ class Ritz(MasterClass):
         """
         return self.ModalRitz.GetInitialCase(case_name)
 
+    @modifies_model
     @smooth_sap_do
     def set_initial_case(self, case_name: str, initial_case: str):
         """sets the initial condition for the specified load case.
@@ -47,11 +48,13 @@ class Ritz(MasterClass):
         """retrieves the max and min number of modes requested for the specified load case."""
         return self.ModalRitz.GetNumberModes(case_name)
 
+    @modifies_model
     @smooth_sap_do
     def set_number_modes(self, case_name: str, max: int, min: int):
         """sets the number of modes requested for the specified load case."""
         return self.ModalRitz.SetNumberModes(case_name, max, min)
 
+    @modifies_model
     @smooth_sap_do
     def set_case(self, case_name: str):
         """Initializes a modal eigen load case.
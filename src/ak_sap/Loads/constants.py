@@ -59,3 +59,11 @@ LoadCaseType = Literal[
     "LINEAR_STATIC_MULTISTEP",
     "HYPERSTATIC",
 ]
+
+ComboType = Literal[
+    "Linear Additive",
+    "Envelope",
+    "Absolute Additive",
+    "SRSS",
+    "Range Additive",
+]
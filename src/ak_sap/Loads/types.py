@@ -0,0 +1,25 @@
+from dataclasses import dataclass, field
+
+from .constants import ComboType
+
+
+@dataclass
+class ComboDefinition:
+    """Definition of a response combination.
+
+    Attributes:
+        name (str): Name of the combination.
+        combo_type (ComboType): How the scaled cases are combined.
+        cases (dict[str, float]): Scale factor of each load case.
+        combos (dict[str, float]): Scale factor of each nested combination.
+    """
+
+    name: str
+    combo_type: ComboType
+    cases: dict[str, float] = field(default_factory=dict)
+    combos: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def factors(self) -> dict[str, float]:
+        """Returns the scale factor of every case and nested combination."""
+        return {**self.cases, **self.combos}
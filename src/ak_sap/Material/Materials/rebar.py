@@ -1,5 +1,5 @@
 from ak_sap.utils import MasterClass
-from ak_sap.utils.decorators import smooth_sap_do
+from ak_sap.utils.decorators import modifies_model, smooth_sap_do
 
 
 class Rebar(MasterClass):
@@ -7,6 +7,7 @@ class Rebar(MasterClass):
         super().__init__(mySapObject=mySapObject)
         self.PropRebar = mySapObject.SapModel.PropRebar
 
+    @modifies_model
     @smooth_sap_do
     def rename(self, old: str, new: str):
         """changes the name of an existing rebar property."""
@@ -21,6 +22,7 @@ class Rebar(MasterClass):
         """returns the total number of defined rebar properties in the model."""
         return self.total()
 
+    @modifies_model
     @smooth_sap_do
     def delete(self, name: str):
         """deletes a specified rebar property."""
@@ -37,6 +39,7 @@ class Rebar(MasterClass):
         result = self.PropRebar.GetProp(name)
         return {"area": result[0], "dia": result[1]}
 
+    @modifies_model
     @smooth_sap_do
     def set_prop(self, name: str, area: float, dia: float):
         return self.PropRebar.SetProp(name, area, dia)
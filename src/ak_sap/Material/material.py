@@ -1,7 +1,7 @@
 import typing
 
 from ak_sap.utils import MasterClass
-from ak_sap.utils.decorators import smooth_sap_do
+from ak_sap.utils.decorators import modifies_model, smooth_sap_do
 
 from .constants import MaterialTypesStr, SymmetryTypeStr
 from .Materials.rebar import Rebar
@@ -18,6 +18,7 @@ class Material(MasterClass):
     def __len__(self) -> int:
         return self.total()
 
+    @modifies_model
     @smooth_sap_do
     def rename(self, old: str, new: str):
         """changes the name of an existing material property."""
@@ -28,6 +29,7 @@ class Material(MasterClass):
         """returns the total number of defined material properties in the model."""
         return self.__PropMaterial.Count()
 
+    @modifies_model
     @smooth_sap_do
     def delete(self, name: str):
         return self.__PropMaterial.Delete(name)
@@ -57,6 +59,7 @@ class Material(MasterClass):
             "SymmetryType": self.__get_type(name=name)["SymmetryType"],
         }
 
+    @modifies_model
     @smooth_sap_do
     def add(self, name: str, material_type: MaterialTypesStr):
         """initializes a material property.
@@ -66,11 +69,13 @@ class Material(MasterClass):
             name, typing.get_args(MaterialTypesStr).index(material_type) + 1
         )
 
+    @modifies_model
     @smooth_sap_do
     def set_isotropic(self, name: str, E: float, poisson: float, thermal_coeff: float):
         """sets the material directional symmetry type to isotropic, and assigns the isotropic mechanical properties."""
         return self.__PropMaterial.SetMPIsotropic(name, E, poisson, thermal_coeff)
 
+    @modifies_model
     @smooth_sap_do
     def set_density(self, name: str, mass_per_vol: float):
         """assigns weight per unit volume or mass per unit volume to a material property."""
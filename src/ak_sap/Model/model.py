@@ -1,8 +1,11 @@
 import typing
+from collections.abc import Generator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
 
 from ak_sap.utils import MasterClass, log
-from ak_sap.utils.decorators import smooth_sap_do
+from ak_sap.utils.decorators import modifies_model, smooth_sap_do
 
 from .constants import _PROJECT_INFO_KEYS, _UNITS, _UNITS_LITERALS
 
@@ -10,6 +13,7 @@ from .constants import _PROJECT_INFO_KEYS, _UNITS, _UNITS_LITERALS
 class Model(MasterClass):
     def __init__(self, mySapObject) -> None:
         super().__init__(mySapObject=mySapObject)
+        self.__scoped_units: _UNITS_LITERALS | None = None
 
     def __str__(self) -> str:
         return "Instance of `Model`. Holds collection of model functions"
@@ -43,6 +47,37 @@ class Model(MasterClass):
         _unit_to_set = _UNITS.index(value) + 1
         return self.SapModel.SetPresentUnits(_unit_to_set)
 
+    @contextmanager
+    def units_scope(self, value: _UNITS_LITERALS) -> Generator[None, Any, None]:
+        """Temporarily sets the present units of the model.
+
+        The previous units are restored on exit, even if an exception is raised.
+        Units are not switched if they already match, and nested scopes with the
+        same units make no calls to SAP2000.
+
+        Usage:
+            with sap.Model.units_scope("N_m_C"):
+                ...
+
+        Args:
+            value (_UNITS_LITERALS): Units to use within the scope.
+        """
+        if self.__scoped_units == value:
+            yield
+            return
+
+        _current_units = self.units
+        _outer_scope = self.__scoped_units
+        if _current_units != value:
+            self.set_units(value=value)
+        self.__scoped_units = value
+        try:
+            yield
+        finally:
+            self.__scoped_units = _outer_scope
+            if _current_units != value:
+                self.set_units(value=_current_units)
+
     @property
     def merge_tol(self) -> float:
         """Retrieves the value of the program auto merge tolerance"""
@@ -55,6 +90,7 @@ class Model(MasterClass):
             log.critical(str(e) + f"Return Tol: {tol}")
         return tol
 
+    @modifies_model
     @smooth_sap_do
     def set_merge_tol(self, value: float):
         """Sets the program auto merge tolerance"""
@@ -95,6 +131,7 @@ class Model(MasterClass):
             log.critical(str(e) + f"Return values: \n{_items=}\n{keys=}\n{values=}")
         return info
 
+    @modifies_model
     def set_project_info(self, value: dict):
         """sets the data for an item in the project information."""
         assert self.SapModel is not None
@@ -114,16 +151,19 @@ class Model(MasterClass):
         log.debug("Extracting Sap logs")
         return self.SapModel.GetUserComment()[0]
 
+    @modifies_model
     @smooth_sap_do
     def set_logs(self, value: str) -> None:
         """sets the user comments and log data."""
         assert self.SapModel is not None
         return self.SapModel.SetUserComment(value)
 
+    @modifies_model
     def lock(self):
         """Lock Model"""
         self.__update_lock(lock=True)
 
+    @modifies_model
     def unlock(self):
         """Unlock Model"""
         self.__update_lock(lock=False)
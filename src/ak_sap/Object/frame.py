@@ -1,4 +1,4 @@
-from ak_sap.utils.decorators import smooth_sap_do
+from ak_sap.utils.decorators import modifies_model, smooth_sap_do
 
 from .helper import MasterObj
 
@@ -25,6 +25,7 @@ class Frame(MasterObj):
         # self.check_obj_legal(name=name)
         return self.__FrameObj.GetPoints(name)
 
+    @modifies_model
     @smooth_sap_do
     def divide_by_distance(
         self, name: str, dist: float, Iend: bool = True
@@ -34,6 +35,7 @@ class Frame(MasterObj):
         """
         return self.__EditFrame.DivideAtDistance(name, dist, Iend)
 
+    @modifies_model
     @smooth_sap_do
     def divide_by_intersection(self, name: str) -> tuple[str]:
         """divides straight frame objects at intersections with selected point objects, line objects, area edges and solid edges.
@@ -47,6 +49,7 @@ class Frame(MasterObj):
         """
         return self.__EditFrame.DivideAtIntersections(name)[1:]
 
+    @modifies_model
     @smooth_sap_do
     def divide_by_ratio(
         self, name: str, ratio: float, num_frames: int = 1
@@ -64,6 +67,7 @@ class Frame(MasterObj):
         """
         return self.__EditFrame.DivideByRatio(name, num_frames, ratio)
 
+    @modifies_model
     @smooth_sap_do
     def join(self, frame1: str, frame2: str) -> bool:
         """joins two straight frame objects that have a common end point and are colinear.
@@ -74,6 +78,7 @@ class Frame(MasterObj):
         """
         return self.__EditFrame.Join(frame1, frame2)
 
+    @modifies_model
     @smooth_sap_do
     def change_points(self, name: str, point1: str, point2: str) -> bool:
         """modifies the connectivity of a frame object.
@@ -85,6 +90,7 @@ class Frame(MasterObj):
         """
         return self.__EditFrame.ChangeConnectivity(name, point1, point2)
 
+    @modifies_model
     @smooth_sap_do
     def extrude(
         self,
@@ -122,6 +128,7 @@ class Prop:
     def __len__(self) -> int:
         return self.total()
 
+    @modifies_model
     @smooth_sap_do
     def rename(self, old_name: str, new_name: str):
         """changes the name of an existing frame section property."""
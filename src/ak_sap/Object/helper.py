@@ -1,6 +1,6 @@
 from typing import Any, Generator
 
-from ak_sap.utils.decorators import smooth_sap_do
+from ak_sap.utils.decorators import modifies_model, smooth_sap_do
 from ak_sap.utils.logger import log
 
 
@@ -47,6 +47,7 @@ class MasterObj:
         _, *elem_list = self.__ElemObj.GetNameList()
         return elem_list  # type: ignore
 
+    @modifies_model
     @smooth_sap_do
     def rename(self, old_name: str, new_name: str):
         """Change the name of the element"""
@@ -59,6 +60,7 @@ class MasterObj:
             f"`{name}` not found in the current list of elements: {self.all()}"
         )
 
+    @modifies_model
     @smooth_sap_do
     def delete(self, name: str):
         """Delete element from model"""
@@ -1,7 +1,7 @@
 from typing import Literal
 
 from ak_sap.misc import Coord
-from ak_sap.utils.decorators import smooth_sap_do
+from ak_sap.utils.decorators import modifies_model, smooth_sap_do
 
 from .frame import Frame
 from .point import Point
@@ -14,6 +14,7 @@ class Object:
         self.Point = Point(mySapObject=mySapObject)
         self.Frame = Frame(mySapObject=mySapObject)
 
+    @modifies_model
     @smooth_sap_do
     def move_selected(self, dx: float, dy: float, dz: float) -> bool:
         """moves selected point, frame, cable, tendon, area, solid and link objects.
@@ -25,6 +26,7 @@ class Object:
         """
         return self.__EditGeneral.Move(dx, dy, dz)
 
+    @modifies_model
     @smooth_sap_do
     def copy(self, dx: float, dy: float, dz: float, num: int) -> tuple:
         """linearly replicates selected objects.
@@ -37,6 +39,7 @@ class Object:
         """
         return self.__EditGeneral.ReplicateLinear(dx, dy, dz, num)
 
+    @modifies_model
     @smooth_sap_do
     def mirror(self, plane: Literal["X", "Y", "Z"], coord1: Coord, coord2: Coord):
         """mirror replicates selected objects
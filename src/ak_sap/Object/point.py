@@ -1,6 +1,6 @@
 from typing import Literal
 
-from ak_sap.utils.decorators import smooth_sap_do
+from ak_sap.utils.decorators import modifies_model, smooth_sap_do
 import pandas as pd
 
 from .helper import MasterObj
@@ -13,6 +13,7 @@ class Point(MasterObj):
         self.__PointObj = mySapObject.SapModel.PointObj
         self.__EditGeneral = mySapObject.SapModel.EditGeneral
 
+    @modifies_model
     @smooth_sap_do
     def add_by_coord(
         self,
@@ -28,6 +29,7 @@ class Point(MasterObj):
         """
         return self.__PointObj.AddCartesian(*point, "", name, coord_sys)
 
+    @modifies_model
     @smooth_sap_do
     def align(self, axis: Literal["X", "Y", "Z"], ordinate: float) -> tuple:
         """aligns selected point objects.
@@ -55,6 +57,7 @@ class Point(MasterObj):
     def deselect_all(self) -> bool:
         return self.__PointObj.ClearSelection()
 
+    @modifies_model
     @smooth_sap_do
     def merge(self, tolerance: float) -> tuple:
         """merges selected point objects that are within a specified distance of one another.
@@ -68,6 +71,7 @@ class Point(MasterObj):
         """
         return self.__EditPoint.Merge(tolerance)
 
+    @modifies_model
     @smooth_sap_do
     def change_coord(self, name: str, x: float, y: float, z: float) -> bool:
         """changes the coordinates of a specified point object.
@@ -83,6 +87,7 @@ class Point(MasterObj):
         """
         return self.__EditPoint.ChangeCoordinates_1(name, x, y, z)
 
+    @modifies_model
     @smooth_sap_do
     def extrude(
         self,
@@ -110,6 +115,7 @@ class Point(MasterObj):
             point_name, property_name, dx, dy, dz, num_frames
         )
 
+    @modifies_model
     @smooth_sap_do
     def setLoadForce(
         self,
@@ -129,6 +135,7 @@ class Point(MasterObj):
             name, loadpattern, [f1, f2, f3, m1, m2, m3], replace, coord_sys
         )
 
+    @modifies_model
     @smooth_sap_do
     def setLoadDisplacement(
         self,
@@ -184,16 +191,19 @@ class Point(MasterObj):
 
         return pd.DataFrame(data)
 
+    @modifies_model
     @smooth_sap_do
     def delLoadDisplacement(self, name: str, loadpattern: str) -> bool:
         """deletes all ground displacement load assignments, for the specified load pattern, from the specified point object(s)."""
         return self.__PointObj.DeleteLoadDispl(name, loadpattern)
 
+    @modifies_model
     @smooth_sap_do
     def delLoadForce(self, name: str, loadpattern: str) -> bool:
         """deletes all point load assignments, for the specified load pattern, from the specified point object(s)."""
         return self.__PointObj.DeleteLoadForce(name, loadpattern)
 
+    @modifies_model
     @smooth_sap_do
     def changename(self, name: str, new_name: str) -> bool:
         """returns zero if the new name is successfully applied, otherwise it returns a nonzero value.
@@ -211,16 +221,19 @@ class Point(MasterObj):
         """returns the total number of point objects in the model."""
         return self.__PointObj.Count()
 
+    @modifies_model
     @smooth_sap_do
     def delConstraint(self, name: str):
         """deletes all constraint assignments from the specified point object(s)."""
         return self.__PointObj.DeleteConstraint(name)
 
+    @modifies_model
     @smooth_sap_do
     def setConstraint(self, name: str, constraintname: str):
         """makes joint constraint assignments to point objects"""
         return self.__PointObj.SetConstraint(name, constraintname)
 
+    @modifies_model
     @smooth_sap_do
     def delRestraint(self, name: str):
         """deletes all restraint assignments from the specified point object"""
@@ -242,6 +255,7 @@ class Point(MasterObj):
             }
         )
 
+    @modifies_model
     @smooth_sap_do
     def setRestraint(
         self, name: str, U1: bool, U2: bool, U3: bool, R1: bool, R2: bool, R3: bool
@@ -251,6 +265,7 @@ class Point(MasterObj):
         """
         return self._PointObj.SetRestraint(name, [U1, U2, U3, R1, R2, R3])
 
+    @modifies_model
     @smooth_sap_do
     def delSpring(self, name: str):
         """deletes all point spring assignments from the specified point object
@@ -260,6 +275,7 @@ class Point(MasterObj):
         """
         return self.__PointObj.DeleteSpring(name)
 
+    @modifies_model
     @smooth_sap_do
     def setSpring(
         self,
@@ -1,38 +1,255 @@
-from ak_sap.utils import MasterClass
-from ak_sap.utils.decorators import smooth_sap_do
+import typing
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from typing import Any
+
+from ak_sap.utils import MasterClass, log
+from ak_sap.utils.decorators import modifies_output, smooth_sap_do
+from ak_sap.utils.revision import output_revision
+
+from .constants import HistoryOutput_Literals
 
 
 class ResultsSetup(MasterClass):
     def __init__(self, mySapObject) -> None:
         super().__init__(mySapObject=mySapObject)
         self.__Setup = mySapObject.SapModel.Results.Setup
+        self._selected: dict[str, set[str]] | None = None
 
+    @modifies_output
     @smooth_sap_do
     def clear_casecombo(self):
         """deselects all load cases and response combinations for output."""
-        return self.__Setup.DeselectAllCasesAndCombosForOutput()
+        _ret = self.__Setup.DeselectAllCasesAndCombosForOutput()
+        self._selected = {"cases": set(), "combos": set()} if _ret == 0 else None
+        return _ret
 
     def is_selected_case(self, casename: str):
         """checks if an load case is selected for output."""
         return self.__Setup.GetCaseSelectedForOutput(casename)
 
+    @modifies_output
     def select_case(self, casename: str):
         """sets an load case selected for output flag."""
-        return self.__Setup.SetCaseSelectedForOutput(casename)
+        _ret = self.__Setup.SetCaseSelectedForOutput(casename)
+        if _ret == 0 and self._selected is not None:
+            self._selected["cases"].add(casename)
+        return _ret
 
     def is_selected_combo(self, comboname: str):
         """checks if an load combo is selected for output."""
         return self.__Setup.GetComboSelectedForOutput(comboname)
 
+    @modifies_output
     def select_combo(self, comboname: str):
         """sets an load combo selected for output flag."""
-        return self.__Setup.SetComboSelectedForOutput(comboname)
+        _ret = self.__Setup.SetComboSelectedForOutput(comboname)
+        if _ret == 0 and self._selected is not None:
+            self._selected["combos"].add(comboname)
+        return _ret
+
+    def selection(self, refresh: bool = False) -> dict[str, list[str]] | None:
+        """returns the load cases and load combos selected for output, as tracked by `select`.
+
+        The selection is read from SAP2000 once and then kept up to date by the
+        selection methods of this class.
+
+        Args:
+            refresh (bool, optional): if True, re-reads the selection from SAP2000,
+                e.g. after it was changed in the SAP2000 interface.
+        """
+        if refresh or self._selected is None:
+            selected = self.selected_for_output()
+            if selected is None:
+                return None
+            self._selected = {kind: set(names) for kind, names in selected.items()}
+        return {kind: sorted(names) for kind, names in self._selected.items()}
+
+    @smooth_sap_do
+    def select(
+        self, cases: Iterable[str] = (), combos: Iterable[str] = ()
+    ) -> tuple[int, int]:
+        """selects exactly the given load cases and load combos for output.
+
+        Only the cases and combos whose selection differs from the tracked
+        selection (see `selection`) are set or unset, so re-selecting the same
+        cases makes no calls to SAP2000, and leaves `output_revision` unchanged.
+
+        Args:
+            cases (Iterable[str], optional): names of the load cases to select.
+            combos (Iterable[str], optional): names of the load combos to select.
+
+        Returns:
+            tuple[int, int]: number of cases and combos whose selection was changed, and
+                the return code. The decorated call returns the number, or None on failure.
+        """
+        assert self.selection() is not None, "Could not retrieve the output selection"
+        selected = self._selected
+        changed = 0
+        try:
+            for kind, requested, setter in (
+                ("cases", cases, self.__Setup.SetCaseSelectedForOutput),
+                ("combos", combos, self.__Setup.SetComboSelectedForOutput),
+            ):
+                to_select, to_deselect = selection_diff(
+                    current=selected[kind], requested=requested
+                )
+                for name, flag in [
+                    *((name, False) for name in to_deselect),
+                    *((name, True) for name in to_select),
+                ]:
+                    _ret = setter(name, flag)
+                    assert _ret == 0, (
+                        f"{_ret=} when setting output selection of `{name}`"
+                    )
+                    (selected[kind].add if flag else selected[kind].discard)(name)
+                    changed += 1
+        finally:
+            if changed:
+                log.debug(f"Changed the output selection of {changed} cases and combos")
+                output_revision.bump()
+        return changed, 0
+
+    @contextmanager
+    def output_scope(self, names: Iterable[str]) -> Generator[None, Any, None]:
+        """temporarily selects only the given load cases and load combos for output.
+
+        The selection is re-read from SAP2000 on entry and restored on exit, even
+        if an exception is raised.
+
+        Usage:
+            with sap.Results.Setup.output_scope(["DEAD", "LIVE"]):
+                ...
+
+        Args:
+            names (Iterable[str]): names of the load cases and load combos to select.
+        """
+        selected = self.selection(refresh=True)
+        assert selected is not None, "Could not retrieve the output selection"
+        _, combos, _ret = self.SapModel.RespCombo.GetNameList()
+        assert _ret == 0, f"{_ret=} when listing load combos"
+        combos = set(combos or ())
+        names = list(names)
+        try:
+            changed = self.select(
+                cases=[name for name in names if name not in combos],
+                combos=[name for name in names if name in combos],
+            )
+            assert changed is not None, f"Could not select {names} for output"
+            yield
+        finally:
+            log.debug("Restoring the cases selected for output")
+            if self.select(cases=selected["cases"], combos=selected["combos"]) is None:
+                log.error("Could not restore the cases selected for output")
+
+    @smooth_sap_do
+    def selected_for_output(self) -> dict[str, list[str]]:
+        """retrieves the names of all load cases and load combos selected for output."""
+        _, cases, _ret = self.SapModel.LoadCases.GetNameList_1()
+        assert _ret == 0, f"{_ret=} when listing load cases"
+        _, combos, _ret = self.SapModel.RespCombo.GetNameList()
+        assert _ret == 0, f"{_ret=} when listing load combos"
+        return {
+            "cases": [
+                case
+                for case in cases or ()
+                if self.__Setup.GetCaseSelectedForOutput(case)[0]
+            ],
+            "combos": [
+                combo
+                for combo in combos or ()
+                if self.__Setup.GetComboSelectedForOutput(combo)[0]
+            ],
+        }, 0
 
     def base_rxn_loc_get(self):
         """retrieves the global coordinates of the location at which the base reactions are reported."""
         *coord, _ret = self.__Setup.GetOptionBaseReactLoc()
         return {"x": coord[0], "y": coord[1], "z": coord[2]}, _ret
 
+    @modifies_output
     def set_rxn_loc_get(self, x: float, y: float, z: float):
         """sets the global coordinates of the location at which the base reactions are reported."""
         return self.__Setup.SetOptionBaseReactLoc(x, y, z)
+
+    @smooth_sap_do
+    def direct_hist_get(self) -> HistoryOutput_Literals:
+        """retrieves how direct integration time history results are reported."""
+        value, _ret = self.__Setup.GetOptionDirectHist()
+        return typing.get_args(HistoryOutput_Literals)[value - 1], _ret
+
+    @modifies_output
+    @smooth_sap_do
+    def set_direct_hist(self, option: HistoryOutput_Literals):
+        """sets how direct integration time history results are reported."""
+        value = typing.get_args(HistoryOutput_Literals).index(option) + 1
+        return self.__Setup.SetOptionDirectHist(value)
+
+    @smooth_sap_do
+    def modal_hist_get(self) -> HistoryOutput_Literals:
+        """retrieves how modal time history results are reported."""
+        value, _ret = self.__Setup.GetOptionModalHist()
+        return typing.get_args(HistoryOutput_Literals)[value - 1], _ret
+
+    @modifies_output
+    @smooth_sap_do
+    def set_modal_hist(self, option: HistoryOutput_Literals):
+        """sets how modal time history results are reported."""
+        value = typing.get_args(HistoryOutput_Literals).index(option) + 1
+        return self.__Setup.SetOptionModalHist(value)
+
+    @contextmanager
+    def history_scope(
+        self, option: HistoryOutput_Literals = "step-by-step"
+    ) -> Generator[None, Any, None]:
+        """temporarily sets how direct integration and modal time history results are reported.
+
+        Both options are restored on exit, even if an exception is raised.
+
+        Usage:
+            with sap.Results.Setup.history_scope("step-by-step"):
+                ...
+
+        Args:
+            option (HistoryOutput_Literals, optional): one of `envelopes`, `step-by-step` or `last step`.
+        """
+        direct, modal = self.direct_hist_get(), self.modal_hist_get()
+        assert direct is not None and modal is not None, (
+            "Could not retrieve the time history output options"
+        )
+        try:
+            for previous, setter in (
+                (direct, self.set_direct_hist),
+                (modal, self.set_modal_hist),
+            ):
+                if previous != option:
+                    _ret = setter(option)
+                    assert _ret is not None, (
+                        f"Could not set the time history output to `{option}`"
+                    )
+            yield
+        finally:
+            if direct != option:
+                self.set_direct_hist(direct)
+            if modal != option:
+                self.set_modal_hist(modal)
+
+
+def selection_diff(
+    current: Iterable[str], requested: Iterable[str]
+) -> tuple[list[str], list[str]]:
+    """Returns the names to select and to deselect to go from `current` to `requested`.
+
+    Args:
+        current (Iterable[str]): names currently selected for output.
+        requested (Iterable[str]): names to be selected for output.
+
+    Returns:
+        tuple[list[str], list[str]]: names to select, in requested order, and names to deselect, sorted.
+    """
+    current = set(current)
+    requested = list(dict.fromkeys(requested))
+    return (
+        [name for name in requested if name not in current],
+        sorted(current.difference(requested)),
+    )
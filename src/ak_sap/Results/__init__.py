@@ -1 +1,2 @@
 from .main import Results as Results
+from .store import ResultStore as ResultStore
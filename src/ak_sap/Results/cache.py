@@ -0,0 +1,263 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ak_sap.utils import log
+from ak_sap.utils.files import slugify, try_unlink
+
+_FINGERPRINT = "__fingerprint__"
+"""Name of the array holding the analysis fingerprint in each cache file"""
+
+_NULLS = "__nulls__"
+"""Suffix of the arrays marking the null labels of a column in each cache file"""
+
+
+class ResultsCache:
+    """On-disk cache of extracted result arrays, keyed on the analysis state.
+
+    Each result call is stored as an uncompressed `.npz` file of its typed
+    columns (see `parse_results`), one file per model and call. Dense arrays,
+    such as mode shapes, are stored as `.npy` files with a `.json` file of
+    their labels, and are read back as memory maps. Every entry also stores
+    the analysis fingerprint it was extracted under (see
+    `analysis_fingerprint`). An entry whose fingerprint no longer matches,
+    e.g. after cases are re-run or results are deleted, is dropped on read.
+
+    Attributes:
+        directory (Path): Folder the cache files are stored in.
+        hits (int): Number of lookups served from disk.
+        misses (int): Number of lookups that required a call to SAP2000.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initializes the ResultsCache.
+
+        Args:
+            directory (str | Path): Folder to store the cache files in. Created if missing.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"Instance of Results `ResultsCache` at {self.directory}. "
+            f"{self.hits} hits, {self.misses} misses"
+        )
+
+    def path(self, model: str | Path, key: tuple) -> Path:
+        """Returns the cache file of a result call on a model."""
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
+        return self.directory / f"{slugify(Path(model).stem)}-{digest}.npz"
+
+    def get(
+        self, model: str | Path, key: tuple, fingerprint: str
+    ) -> dict[str, np.ndarray] | None:
+        """Reads cached result columns, if extracted under the same fingerprint.
+
+        Args:
+            model (str | Path): Path of the model file.
+            key (tuple): Identifies the result call, e.g. (function, name, item type).
+            fingerprint (str): Current analysis fingerprint of the model.
+
+        Returns:
+            dict[str, np.ndarray] | None: The result columns, or None if not cached or stale.
+        """
+        path = self.path(model=model, key=key)
+        if not path.exists():
+            self.misses += 1
+            return None
+        with np.load(path) as data:
+            if str(data[_FINGERPRINT]) != fingerprint:
+                log.debug(
+                    f"Analysis changed since {path.name} was cached. Dropping it."
+                )
+                columns = None
+            else:
+                columns = {
+                    name: _from_disk(data[name], nulls=data.get(name + _NULLS))
+                    for name in data.files
+                    if name != _FINGERPRINT and not name.endswith(_NULLS)
+                }
+        if columns is None:
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return columns
+
+    def put(
+        self,
+        model: str | Path,
+        key: tuple,
+        fingerprint: str,
+        columns: dict[str, np.ndarray],
+    ) -> None:
+        """Writes result columns to disk.
+
+        The file is written under a temporary name and then moved into place,
+        so an interrupted write never leaves a partial cache file.
+
+        Args:
+            model (str | Path): Path of the model file.
+            key (tuple): Identifies the result call.
+            fingerprint (str): Analysis fingerprint the results were extracted under.
+            columns (dict[str, np.ndarray]): The result columns.
+        """
+        path = self.path(model=model, key=key)
+        arrays = {_FINGERPRINT: np.array(fingerprint)}
+        for name, values in columns.items():
+            arrays[name], nulls = _to_disk(values)
+            if nulls is not None:
+                arrays[name + _NULLS] = nulls
+        temporary = path.with_name(f"{path.name}.tmp")
+        with open(temporary, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(temporary, path)
+        log.debug(f"Cached {key} to {path}")
+
+    def get_array(
+        self, model: str | Path, key: tuple, fingerprint: str
+    ) -> tuple[np.ndarray, dict] | None:
+        """Opens a cached array as a read-only memory map, if stored under the same fingerprint.
+
+        Arrays are stored under a filename that includes the fingerprint, so a
+        stale array that is still memory-mapped never has to be overwritten.
+        Stale arrays of the same call are deleted when possible.
+
+        Args:
+            model (str | Path): Path of the model file.
+            key (tuple): Identifies the result call.
+            fingerprint (str): Current analysis fingerprint of the model.
+
+        Returns:
+            tuple[np.ndarray, dict] | None: The memory-mapped array and its labels,
+                or None if not cached or stale.
+        """
+        path = self.array_path(model=model, key=key, fingerprint=fingerprint)
+        labels_path = path.with_suffix(".json")
+        if not (path.exists() and labels_path.exists()):
+            self._drop_stale(path)
+            self.misses += 1
+            return None
+        labels = json.loads(labels_path.read_text())
+        if labels.pop(_FINGERPRINT, None) != fingerprint:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return np.load(path, mmap_mode="r"), labels
+
+    def put_array(
+        self,
+        model: str | Path,
+        key: tuple,
+        fingerprint: str,
+        values: np.ndarray,
+        labels: dict,
+    ) -> np.ndarray:
+        """Writes an array to disk as a `.npy` file, with its labels in a `.json` file.
+
+        Args:
+            model (str | Path): Path of the model file.
+            key (tuple): Identifies the result call.
+            fingerprint (str): Analysis fingerprint the results were extracted under.
+            values (np.ndarray): The array, of a numeric dtype.
+            labels (dict): JSON serializable labels of the array axes.
+
+        Returns:
+            np.ndarray: The stored array, as a read-only memory map.
+        """
+        path = self.array_path(model=model, key=key, fingerprint=fingerprint)
+        stored = np.lib.format.open_memmap(
+            path, mode="w+", dtype=values.dtype, shape=values.shape
+        )
+        stored[...] = values
+        stored.flush()
+        del stored
+        # Written last, so an interrupted write is read as a miss
+        path.with_suffix(".json").write_text(
+            json.dumps({_FINGERPRINT: fingerprint, **labels})
+        )
+        log.debug(f"Cached {key} to {path}")
+        return np.load(path, mmap_mode="r")
+
+    def array_path(self, model: str | Path, key: tuple, fingerprint: str) -> Path:
+        """Returns the `.npy` file of an array stored under an analysis fingerprint."""
+        path = self.path(model=model, key=key)
+        return path.with_name(f"{path.stem}-{fingerprint[:16]}.npy")
+
+    def clear(self) -> None:
+        """Deletes every cache file in the directory.
+
+        Files that cannot be deleted, e.g. arrays still memory-mapped on
+        Windows, are left in place."""
+        for pattern in ("*.npz", "*.npy", "*.json", "*.tmp"):
+            for path in self.directory.glob(pattern):
+                try_unlink(path)
+
+    def _drop_stale(self, path: Path) -> None:
+        """Deletes the arrays of the same call stored under other fingerprints."""
+        prefix = path.stem.rsplit("-", 1)[0]
+        for stale in self.directory.glob(f"{prefix}-*"):
+            if stale.stem != path.stem and stale.suffix in (".npy", ".json"):
+                log.debug(
+                    f"Analysis changed since {stale.name} was cached. Dropping it."
+                )
+                try_unlink(stale)
+
+
+def analysis_fingerprint(
+    model: str | Path,
+    mtime: float,
+    case_status: dict[str, str],
+    selection: dict[str, list[str]],
+    units: int,
+) -> str:
+    """Returns a hash of everything the extracted results depend on.
+
+    Args:
+        model (str | Path): Path of the model file.
+        mtime (float): Modification time of the model file. SAP2000 saves the model
+            before running the analysis, so a re-run changes it.
+        case_status (dict[str, str]): Status of each load case, see `Analyze.case_status`.
+        selection (dict[str, list[str]]): Cases and combos selected for output.
+        units (int): Present units of the model, as reported by `GetPresentUnits`.
+
+    Returns:
+        str: The fingerprint.
+    """
+    state = {
+        "model": str(Path(model)),
+        "mtime": mtime,
+        "case_status": dict(sorted(case_status.items())),
+        "selection": {key: sorted(value) for key, value in sorted(selection.items())},
+        "units": units,
+    }
+    return hashlib.blake2b(json.dumps(state).encode(), digest_size=16).hexdigest()
+
+
+def _to_disk(values: np.ndarray) -> tuple[np.ndarray, np.ndarray | None]:
+    """Stores label columns as fixed-width unicode, so no pickling is needed.
+
+    Returns the stored column and, if it has any, a mask of its null labels."""
+    if values.dtype != object:
+        return values, None
+    nulls = pd.isna(values)
+    values = values.copy()
+    values[nulls] = ""
+    return values.astype(str), nulls if nulls.any() else None
+
+
+def _from_disk(values: np.ndarray, nulls: np.ndarray | None = None) -> np.ndarray:
+    """Restores label columns as object arrays, as returned by `parse_results`."""
+    if values.dtype.kind != "U":
+        return values
+    values = values.astype(object)
+    if nulls is not None:
+        values[nulls] = None
+    return values
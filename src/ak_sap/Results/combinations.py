@@ -0,0 +1,205 @@
+import typing
+from collections import defaultdict
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
+from ak_sap.Loads.constants import ComboType
+from ak_sap.Loads.types import ComboDefinition
+
+from .types import CaseStack
+
+
+def case_stack(
+    results: pd.DataFrame, fields: tuple[str, ...], by: str = "Joint"
+) -> CaseStack:
+    """Reduces results to the maximum and minimum of each (case, item) over steps.
+
+    Args:
+        results (pd.DataFrame): Results indexed by (`by`, LoadCase, StepNum),
+            e.g. from `Results.joint_results`.
+        fields (tuple[str, ...]): Result components to stack.
+        by (str): Index level identifying an item.
+
+    Returns:
+        CaseStack: The per-case extremes, in the order the cases and items are reported.
+    """
+    item_codes, items = pd.factorize(results.index.get_level_values(by))
+    case_codes, cases = pd.factorize(results.index.get_level_values("LoadCase"))
+    values = results[list(fields)].to_numpy(dtype=float)
+
+    grouped = pd.DataFrame(values).groupby([case_codes, item_codes], sort=False)
+    upper, lower = grouped.max(), grouped.min()
+    c = upper.index.get_level_values(0).to_numpy()
+    i = upper.index.get_level_values(1).to_numpy()
+
+    shape = (len(cases), len(items), len(fields))
+    stack = CaseStack(
+        upper=np.zeros(shape),
+        lower=np.zeros(shape),
+        cases=list(cases),
+        items=list(items),
+        components=tuple(fields),
+        by=by,
+    )
+    stack.upper[c, i] = upper.to_numpy()
+    stack.lower[c, i] = lower.to_numpy()
+    return stack
+
+
+def combine(
+    stack: CaseStack, factors: np.ndarray, combo_type: ComboType = "Linear Additive"
+) -> tuple[np.ndarray, np.ndarray]:
+    """Combines the cases of a stack for many candidate combinations at once.
+
+    Each combination is a row of scale factors over `stack.cases`, so all
+    combinations of a type are evaluated with a few matrix products over the
+    flattened (item, component) axis. A case with a zero factor is not part of
+    the combination. Cases combine the way SAP2000 combines them:
+
+    - Linear Additive: positive factors scale the case maximum into the
+      combination maximum, negative factors scale the case minimum.
+    - Envelope: the extremes of the scaled cases.
+    - Absolute Additive: the sum of the scaled absolute maxima, +/-.
+    - SRSS: the square root of the sum of the squared scaled absolute maxima, +/-.
+    - Range Additive: the sum of the positive maxima and of the negative minima.
+
+    Args:
+        stack (CaseStack): Per-case extremes, see `case_stack`.
+        factors (np.ndarray): Scale factors of shape (combinations, cases), or (cases,)
+            for a single combination.
+        combo_type (ComboType): How the scaled cases are combined.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Maximum and minimum of each combination,
+            of shape (combinations, items, components).
+    """
+    assert combo_type in typing.get_args(ComboType), (
+        f"{combo_type=} must be one of {typing.get_args(ComboType)}"
+    )
+    factors = np.atleast_2d(np.asarray(factors, dtype=float))
+    assert factors.shape[1] == len(stack.cases), (
+        f"Expected {len(stack.cases)} scale factors per combination, got {factors.shape[1]}"
+    )
+    shape = (len(factors), *stack.upper.shape[1:])
+    hi = stack.upper.reshape(len(stack.cases), -1)
+    lo = stack.lower.reshape(len(stack.cases), -1)
+    pos, neg = np.clip(factors, 0, None), np.clip(factors, None, 0)
+
+    if combo_type == "Linear Additive":
+        upper, lower = pos @ hi + neg @ lo, pos @ lo + neg @ hi
+    elif combo_type == "Envelope":
+        upper, lower = _envelope(factors=factors, hi=hi, lo=lo)
+    elif combo_type == "Absolute Additive":
+        upper = np.abs(factors) @ np.maximum(np.abs(hi), np.abs(lo))
+        lower = -upper
+    elif combo_type == "SRSS":
+        upper = np.sqrt(factors**2 @ np.maximum(hi**2, lo**2))
+        lower = -upper
+    else:
+        hi_pos, lo_neg = np.clip(hi, 0, None), np.clip(lo, None, 0)
+        upper, lower = pos @ hi_pos + neg @ lo_neg, pos @ lo_neg + neg @ hi_pos
+    return upper.reshape(shape), lower.reshape(shape)
+
+
+def combine_definitions(
+    stack: CaseStack, definitions: Iterable[ComboDefinition]
+) -> CaseStack:
+    """Evaluates response combination definitions, including nested combinations.
+
+    Combinations are evaluated in rounds: each round combines, per combination
+    type, every definition whose cases and nested combinations are available,
+    then appends the results to the stack so later rounds can reference them.
+
+    Args:
+        stack (CaseStack): Per-case extremes of the load cases, see `case_stack`.
+        definitions (Iterable[ComboDefinition]): The combinations, e.g. from `LoadCombo.get_all`.
+
+    Returns:
+        CaseStack: The extremes of each combination, in the order given.
+
+    Raises:
+        KeyError: If a definition references a case or combination that is not available.
+    """
+    pending = {definition.name: definition for definition in definitions}
+    order = list(pending)
+    available = set(stack.cases)
+    for definition in pending.values():
+        unknown = set(definition.factors) - available - set(pending)
+        if unknown:
+            raise KeyError(
+                f"`{definition.name}` references unknown cases {sorted(unknown)}"
+            )
+
+    resolved = stack
+    while pending:
+        ready = [
+            definition
+            for definition in pending.values()
+            if set(definition.factors) <= set(resolved.cases)
+        ]
+        if not ready:
+            raise KeyError(
+                f"Combinations {sorted(pending)} reference each other in a cycle"
+            )
+        by_type: dict[str, list[ComboDefinition]] = defaultdict(list)
+        for definition in ready:
+            by_type[definition.combo_type].append(definition)
+        for combo_type, group in by_type.items():
+            columns = {case: c for c, case in enumerate(resolved.cases)}
+            factors = np.zeros((len(group), len(resolved.cases)))
+            for row, definition in enumerate(group):
+                for case, sf in definition.factors.items():
+                    factors[row, columns[case]] = sf
+            upper, lower = combine(resolved, factors=factors, combo_type=combo_type)
+            resolved = CaseStack(
+                upper=np.concatenate([resolved.upper, upper]),
+                lower=np.concatenate([resolved.lower, lower]),
+                cases=[*resolved.cases, *(definition.name for definition in group)],
+                items=resolved.items,
+                components=resolved.components,
+                by=resolved.by,
+            )
+            for definition in group:
+                del pending[definition.name]
+
+    keep = [resolved.cases.index(name) for name in order]
+    return CaseStack(
+        upper=resolved.upper[keep],
+        lower=resolved.lower[keep],
+        cases=order,
+        items=resolved.items,
+        components=resolved.components,
+        by=resolved.by,
+    )
+
+
+def _envelope(
+    factors: np.ndarray, hi: np.ndarray, lo: np.ndarray, block: int = 2**18
+) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the extremes of the scaled cases of each combination.
+
+    Combinations are processed in blocks of about `block` values, so the
+    scaled cases stay in cache rather than being written out per case.
+    """
+    upper = np.zeros((len(factors), hi.shape[1]))
+    lower = np.zeros((len(factors), hi.shape[1]))
+    rows = max(1, block // max(hi.shape[1], 1))
+    for start in range(0, len(factors), rows):
+        f = factors[start : start + rows]
+        up = np.full((len(f), hi.shape[1]), -np.inf)
+        low = np.full((len(f), hi.shape[1]), np.inf)
+        scaled = np.empty_like(up)
+        for c in np.flatnonzero((f != 0).any(axis=0)):
+            used = (f[:, c] != 0)[:, None]
+            sf = f[:, c, None]
+            # A negative factor turns the case minimum into the combination maximum
+            np.multiply(sf, np.where(sf > 0, hi[c], lo[c]), out=scaled)
+            np.maximum(up, scaled, out=up, where=used)
+            np.multiply(sf, np.where(sf > 0, lo[c], hi[c]), out=scaled)
+            np.minimum(low, scaled, out=low, where=used)
+        empty = ~(f != 0).any(axis=1)
+        up[empty], low[empty] = 0.0, 0.0
+        upper[start : start + rows], lower[start : start + rows] = up, low
+    return upper, lower
@@ -0,0 +1,145 @@
+from typing import Literal
+
+JointQuantity_Literals = Literal[
+    "displacements", "reactions", "velocities", "accelerations"
+]
+
+ItemTypeElm_Literals = Literal["object", "element", "group", "selection"]
+"""How the `Name` argument of SapOAPI result calls is interpreted, by index"""
+
+HistoryOutput_Literals = Literal["envelopes", "step-by-step", "last step"]
+"""How direct and modal history results are reported, by index from 1"""
+
+RESULT_HEADER_FIELDS = ("ObjectName", "ElementName", "LoadCase", "StepType", "StepNum")
+"""Parallel arrays that precede the result components in point/frame/link results"""
+
+JOINT_RESULT_FUNCTIONS: dict[str, str] = {
+    "displacements": "JointDispl",
+    "reactions": "JointReact",
+    "velocities": "JointVel",
+    "accelerations": "JointAcc",
+}
+"""SapOAPI `Results` function for each joint quantity"""
+
+JOINT_RESULT_FIELDS: dict[str, tuple[str, ...]] = {
+    "displacements": ("U1", "U2", "U3", "R1", "R2", "R3"),
+    "reactions": ("F1", "F2", "F3", "M1", "M2", "M3"),
+    "velocities": ("U1", "U2", "U3", "R1", "R2", "R3"),
+    "accelerations": ("U1", "U2", "U3", "R1", "R2", "R3"),
+}
+"""Result components of each joint quantity, in the point element local axes"""
+
+FRAME_RESULT_HEADER_FIELDS = (
+    "ObjectName",
+    "ObjectStation",
+    "ElementName",
+    "ElementStation",
+    "LoadCase",
+    "StepType",
+    "StepNum",
+)
+"""Parallel arrays that precede the result components in `FrameForce` results"""
+
+AREA_RESULT_HEADER_FIELDS = (
+    "ObjectName",
+    "ElementName",
+    "PointElement",
+    "LoadCase",
+    "StepType",
+    "StepNum",
+)
+"""Parallel arrays that precede the result components in `AreaForceShell` and `LinkForce` results"""
+
+NUMERIC_HEADER_FIELDS = ("ObjectStation", "ElementStation", "StepNum")
+"""Header arrays holding numbers rather than labels"""
+
+FRAME_FORCE_FIELDS = ("P", "V2", "V3", "T", "M2", "M3")
+"""Frame internal forces, in the frame element local axes"""
+
+AREA_FORCE_FIELDS = (
+    "F11",
+    "F22",
+    "F12",
+    "FMax",
+    "FMin",
+    "FAngle",
+    "FVM",
+    "M11",
+    "M22",
+    "M12",
+    "MMax",
+    "MMin",
+    "MAngle",
+    "V13",
+    "V23",
+    "VMax",
+    "VAngle",
+)
+"""Shell resultant forces per unit length, reported at the area element joints"""
+
+LINK_FORCE_FIELDS = ("P", "V2", "V3", "T", "M2", "M3")
+"""Link internal forces at each link element joint, in the link local axes"""
+
+CASE_HEADER_FIELDS = ("LoadCase", "StepType", "StepNum")
+"""Parallel arrays that precede the values in results reported per case rather than per object,
+e.g. `ModalPeriod`, `ModalParticipatingMassRatios` and `BaseReact`"""
+
+MODAL_PERIOD_FIELDS = ("Period", "Frequency", "CircFreq", "EigenValue")
+"""Period [s], cyclic frequency [1/s], circular frequency [rad/s] and eigenvalue [rad²/s²] of each mode"""
+
+MODAL_MASS_RATIO_FIELDS = (
+    "Period",
+    "UX",
+    "UY",
+    "UZ",
+    "SumUX",
+    "SumUY",
+    "SumUZ",
+    "RX",
+    "RY",
+    "RZ",
+    "SumRX",
+    "SumRY",
+    "SumRZ",
+)
+"""Modal participating mass ratios of each mode, and their running sums, in the global axes"""
+
+MODE_SHAPE_FIELDS = ("U1", "U2", "U3", "R1", "R2", "R3")
+"""Mode shape components, in the point element local axes"""
+
+BASE_REACTION_FIELDS = ("FX", "FY", "FZ", "MX", "MY", "MZ")
+"""Base reaction components, in the global axes, with moments about the base reaction location"""
+
+TimeSeriesQuantity_Literals = Literal[
+    "displacements",
+    "reactions",
+    "velocities",
+    "accelerations",
+    "frame_forces",
+    "link_forces",
+]
+
+TIME_SERIES_RESULTS: dict[str, dict] = {
+    **{
+        quantity: {
+            "function": function,
+            "header": RESULT_HEADER_FIELDS,
+            "fields": JOINT_RESULT_FIELDS[quantity],
+            "keys": ("ObjectName",),
+        }
+        for quantity, function in JOINT_RESULT_FUNCTIONS.items()
+    },
+    "frame_forces": {
+        "function": "FrameForce",
+        "header": FRAME_RESULT_HEADER_FIELDS,
+        "fields": FRAME_FORCE_FIELDS,
+        "keys": ("ObjectName", "ObjectStation"),
+    },
+    "link_forces": {
+        "function": "LinkForce",
+        "header": AREA_RESULT_HEADER_FIELDS,
+        "fields": LINK_FORCE_FIELDS,
+        "keys": ("ObjectName", "PointElement"),
+    },
+}
+"""SapOAPI `Results` function, arrays and item keys of each quantity stored by `Results.store_time_history`"""
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+
+
+def assign_levels(
+    z: np.ndarray, tolerance: float = 1e-3
+) -> tuple[np.ndarray, np.ndarray]:
+    """Groups elevations into levels.
+
+    Sorted elevations closer than `tolerance` to the previous one share a level.
+
+    Args:
+        z (np.ndarray): Elevation of each joint.
+        tolerance (float): Largest elevation difference within a level, in model units.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The level index of each joint, and the
+            elevation of each level (its lowest joint), from the bottom up.
+    """
+    z = np.asarray(z, dtype=float)
+    order = np.argsort(z, kind="stable")
+    new_level = np.r_[True, np.diff(z[order]) > tolerance]
+    codes = np.empty(len(z), dtype=int)
+    codes[order] = np.cumsum(new_level) - 1
+    return codes, z[order][new_level]
+
+
+def story_drift(
+    displacements: pd.DataFrame,
+    coordinates: pd.DataFrame,
+    fields: tuple[str, ...] = ("U1", "U2"),
+    tolerance: float = 1e-3,
+) -> pd.DataFrame:
+    """Returns the governing inter-storey drift ratio of each level.
+
+    Joints are grouped into column lines by plan (X, Y) position and into
+    levels by elevation (see `assign_levels`). The drift ratio of a joint is
+    its displacement relative to the next joint below it on the same column
+    line, divided by their elevation difference. Drift ratios are computed for
+    every joint, case and step at once. Each level reports the largest
+    absolute drift ratio of its joints, with the joint, case and step it
+    occurs in. The lowest joint of each column line has no drift ratio.
+
+    Args:
+        displacements (pd.DataFrame): Joint displacements indexed by (Joint, LoadCase, StepNum),
+            e.g. from `Results.joint_results`.
+        coordinates (pd.DataFrame): X, Y and Z of each joint, indexed by joint name.
+        fields (tuple[str, ...]): Displacement components to compute drift ratios of.
+        tolerance (float): Largest difference in plan position or elevation
+            treated as equal, in model units.
+
+    Returns:
+        pd.DataFrame: One row per level that has drift ratios, indexed by elevation `Z`.
+            Columns are (component, measure) for the measures Drift, Joint, LoadCase and StepNum.
+            Drift keeps the sign of the governing value. Empty if there are no results.
+    """
+    measures = ("Drift", "Joint", "LoadCase", "StepNum")
+    columns = pd.MultiIndex.from_product(
+        [fields, measures], names=["Component", "Measure"]
+    )
+    if displacements.empty:
+        return pd.DataFrame(index=pd.Index([], name="Z", dtype=float), columns=columns)
+    joint_codes, joints = pd.factorize(displacements.index.get_level_values("Joint"))
+    # (LoadCase, StepNum) pairs, factorized without building tuples
+    case_codes, case_names = pd.factorize(
+        displacements.index.get_level_values("LoadCase")
+    )
+    num_codes, step_nums = pd.factorize(displacements.index.get_level_values("StepNum"))
+    step_codes, steps = pd.factorize(case_codes * len(step_nums) + num_codes)
+    xyz = coordinates.reindex(joints)[["X", "Y", "Z"]].to_numpy(dtype=float)
+    assert not np.isnan(xyz).any(), "Coordinates are missing for some joints"
+
+    # Dense (joint, step, component) displacements
+    values = np.full((len(joints), len(steps), len(fields)), np.nan)
+    values[joint_codes, step_codes] = displacements[list(fields)].to_numpy(dtype=float)
+
+    # Pair each joint with the joint below it on the same column line
+    line = pd.MultiIndex.from_arrays(
+        [np.round(xyz[:, 0] / tolerance), np.round(xyz[:, 1] / tolerance)]
+    ).factorize()[0]
+    order = np.lexsort((xyz[:, 2], line))
+    same_line = line[order][1:] == line[order][:-1]
+    upper, lower = order[1:][same_line], order[:-1][same_line]
+    height = xyz[upper, 2] - xyz[lower, 2]
+    keep = height > tolerance
+    upper, lower, height = upper[keep], lower[keep], height[keep]
+
+    drift = (values[upper] - values[lower]) / height[:, None, None]
+    level_codes, elevations = assign_levels(xyz[:, 2], tolerance=tolerance)
+    pair_levels = level_codes[upper]
+
+    cases = np.asarray(case_names, dtype=object)[steps // len(step_nums)]
+    step_nums = np.asarray(step_nums, dtype=float)[steps % len(step_nums)]
+    rows = []
+    for level in np.unique(pair_levels):
+        block = drift[pair_levels == level]
+        pairs = upper[pair_levels == level]
+        row = {}
+        for j, field in enumerate(fields):
+            flat = np.nan_to_num(np.abs(block[..., j]), nan=-1.0).reshape(-1)
+            p, s = np.unravel_index(np.argmax(flat), block.shape[:2])
+            row[(field, "Drift")] = block[p, s, j]
+            row[(field, "Joint")] = joints[pairs[p]]
+            row[(field, "LoadCase")] = cases[s]
+            row[(field, "StepNum")] = step_nums[s]
+        rows.append(row)
+    return pd.DataFrame(
+        rows,
+        index=pd.Index(elevations[np.unique(pair_levels)], name="Z", dtype=float),
+        columns=columns,
+    )
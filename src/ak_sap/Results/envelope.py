@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+
+def envelope(
+    results: pd.DataFrame, fields: tuple[str, ...], by: str = "Joint"
+) -> pd.DataFrame:
+    """Reduces results over load cases and steps to max, min and absolute max per item.
+
+    Rows are grouped by item with one stable `np.argsort`. Extremes come from
+    `ufunc.reduceat` over each item's block. The governing row is the first
+    row in each block equal to the extreme, so ties go to the first reported
+    case. NaN values never govern; an item with only NaN values reports NaN
+    from its first row. No Python loop runs per item or per row.
+
+    Args:
+        results (pd.DataFrame): Results indexed by (`by`, LoadCase, StepNum),
+            e.g. from `Results.joint_results`.
+        fields (tuple[str, ...]): Result components to envelope.
+        by (str): Index level identifying an item.
+
+    Returns:
+        pd.DataFrame: One row per item. Columns are (component, measure) for the
+            measures Max, MaxCase, MaxStep, Min, MinCase, MinStep, AbsMax,
+            AbsMaxCase and AbsMaxStep. AbsMax keeps the sign of the governing value.
+    """
+    item_codes, items = pd.factorize(results.index.get_level_values(by))
+    cases = results.index.get_level_values("LoadCase").to_numpy(dtype=object)
+    steps = results.index.get_level_values("StepNum").to_numpy(dtype=float)
+    values = results[list(fields)].to_numpy(dtype=float)
+
+    order = np.argsort(item_codes, kind="stable")
+    group = item_codes[order]
+    counts = np.bincount(item_codes, minlength=len(items))
+    starts = np.cumsum(counts) - counts
+
+    columns: dict[tuple[str, str], np.ndarray] = {}
+    for j, field in enumerate(fields):
+        value = values[order, j]
+        missing = np.isnan(value)
+        for measure, key, reduce in (
+            ("Max", np.where(missing, -np.inf, value), np.maximum),
+            ("Min", np.where(missing, np.inf, value), np.minimum),
+            ("AbsMax", np.where(missing, -1.0, np.abs(value)), np.maximum),
+        ):
+            rows = order[_first_match(key, reduce, group, starts)]
+            columns[(field, measure)] = values[rows, j]
+            columns[(field, f"{measure}Case")] = cases[rows]
+            columns[(field, f"{measure}Step")] = steps[rows]
+    df = pd.DataFrame(columns, index=pd.Index(items, name=by))
+    df.columns = pd.MultiIndex.from_tuples(df.columns, names=["Component", "Measure"])
+    return df
+
+
+def _first_match(
+    key: np.ndarray, reduce: np.ufunc, group: np.ndarray, starts: np.ndarray
+) -> np.ndarray:
+    """Returns the position of the first extreme of `key` in each block of `group`."""
+    if len(key) == 0:
+        return np.empty(0, dtype=int)
+    extreme = reduce.reduceat(key, starts)
+    hits = np.flatnonzero(key == extreme[group])
+    hit_groups = group[hits]
+    return hits[np.r_[True, hit_groups[1:] != hit_groups[:-1]]]
@@ -1,9 +1,47 @@
-from typing import Literal
+import typing
+from collections.abc import Generator
+from contextlib import closing, nullcontext
+from pathlib import Path
+from typing import Any, Literal
 
-from ak_sap.utils import MasterClass
-from ak_sap.utils.decorators import smooth_sap_do
+import numpy as np
+import pandas as pd
 
+from ak_sap.Analyze.main import case_status
+from ak_sap.Loads.LoadCombos import LoadCombo
+from ak_sap.Loads.types import ComboDefinition
+from ak_sap.utils import MasterClass, log
+from ak_sap.utils.decorators import modifies_model, smooth_sap_do
+from ak_sap.utils.revision import revisions
+
+from .cache import ResultsCache, analysis_fingerprint
+from .combinations import case_stack, combine_definitions
+from .constants import (
+    AREA_FORCE_FIELDS,
+    AREA_RESULT_HEADER_FIELDS,
+    BASE_REACTION_FIELDS,
+    CASE_HEADER_FIELDS,
+    FRAME_FORCE_FIELDS,
+    FRAME_RESULT_HEADER_FIELDS,
+    JOINT_RESULT_FIELDS,
+    JOINT_RESULT_FUNCTIONS,
+    LINK_FORCE_FIELDS,
+    MODAL_MASS_RATIO_FIELDS,
+    MODAL_PERIOD_FIELDS,
+    MODE_SHAPE_FIELDS,
+    NUMERIC_HEADER_FIELDS,
+    RESULT_HEADER_FIELDS,
+    TIME_SERIES_RESULTS,
+    ItemTypeElm_Literals,
+    JointQuantity_Literals,
+    TimeSeriesQuantity_Literals,
+)
+from .drift import story_drift
+from .envelope import envelope
+from .modal import modal_frame, mode_shapes
 from .Setup import ResultsSetup
+from .store import ResultStore, time_series
+from .types import CaseStack, FrameForces, ModalResults, ModeShapes
 
 
 class Results(MasterClass):
@@ -12,7 +50,92 @@ class Results(MasterClass):
         self.__Results = mySapObject.SapModel.Results
 
         self.Setup = ResultsSetup(mySapObject=mySapObject)
+        self.__LoadCombo = LoadCombo(mySapObject=mySapObject)
+        self.cache: ResultsCache | None = None
+        self._fingerprint: tuple[tuple, str] | None = None
+
+    def enable_cache(self, directory: str | Path | None = None) -> None:
+        """Enables the on-disk cache of bulk result extractions.
+
+        `joint_results`, `frame_forces`, `area_forces` and `link_forces` are
+        stored per model and keyed on the model file, its modification time,
+        the case status, the cases and combos selected for output and the
+        present units. Cached results are dropped once any of these change.
+        Calls with `selection=True` are not cached.
+
+        Args:
+            directory (str | Path | None): Folder for the cache files. Defaults to
+                `.ak_sap_cache` next to the model file.
+        """
+        if directory is None:
+            directory = Path(self.SapModel.GetModelFilename()).parent / ".ak_sap_cache"
+        log.info(f"Enabling results cache in {directory}")
+        self.cache = ResultsCache(directory=directory)
+
+    def disable_cache(self) -> None:
+        """Disables the on-disk results cache. Cache files are kept."""
+        log.info("Disabling results cache")
+        self.cache = None
+
+    def fingerprint(self) -> str:
+        """Returns a hash of the analysis state the current results depend on.
+
+        Reading the output selection takes a call per load case and combo, so
+        the fingerprint is memoized until the model file, case status or units
+        change, or a wrapper call modifies the model or the output selection.
+        A selection changed in the SAP2000 interface is picked up at the next
+        of these changes.
+        """
+        model = self.SapModel.GetModelFilename()
+        state = (
+            revisions(),
+            model,
+            Path(model).stat().st_mtime if Path(model).is_file() else 0.0,
+            case_status(ret=self.SapModel.Analyze.GetCaseStatus()),
+            self.SapModel.GetPresentUnits(),
+        )
+        if self._fingerprint is None or self._fingerprint[0] != state:
+            _, model, mtime, status, units = state
+            fingerprint = analysis_fingerprint(
+                model=model,
+                mtime=mtime,
+                case_status=status,
+                selection=self.Setup.selected_for_output() or {},
+                units=units,
+            )
+            self._fingerprint = state, fingerprint
+        return self._fingerprint[1]
+
+    def _columns(
+        self,
+        function: str,
+        group: str,
+        selection: bool,
+        fields: tuple[str, ...],
+        header: tuple[str, ...] = RESULT_HEADER_FIELDS,
+    ) -> dict[str, np.ndarray]:
+        """Calls a SapOAPI result function by group or selection; Returns its typed columns.
+
+        Served from the results cache, if enabled and still valid. Calls by
+        selection always go to SAP2000, since the object selection is not part
+        of the cache key."""
+        item_type = _item_type(selection)
+        if self.cache is None or selection:
+            ret = getattr(self.__Results, function)(group, item_type)
+            return _result_columns(ret=ret, fields=fields, header=header)
 
+        model, key = self.SapModel.GetModelFilename(), (function, group, item_type)
+        fingerprint = self.fingerprint()
+        columns = self.cache.get(model=model, key=key, fingerprint=fingerprint)
+        if columns is None:
+            ret = getattr(self.__Results, function)(group, item_type)
+            columns = _result_columns(ret=ret, fields=fields, header=header)
+            self.cache.put(
+                model=model, key=key, fingerprint=fingerprint, columns=columns
+            )
+        return columns
+
+    @modifies_model
     @smooth_sap_do
     def delete(self, casename: str | Literal["All"]) -> bool:
         """deletes results for load cases.
@@ -20,7 +143,7 @@ class Results(MasterClass):
         Args:
             casename (str | Literal['All']): name of an existing load case that is to have its results deleted.
         """
-        return self.mySapObject.SapModel.Analyze.DeleteResykts(
+        return self.mySapObject.SapModel.Analyze.DeleteResults(
             casename, casename.casefold() == "all"
         )  # type: ignore
 
@@ -62,114 +185,673 @@ class Results(MasterClass):
         """
         return joint_displacements_parse(ret=self.__Results.JointVel(jointname, 1)), 0  # type: ignore
 
+    @smooth_sap_do
+    def joint_results(
+        self,
+        quantity: JointQuantity_Literals,
+        group: str = "All",
+        selection: bool = False,
+    ) -> pd.DataFrame:
+        """reports a joint result quantity for every joint in a group with a single call.
 
-def joint_displacements_parse(ret: list) -> list[dict]:
-    assert ret[-1] == 0
-    displacements: list[dict] = []
+        Args:
+            quantity (JointQuantity_Literals): one of `displacements`, `reactions`, `velocities` or `accelerations`.
+            group (str, optional): name of an existing group. Defaults to "All".
+            selection (bool, optional): if True, reports the selected joints instead of `group`.
 
-    if ret[0] == 1:
-        return [
-            {
-                "ObjectName": ret[
-                    1
-                ],  # the point object name associated with each result, if any.
-                "ElementName": ret[
-                    2
-                ],  # the point element name associated with each result.
-                "LoadCase": ret[
-                    3
-                ],  # name of the analysis case or load combination associated with each result.
-                "StepType": ret[4],  # step type, if any, for each result.
-                "StepNum": ret[5],  # includes the step number, if any, for each result.
-                "U1": ret[6],  # displacement in the point element local 1 axis
-                "U2": ret[7],  # displacement in the point element local 2 axis
-                "U3": ret[8],  # displacement in the point element local 3 axis
-                "R1": ret[9],  # rotation about the point element local 1 axis
-                "R2": ret[10],  # rotation about the point element local 2 axis
-                "R3": ret[11],  # rotation about the point element local 3 axis
-            }
-        ]
-    for idx in range(ret[0]):
-        displacements.append(
-            {
-                "ObjectName": ret[1][
-                    idx
-                ],  # the point object name associated with each result, if any.
-                "ElementName": ret[2][
-                    idx
-                ],  # the point element name associated with each result.
-                "LoadCase": ret[3][
-                    idx
-                ],  # name of the analysis case or load combination associated with each result.
-                "StepType": ret[4][idx],  # step type, if any, for each result.
-                "StepNum": ret[5][
-                    idx
-                ],  # includes the step number, if any, for each result.
-                "U1": ret[6][idx],  # displacement in the point element local 1 axis
-                "U2": ret[7][idx],  # displacement in the point element local 2 axis
-                "U3": ret[8][idx],  # displacement in the point element local 3 axis
-                "R1": ret[9][idx],  # rotation about the point element local 1 axis
-                "R2": ret[10][idx],  # rotation about the point element local 2 axis
-                "R3": ret[11][idx],  # rotation about the point element local 3 axis
-            }
+        Returns:
+            pd.DataFrame: one row per result, indexed by (Joint, LoadCase, StepNum).
+        """
+        assert quantity in JOINT_RESULT_FUNCTIONS, (
+            f"{quantity=} must be one of {list(JOINT_RESULT_FUNCTIONS)}"
+        )
+        columns = self._columns(
+            function=JOINT_RESULT_FUNCTIONS[quantity],
+            group=group,
+            selection=selection,
+            fields=JOINT_RESULT_FIELDS[quantity],
         )
-    return displacements
+        return _joint_frame(columns=columns), 0
 
+    def iter_joint_results(
+        self,
+        quantity: JointQuantity_Literals,
+        group: str = "All",
+        cases: list[str] | None = None,
+        window: int | None = None,
+    ) -> Generator[tuple[str, np.ndarray], Any, None]:
+        """yields a joint result quantity for every joint in a group, one load case at a time.
 
-def joint_reactions_parse(ret: list) -> list[dict]:
-    assert ret[-1] == 0
-    loads: list[dict] = []
+        Only one case or combo is selected for output per call, so the memory held
+        is bounded by the largest single case (e.g. one time history), not by all
+        of them. The output selection is restored once the generator finishes or
+        is closed. With `window`, each case is still retrieved with one call, but
+        yielded in blocks of consecutive steps.
 
-    if ret[0] == 1:
-        return [
-            {
-                "ObjectName": ret[
-                    1
-                ],  # the point object name associated with each result, if any.
-                "ElementName": ret[
-                    2
-                ],  # the point element name associated with each result.
-                "LoadCase": ret[
-                    3
-                ],  # name of the analysis case or load combination associated with each result.
-                "StepType": ret[4],  # step type, if any, for each result.
-                "StepNum": ret[5],  # includes the step number, if any, for each result.
-                "F1": ret[6],  # reaction forces in the point element local 1 axis
-                "F2": ret[7],  # reaction forces in the point element local 2 axis
-                "F3": ret[8],  # reaction forces in the point element local 3 axis
-                "M1": ret[9],  # reaction moments about the point element local 1 axis
-                "M2": ret[10],  # reaction moments about the point element local 2 axis
-                "M3": ret[11],  # reaction moments about the point element local 3 axis
-            }
+        Args:
+            quantity (JointQuantity_Literals): one of `displacements`, `reactions`, `velocities` or `accelerations`.
+            group (str, optional): name of an existing group. Defaults to "All".
+            cases (list[str] | None, optional): load cases and combos to report, in order.
+                Defaults to those currently selected for output.
+            window (int | None, optional): number of steps per yielded block. Whole cases if None.
+
+        Yields:
+            tuple[str, np.ndarray]: the case name and its results as a structured array (see `parse_results`).
+        """
+        assert quantity in JOINT_RESULT_FUNCTIONS, (
+            f"{quantity=} must be one of {list(JOINT_RESULT_FUNCTIONS)}"
+        )
+        assert window is None or window > 0, (
+            f"{window=} must be a positive number of steps"
+        )
+        fields = JOINT_RESULT_FIELDS[quantity]
+        for case, ret in self._iter_cases(
+            function=JOINT_RESULT_FUNCTIONS[quantity], group=group, cases=cases
+        ):
+            results = parse_results(ret=ret, fields=fields)
+            if window is None:
+                yield case, results
+                continue
+            for block in step_windows(results, window=window):
+                yield case, block
+
+    def _iter_cases(
+        self, function: str, group: str, cases: list[str] | None
+    ) -> Generator[tuple[str, list], Any, None]:
+        """Calls a SapOAPI result function by group with one case or combo selected at a time.
+
+        Yields the case name and the raw return value. The output selection is
+        restored once the generator finishes or is closed."""
+        selected = self.Setup.selection(refresh=True)
+        assert selected is not None, "Could not retrieve the cases selected for output"
+        _, combos, _ret = self.SapModel.RespCombo.GetNameList()
+        assert _ret == 0, f"{_ret=} when listing load combos"
+        combos = set(combos or ())
+        if cases is None:
+            cases = [*selected["cases"], *selected["combos"]]
+
+        call = getattr(self.__Results, function)
+        try:
+            for case in cases:
+                if case in combos:
+                    changed = self.Setup.select(combos=[case])
+                else:
+                    changed = self.Setup.select(cases=[case])
+                assert changed is not None, f"Could not select `{case}` for output"
+                log.debug(f"Calling `{function}` for `{case}`")
+                yield case, call(group, _item_type(selection=False))
+        finally:
+            log.debug("Restoring the cases selected for output")
+            restored = self.Setup.select(
+                cases=selected["cases"], combos=selected["combos"]
+            )
+            if restored is None:
+                log.error("Could not restore the cases selected for output")
+
+    def store_time_history(
+        self,
+        store: ResultStore | str | Path,
+        quantity: TimeSeriesQuantity_Literals,
+        cases: list[str],
+        group: str = "All",
+    ) -> ResultStore:
+        """writes the time series of a result quantity to a chunked, memory-mapped `ResultStore`.
+
+        Cases are retrieved one at a time (see `iter_joint_results`) and written
+        to the series `<quantity>/<case>` as (step, item, component) arrays.
+        SAP2000 reports a case with a single call, so each case is fully
+        materialised in memory before it is written in chunks; memory is bounded
+        by the largest case, not by all of them. Items are joints for joint
+        quantities, (frame, station) pairs for `frame_forces` and (link, point)
+        pairs for `link_forces`.
+
+        Direct and modal history results are reported step-by-step for the
+        duration of the call (see `Setup.history_scope`). Each case is written
+        under a temporary name and then replaces any existing series of the same
+        name, so a failed call leaves the stored series as they were.
+
+        Args:
+            store (ResultStore | str | Path): the store, or the directory to open one in.
+            quantity (TimeSeriesQuantity_Literals): a joint quantity, `frame_forces` or `link_forces`.
+            cases (list[str]): time history load cases to store.
+            group (str, optional): name of an existing group. Defaults to "All".
+
+        Returns:
+            ResultStore: the store, see `ResultStore.open` to read a series back.
+        """
+        assert quantity in TIME_SERIES_RESULTS, (
+            f"{quantity=} must be one of {list(TIME_SERIES_RESULTS)}"
+        )
+        if not isinstance(store, ResultStore):
+            store = ResultStore(path=store)
+        spec = TIME_SERIES_RESULTS[quantity]
+        with (
+            self.Setup.history_scope("step-by-step"),
+            closing(
+                self._iter_cases(function=spec["function"], group=group, cases=cases)
+            ) as results,
+        ):
+            for case, ret in results:
+                columns = _result_columns(
+                    ret=ret, fields=spec["fields"], header=spec["header"]
+                )
+                values, items, steps = time_series(
+                    columns=columns, keys=spec["keys"], fields=spec["fields"]
+                )
+                name, temporary = f"{quantity}/{case}", f"{quantity}/{case}.partial"
+                store.delete(temporary)
+                store.write(
+                    temporary,
+                    values,
+                    items=items,
+                    components=spec["fields"],
+                    steps=steps,
+                )
+                store.rename(temporary, name)
+                log.info(f"Stored {len(steps)} steps of `{name}` in {store.path}")
+        return store
+
+    @smooth_sap_do
+    def envelope(
+        self,
+        quantity: JointQuantity_Literals,
+        items: str | list[str] = "All",
+        cases: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """reports the max, min and absolute max of a joint result quantity over cases and steps.
+
+        With `cases`, only those cases are selected for output while the results are
+        retrieved (see `Setup.output_scope`). A list of joints is retrieved with one
+        call per joint object rather than one call for the whole model.
+
+        Args:
+            quantity (JointQuantity_Literals): one of `displacements`, `reactions`, `velocities` or `accelerations`.
+            items (str | list[str], optional): name of an existing group, or a list of joint names. Defaults to "All".
+            cases (list[str] | None, optional): load cases and combos to envelope. The cases selected for output if None.
+
+        Returns:
+            pd.DataFrame: one row per joint; columns are (component, measure) with the governing case and step of each measure.
+        """
+        assert quantity in JOINT_RESULT_FUNCTIONS, (
+            f"{quantity=} must be one of {list(JOINT_RESULT_FUNCTIONS)}"
+        )
+        scope = self.Setup.output_scope(cases) if cases is not None else nullcontext()
+        with scope:
+            if isinstance(items, str):
+                results = self.joint_results(quantity=quantity, group=items)
+                assert results is not None, f"Could not retrieve joint {quantity}"
+            else:
+                results = self._object_results(quantity=quantity, names=items)
+        return envelope(results, fields=JOINT_RESULT_FIELDS[quantity]), 0
+
+    def _object_results(
+        self, quantity: JointQuantity_Literals, names: list[str]
+    ) -> pd.DataFrame:
+        """Reports a joint result quantity for a list of joints, with one call per joint object."""
+        assert len(names) > 0, "No joints given"
+        call = getattr(self.__Results, JOINT_RESULT_FUNCTIONS[quantity])
+        item_type = typing.get_args(ItemTypeElm_Literals).index("object")
+        parts = [
+            _result_columns(
+                ret=call(name, item_type), fields=JOINT_RESULT_FIELDS[quantity]
+            )
+            for name in dict.fromkeys(names)
         ]
-    for idx in range(ret[0]):
-        loads.append(
-            {
-                "ObjectName": ret[1][
-                    idx
-                ],  # the point object name associated with each result, if any.
-                "ElementName": ret[2][
-                    idx
-                ],  # the point element name associated with each result.
-                "LoadCase": ret[3][
-                    idx
-                ],  # name of the analysis case or load combination associated with each result.
-                "StepType": ret[4][idx],  # step type, if any, for each result.
-                "StepNum": ret[5][
-                    idx
-                ],  # includes the step number, if any, for each result.
-                "F1": ret[6][idx],  # reaction forces in the point element local 1 axis
-                "F2": ret[7][idx],  # reaction forces in the point element local 2 axis
-                "F3": ret[8][idx],  # reaction forces in the point element local 3 axis
-                "M1": ret[9][
-                    idx
-                ],  # reaction moments about the point element local 1 axis
-                "M2": ret[10][
-                    idx
-                ],  ##reaction moments about the point element local 2 axis
-                "M3": ret[11][
-                    idx
-                ],  ##reaction moments about the point element local 3 axis
+        return _joint_frame(
+            columns={
+                name: np.concatenate([part[name] for part in parts])
+                for name in parts[0]
             }
         )
-    return loads
+
+    @smooth_sap_do
+    def case_stack(
+        self,
+        quantity: JointQuantity_Literals,
+        group: str = "All",
+        cases: list[str] | None = None,
+    ) -> CaseStack:
+        """reports the max and min of a joint result quantity per load case, for local combination.
+
+        Args:
+            quantity (JointQuantity_Literals): one of `displacements`, `reactions`, `velocities` or `accelerations`.
+            group (str, optional): name of an existing group. Defaults to "All".
+            cases (list[str] | None, optional): load cases to stack. All reported cases if None.
+
+        Returns:
+            CaseStack: (case, joint, component) arrays of the per-case extremes.
+        """
+        results = self.joint_results(quantity=quantity, group=group)
+        assert results is not None, f"Could not retrieve joint {quantity}"
+        if cases is not None:
+            results = results[results.index.get_level_values("LoadCase").isin(cases)]
+        return case_stack(results, fields=JOINT_RESULT_FIELDS[quantity]), 0
+
+    @smooth_sap_do
+    def combine(
+        self,
+        quantity: JointQuantity_Literals,
+        combos: list[ComboDefinition] | None = None,
+        group: str = "All",
+    ) -> CaseStack:
+        """combines joint results of the load cases locally, without running SAP2000 combinations.
+
+        Only the load cases used by the combinations are selected for output while
+        the results are retrieved (see `Setup.output_scope`); the output selection
+        is restored afterwards.
+
+        Args:
+            quantity (JointQuantity_Literals): one of `displacements`, `reactions`, `velocities` or `accelerations`.
+            combos (list[ComboDefinition] | None, optional): combinations to evaluate.
+                Defaults to the response combinations defined in the model.
+            group (str, optional): name of an existing group. Defaults to "All".
+
+        Returns:
+            CaseStack: (combo, joint, component) arrays of the max and min of each combination.
+        """
+        if combos is None:
+            combos = list(self.__LoadCombo.get_all().values())
+        cases = list(dict.fromkeys(case for combo in combos for case in combo.cases))
+        with self.Setup.output_scope(cases):
+            stack = self.case_stack(quantity=quantity, group=group, cases=cases)
+        assert stack is not None, f"Could not retrieve joint {quantity}"
+        return combine_definitions(stack, definitions=combos), 0
+
+    @smooth_sap_do
+    def modal(
+        self, case: str = "MODAL", group: str = "All", shapes: bool = True
+    ) -> ModalResults:
+        """reports the periods, participating mass ratios and mode shapes of a modal load case.
+
+        Only `case` is selected for output while the results are retrieved (see
+        `Setup.output_scope`); the output selection is restored afterwards. Mode
+        shapes are retrieved for all joints in `group` with a single call. With the results cache
+        enabled, they are stored as a `.npy` file and returned as a read-only
+        memory map, so repeated post-processing does not re-read them.
+
+        Args:
+            case (str, optional): name of an existing modal load case. Defaults to "MODAL".
+            group (str, optional): name of an existing group for the mode shapes. Defaults to "All".
+            shapes (bool, optional): if False, skips the mode shapes.
+
+        Returns:
+            ModalResults: periods and participation tables indexed by (LoadCase, Mode),
+                and the (mode, joint, dof) mode shapes.
+        """
+        with self.Setup.output_scope([case]):
+            periods = modal_frame(
+                _result_columns(
+                    ret=self.__Results.ModalPeriod(),
+                    fields=MODAL_PERIOD_FIELDS,
+                    header=CASE_HEADER_FIELDS,
+                )
+            )
+            participation = modal_frame(
+                _result_columns(
+                    ret=self.__Results.ModalParticipatingMassRatios(),
+                    fields=MODAL_MASS_RATIO_FIELDS,
+                    header=CASE_HEADER_FIELDS,
+                )
+            )
+            modeshapes = self._mode_shapes(case=case, group=group) if shapes else None
+        return ModalResults(
+            periods=periods, participation=participation, shapes=modeshapes
+        ), 0
+
+    def _mode_shapes(self, case: str, group: str) -> ModeShapes:
+        """Retrieves the mode shapes of a modal case, through the results cache if enabled."""
+        if self.cache is None:
+            columns = _result_columns(
+                ret=self.__Results.ModeShape(group, _item_type(selection=False)),
+                fields=MODE_SHAPE_FIELDS,
+            )
+            return mode_shapes(columns=columns, case=case)
+
+        model, key = self.SapModel.GetModelFilename(), ("ModeShape", case, group)
+        fingerprint = self.fingerprint()
+        cached = self.cache.get_array(model=model, key=key, fingerprint=fingerprint)
+        if cached is not None:
+            values, labels = cached
+            return ModeShapes(
+                values=values,
+                modes=labels["modes"],
+                joints=labels["joints"],
+                dofs=tuple(labels["dofs"]),
+                case=case,
+            )
+        columns = _result_columns(
+            ret=self.__Results.ModeShape(group, _item_type(selection=False)),
+            fields=MODE_SHAPE_FIELDS,
+        )
+        shapes = mode_shapes(columns=columns, case=case)
+        shapes.values = self.cache.put_array(
+            model=model,
+            key=key,
+            fingerprint=fingerprint,
+            values=shapes.values,
+            labels={
+                "modes": shapes.modes,
+                "joints": shapes.joints,
+                "dofs": shapes.dofs,
+            },
+        )
+        return shapes
+
+    @smooth_sap_do
+    def story_drift(
+        self,
+        group: str = "All",
+        cases: list[str] | None = None,
+        fields: tuple[str, ...] = ("U1", "U2"),
+        tolerance: float = 1e-3,
+    ) -> pd.DataFrame:
+        """reports the governing inter-storey drift ratio of each level, over all cases and steps.
+
+        Joint coordinates are read with a single `GetAllPoints` call and joint
+        displacements with a single `JointDispl` call, see `drift.story_drift`.
+        Components are in the joint local axes, which match the global axes
+        for joints that are not rotated.
+
+        Args:
+            group (str, optional): name of an existing group of the joints to include. Defaults to "All".
+            cases (list[str] | None, optional): load cases and combos to include, selected for output
+                while the displacements are retrieved. The cases selected for output if None.
+            fields (tuple[str, ...], optional): displacement components. Defaults to ("U1", "U2").
+            tolerance (float, optional): largest difference in plan position or elevation treated as equal,
+                in present units. Defaults to 1e-3.
+
+        Returns:
+            pd.DataFrame: one row per level, indexed by elevation `Z`; columns are (component, measure)
+                with the governing drift ratio and its joint, case and step.
+        """
+        scope = self.Setup.output_scope(cases) if cases is not None else nullcontext()
+        with scope:
+            displacements = self.joint_results(quantity="displacements", group=group)
+        assert displacements is not None, "Could not retrieve joint displacements"
+        _, names, x, y, z, _ret = self.SapModel.PointObj.GetAllPoints()
+        assert _ret == 0, f"{_ret=} when retrieving joint coordinates"
+        coordinates = pd.DataFrame({"X": x, "Y": y, "Z": z}, index=list(names))
+        return story_drift(
+            displacements, coordinates=coordinates, fields=fields, tolerance=tolerance
+        ), 0
+
+    @smooth_sap_do
+    def base_reactions(
+        self, location: tuple[float, float, float] | None = None
+    ) -> pd.DataFrame:
+        """reports the base reactions of the cases and combos selected for output.
+
+        Args:
+            location (tuple[float, float, float] | None, optional): global (x, y, z) to report the
+                moments about. The base reaction location set in `Setup` is used if None;
+                otherwise it is set for this call and restored afterwards.
+
+        Returns:
+            pd.DataFrame: FX, FY, FZ, MX, MY and MZ indexed by (LoadCase, StepNum), with the
+                reporting location in `DataFrame.attrs["location"]`.
+        """
+        previous = None
+        if location is not None:
+            previous, _ret = self.Setup.base_rxn_loc_get()
+            assert _ret == 0, f"{_ret=} when retrieving the base reaction location"
+            self.Setup.set_rxn_loc_get(*location)
+        try:
+            ret = self.__Results.BaseReact()
+        finally:
+            if previous is not None:
+                self.Setup.set_rxn_loc_get(**previous)
+        return base_reactions_parse(ret=ret), 0
+
+    @smooth_sap_do
+    def frame_forces(self, group: str = "All", selection: bool = False) -> FrameForces:
+        """reports the frame internal forces at every output station of the frames in a group.
+
+        Args:
+            group (str, optional): name of an existing group. Defaults to "All".
+            selection (bool, optional): if True, reports the selected frames instead of `group`.
+
+        Returns:
+            FrameForces: dense (frame, station, case, component) array of P, V2, V3, T, M2 and M3.
+        """
+        columns = self._columns(
+            function="FrameForce",
+            group=group,
+            selection=selection,
+            fields=FRAME_FORCE_FIELDS,
+            header=FRAME_RESULT_HEADER_FIELDS,
+        )
+        return _frame_forces(columns=columns), 0
+
+    @smooth_sap_do
+    def area_forces(self, group: str = "All", selection: bool = False) -> pd.DataFrame:
+        """reports the shell resultant forces of the area elements in a group.
+
+        Args:
+            group (str, optional): name of an existing group. Defaults to "All".
+            selection (bool, optional): if True, reports the selected areas instead of `group`.
+
+        Returns:
+            pd.DataFrame: one row per result, indexed by (Area, Point, LoadCase, StepNum).
+        """
+        columns = self._columns(
+            function="AreaForceShell",
+            group=group,
+            selection=selection,
+            fields=AREA_FORCE_FIELDS,
+            header=AREA_RESULT_HEADER_FIELDS,
+        )
+        return _element_frame(columns=columns, label="Area"), 0
+
+    @smooth_sap_do
+    def link_forces(self, group: str = "All", selection: bool = False) -> pd.DataFrame:
+        """reports the link internal forces at each end of the link elements in a group.
+
+        Args:
+            group (str, optional): name of an existing group. Defaults to "All".
+            selection (bool, optional): if True, reports the selected links instead of `group`.
+
+        Returns:
+            pd.DataFrame: one row per result, indexed by (Link, Point, LoadCase, StepNum).
+        """
+        columns = self._columns(
+            function="LinkForce",
+            group=group,
+            selection=selection,
+            fields=LINK_FORCE_FIELDS,
+            header=AREA_RESULT_HEADER_FIELDS,
+        )
+        return _element_frame(columns=columns, label="Link"), 0
+
+
+def _item_type(selection: bool) -> int:
+    """Returns the ItemTypeElm of a result call by group, or by selection."""
+    return typing.get_args(ItemTypeElm_Literals).index(
+        "selection" if selection else "group"
+    )
+
+
+def parse_results(
+    ret: list, fields: tuple[str, ...], header: tuple[str, ...] = RESULT_HEADER_FIELDS
+) -> np.ndarray:
+    """Converts the parallel result arrays of a SapOAPI result call to a structured array.
+
+    Each array is copied once into a typed column, so no per-row Python
+    objects are created. Labels keep references to the reported strings,
+    `StepNum` and the result components are stored as float64.
+
+    Args:
+        ret (list): return value of the call, i.e. (NumberResults, ObjectName, ElementName,
+            LoadCase, StepType, StepNum, *components, ret).
+        fields (tuple[str, ...]): names of the result components.
+        header (tuple[str, ...]): names of the arrays preceding the components.
+
+    Returns:
+        np.ndarray: structured array of `NumberResults` records.
+    """
+    columns = _result_columns(ret=ret, fields=fields, header=header)
+    results = np.zeros(ret[0], dtype=[(name, a.dtype) for name, a in columns.items()])
+    for name, values in columns.items():
+        results[name] = values
+    return results
+
+
+def step_windows(results: np.ndarray, window: int) -> list[np.ndarray]:
+    """Splits a structured result array into blocks of consecutive steps.
+
+    Args:
+        results (np.ndarray): structured array with a `StepNum` field, see `parse_results`.
+        window (int): number of distinct steps per block.
+
+    Returns:
+        list[np.ndarray]: blocks in increasing step order; rows keep their reported order within a block.
+    """
+    steps, codes = np.unique(results["StepNum"], return_inverse=True)
+    blocks = codes.reshape(-1) // window
+    order = np.argsort(blocks, kind="stable")
+    bounds = np.searchsorted(blocks[order], np.arange(1, -(-len(steps) // window)))
+    return np.split(results[order], bounds)
+
+
+def joint_results_frame(ret: list, fields: tuple[str, ...]) -> pd.DataFrame:
+    """Converts the parallel result arrays of a SapOAPI joint result call to a DataFrame.
+
+    Args:
+        ret (list): return value of the call, see `parse_results`.
+        fields (tuple[str, ...]): names of the result components.
+
+    Returns:
+        pd.DataFrame: one column per array, indexed by (Joint, LoadCase, StepNum).
+    """
+    return _joint_frame(columns=_result_columns(ret=ret, fields=fields))
+
+
+def _joint_frame(columns: dict[str, np.ndarray]) -> pd.DataFrame:
+    df = pd.DataFrame(columns, copy=False).rename(columns={"ObjectName": "Joint"})
+    return df.set_index(["Joint", "LoadCase", "StepNum"])
+
+
+def base_reactions_parse(ret: list) -> pd.DataFrame:
+    """Converts the result arrays of a SapOAPI `BaseReact` call to a DataFrame.
+
+    Args:
+        ret (list): return value of the call, i.e. (NumberResults, LoadCase, StepType, StepNum,
+            FX, FY, FZ, MX, MY, MZ, gx, gy, gz, ret).
+
+    Returns:
+        pd.DataFrame: one row per result, indexed by (LoadCase, StepNum), with the
+            reporting location (gx, gy, gz) in `DataFrame.attrs["location"]`.
+    """
+    *arrays, gx, gy, gz, _ret = ret
+    columns = _result_columns(
+        ret=[*arrays, _ret], fields=BASE_REACTION_FIELDS, header=CASE_HEADER_FIELDS
+    )
+    df = pd.DataFrame(columns, copy=False).set_index(["LoadCase", "StepNum"])
+    df.attrs["location"] = {"x": gx, "y": gy, "z": gz}
+    return df
+
+
+def frame_forces_parse(ret: list) -> FrameForces:
+    """Converts the result arrays of a SapOAPI `FrameForce` call to a dense `FrameForces` array.
+
+    Stations are numbered in increasing distance along each frame object;
+    cases are the unique (LoadCase, StepType, StepNum) combinations, in the
+    order reported. A station reported by two frame elements (at an element
+    boundary) keeps the last reported value.
+    """
+    columns = _result_columns(
+        ret=ret, fields=FRAME_FORCE_FIELDS, header=FRAME_RESULT_HEADER_FIELDS
+    )
+    return _frame_forces(columns=columns)
+
+
+def _frame_forces(columns: dict[str, np.ndarray]) -> FrameForces:
+    frame_codes, frames = pd.factorize(columns["ObjectName"])
+    case_codes, cases = pd.MultiIndex.from_arrays(
+        [columns["LoadCase"], columns["StepType"], columns["StepNum"]]
+    ).factorize()
+    station = columns["ObjectStation"]
+    station_codes = (
+        pd.Series(station).groupby(frame_codes).rank(method="dense").to_numpy(dtype=int)
+        - 1
+    )
+    num_stations = int(station_codes.max()) + 1 if len(station_codes) else 0
+
+    stations = np.full((len(frames), num_stations), np.nan)
+    stations[frame_codes, station_codes] = station
+    values = np.full(
+        (len(frames), num_stations, len(cases), len(FRAME_FORCE_FIELDS)), np.nan
+    )
+    values[frame_codes, station_codes, case_codes] = np.column_stack(
+        [columns[field] for field in FRAME_FORCE_FIELDS]
+    )
+    return FrameForces(
+        values=values,
+        frames=list(frames),
+        stations=stations,
+        cases=list(cases),
+        components=FRAME_FORCE_FIELDS,
+    )
+
+
+def element_results_frame(
+    ret: list, fields: tuple[str, ...], label: str
+) -> pd.DataFrame:
+    """Converts the result arrays of a SapOAPI area or link result call to a DataFrame.
+
+    Args:
+        ret (list): return value of the call, i.e. (NumberResults, ObjectName, ElementName,
+            PointElement, LoadCase, StepType, StepNum, *components, ret).
+        fields (tuple[str, ...]): names of the result components.
+        label (str): name given to the object column, e.g. `Area`.
+
+    Returns:
+        pd.DataFrame: one column per array, indexed by (label, Point, LoadCase, StepNum).
+    """
+    columns = _result_columns(ret=ret, fields=fields, header=AREA_RESULT_HEADER_FIELDS)
+    return _element_frame(columns=columns, label=label)
+
+
+def _element_frame(columns: dict[str, np.ndarray], label: str) -> pd.DataFrame:
+    df = pd.DataFrame(columns, copy=False)
+    df = df.rename(columns={"ObjectName": label, "PointElement": "Point"})
+    return df.set_index([label, "Point", "LoadCase", "StepNum"])
+
+
+def _result_columns(
+    ret: list, fields: tuple[str, ...], header: tuple[str, ...] = RESULT_HEADER_FIELDS
+) -> dict[str, np.ndarray]:
+    """Converts each parallel array of a SapOAPI result call to a typed NumPy column."""
+    assert ret[-1] == 0, f"{ret[-1]=} indicates failure to retrieve results"
+    names = (*header, *fields)
+    assert len(ret) == len(names) + 2, f"Expected {len(names)} result arrays"
+    columns = {}
+    for name, values in zip(names, ret[1:-1]):
+        if not isinstance(values, (tuple, list)):
+            values = (values,)
+        dtype = (
+            np.float64 if name in NUMERIC_HEADER_FIELDS or name in fields else object
+        )
+        columns[name] = np.fromiter(values, dtype=dtype, count=len(values))
+    return columns
+
+
+def _results_to_records(ret: list, fields: tuple[str, ...]) -> list[dict]:
+    """Adapter returning SapOAPI result arrays as one dict per result row.
+
+    Values are passed through unchanged. A single result is returned as reported,
+    without unpacking its values."""
+    assert ret[-1] == 0, f"{ret[-1]=} indicates failure to retrieve results"
+    names = (*RESULT_HEADER_FIELDS, *fields)
+    if ret[0] == 1:
+        return [dict(zip(names, ret[1:-1]))]
+    return [dict(zip(names, row)) for row in zip(*ret[1:-1])]
+
+
+def joint_displacements_parse(ret: list) -> list[dict]:
+    """Parses `JointDispl`, `JointVel` and `JointAcc` results into one dict per result row."""
+    return _results_to_records(ret=ret, fields=JOINT_RESULT_FIELDS["displacements"])
+
+
+def joint_reactions_parse(ret: list) -> list[dict]:
+    """Parses `JointReact` results into one dict per result row."""
+    return _results_to_records(ret=ret, fields=JOINT_RESULT_FIELDS["reactions"])
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+
+from .constants import MODE_SHAPE_FIELDS
+from .types import ModeShapes
+
+
+def modal_frame(columns: dict[str, np.ndarray]) -> pd.DataFrame:
+    """Converts the columns of a `ModalPeriod` or `ModalParticipatingMassRatios` call to a DataFrame.
+
+    Args:
+        columns (dict[str, np.ndarray]): Typed result columns, see `_result_columns`.
+
+    Returns:
+        pd.DataFrame: One row per mode, indexed by (LoadCase, Mode).
+    """
+    df = pd.DataFrame(columns, copy=False).drop(columns="StepType")
+    df["StepNum"] = df["StepNum"].astype(int)
+    return df.rename(columns={"StepNum": "Mode"}).set_index(["LoadCase", "Mode"])
+
+
+def mode_shapes(columns: dict[str, np.ndarray], case: str) -> ModeShapes:
+    """Converts the columns of a `ModeShape` call to a dense `ModeShapes` array.
+
+    Joints are in the order reported, modes in increasing mode number.
+    Rows of other load cases are ignored.
+
+    Args:
+        columns (dict[str, np.ndarray]): Typed result columns, see `_result_columns`.
+        case (str): Name of the modal load case.
+
+    Returns:
+        ModeShapes: The (mode, joint, dof) mode shapes.
+    """
+    rows = columns["LoadCase"] == case
+    joint_codes, joints = pd.factorize(columns["ObjectName"][rows])
+    modes, mode_codes = np.unique(
+        columns["StepNum"][rows].astype(int), return_inverse=True
+    )
+
+    values = np.full((len(modes), len(joints), len(MODE_SHAPE_FIELDS)), np.nan)
+    values[mode_codes, joint_codes] = np.column_stack(
+        [columns[field][rows] for field in MODE_SHAPE_FIELDS]
+    )
+    return ModeShapes(
+        values=values,
+        modes=modes.tolist(),
+        joints=list(joints),
+        dofs=MODE_SHAPE_FIELDS,
+        case=case,
+    )
@@ -0,0 +1,363 @@
+import json
+import os
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from ak_sap.utils import log
+from ak_sap.utils.files import slugify, try_unlink
+
+INDEX = "index.json"
+"""Name of the label index written at the root of a result store directory"""
+
+
+class TimeSeries:
+    """Read-only view of a time series in a `ResultStore`.
+
+    Values have shape (steps, items, components) and are split along the
+    step axis into chunk files. Chunks are opened as memory maps, so values
+    are only read from disk as they are accessed.
+
+    Attributes:
+        name (str): Name of the series in the store.
+        items (list): Item labels along axis 1, e.g. joint names or (frame, station) pairs.
+        components (tuple[str, ...]): Result components along axis 2.
+        steps (np.ndarray): StepNum of each step along axis 0.
+        chunks (list[np.memmap]): The chunk arrays, in step order.
+    """
+
+    def __init__(self, path: Path, name: str, entry: dict[str, Any]) -> None:
+        self.name = name
+        self.items: list = [_label(item) for item in entry["items"]]
+        self.components: tuple[str, ...] = tuple(entry["components"])
+        self.steps = np.asarray(entry["steps"], dtype=float)
+        self.chunks: list[np.memmap] = [
+            np.load(path / chunk, mmap_mode="r") for chunk in entry["chunks"]
+        ]
+        self._starts = np.cumsum([0, *(len(chunk) for chunk in self.chunks)])
+
+    def __str__(self) -> str:
+        return (
+            f"TimeSeries `{self.name}` of {len(self)} steps, {len(self.items)} items "
+            f"and components {self.components} in {len(self.chunks)} chunks"
+        )
+
+    def __len__(self) -> int:
+        return int(self._starts[-1])
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """Returns the (steps, items, components) shape of the series."""
+        return len(self), len(self.items), len(self.components)
+
+    def __getitem__(self, key: int | slice) -> np.ndarray:
+        """Returns steps of the series.
+
+        A step, or a slice of steps within a single chunk, is a view of the
+        memory map. A slice spanning several chunks is copied into memory.
+
+        Raises:
+            IndexError: If a step is out of range.
+        """
+        if isinstance(key, (int, np.integer)):
+            if not -len(self) <= key < len(self):
+                raise IndexError(f"Step {key} is out of range for {len(self)} steps")
+            key = int(key) + len(self) if key < 0 else int(key)
+            chunk = int(np.searchsorted(self._starts, key, side="right")) - 1
+            return self.chunks[chunk][key - self._starts[chunk]]
+        rows = range(len(self))[key]
+        if rows.step < 0:
+            # Read the same steps in increasing order, then reverse the result
+            ascending = rows[::-1]
+            return self[ascending.start : ascending.stop : ascending.step][::-1]
+        start, stop, stride = rows.start, rows.stop, rows.step
+        first = int(np.searchsorted(self._starts, start, side="right")) - 1
+        last = (
+            int(np.searchsorted(self._starts, max(stop - 1, start), side="right")) - 1
+        )
+        if first == last and first < len(self.chunks):
+            offset = self._starts[first]
+            return self.chunks[first][start - offset : stop - offset : stride]
+        blocks = [values for _, values in self.iter_chunks(start, stop)]
+        if not blocks:
+            return np.empty((0, len(self.items), len(self.components)))
+        return np.concatenate(blocks)[::stride]
+
+    def iter_chunks(
+        self, start: int = 0, stop: int | None = None
+    ) -> Generator[tuple[int, np.ndarray], Any, None]:
+        """Yields the series chunk by chunk, as views of the memory maps.
+
+        Args:
+            start (int): First step to yield.
+            stop (int | None): Step to stop before. All remaining steps if None.
+
+        Yields:
+            tuple[int, np.ndarray]: The index of the first step of the chunk, and its values.
+        """
+        stop = len(self) if stop is None else stop
+        for offset, chunk in zip(self._starts, self.chunks):
+            lo, hi = max(start - offset, 0), min(stop - offset, len(chunk))
+            if lo < hi:
+                yield int(offset + lo), chunk[lo:hi]
+
+    def item(self, item: Any, component: str | None = None) -> np.ndarray:
+        """Returns the history of a single item.
+
+        Args:
+            item (Any): Item label, e.g. a joint name or a (frame, station) pair.
+            component (str | None): Result component, e.g. `U1`. All components if None.
+
+        Returns:
+            np.ndarray: Array of shape (steps[, components]).
+        """
+        index = self.items.index(_label(item))
+        if component is None:
+            return np.concatenate([chunk[:, index] for chunk in self.chunks])
+        j = self.components.index(component)
+        return np.concatenate([chunk[:, index, j] for chunk in self.chunks])
+
+    def peaks(self) -> pd.DataFrame:
+        """Returns the largest absolute value of each item and component, one chunk at a time.
+
+        Returns:
+            pd.DataFrame: One row per item. Columns are (component, measure) for the
+                measures AbsMax, keeping its sign, and AbsMaxStep.
+        """
+        shape = (len(self.items), len(self.components))
+        peak, peak_abs = np.zeros(shape), np.full(shape, -1.0)
+        step = np.full(shape, np.nan)
+        for offset, values in self.iter_chunks():
+            rows = np.argmax(np.nan_to_num(np.abs(values), nan=-1.0), axis=0)
+            chunk_peak = np.take_along_axis(values, rows[None], axis=0)[0]
+            better = np.abs(chunk_peak) > peak_abs
+            peak[better] = chunk_peak[better]
+            peak_abs[better] = np.abs(chunk_peak[better])
+            step[better] = self.steps[offset + rows[better]]
+        columns = {}
+        for j, component in enumerate(self.components):
+            columns[(component, "AbsMax")] = peak[:, j]
+            columns[(component, "AbsMaxStep")] = step[:, j]
+        df = pd.DataFrame(columns, index=pd.Index(self.items, tupleize_cols=False))
+        df.columns = pd.MultiIndex.from_tuples(
+            df.columns, names=["Component", "Measure"]
+        )
+        return df
+
+
+class ResultStore:
+    """Chunked, memory-mapped on-disk store of result time series.
+
+    Each series is a (steps, items, components) array split along the step
+    axis into `.npy` chunk files of at most `chunk_steps` steps. Writing more
+    steps to an existing series appends chunks, so a long history can be
+    written case by case, or block by block, without holding it in memory.
+    `index.json` holds the item, component and step labels of every series
+    and is rewritten after each write.
+
+    Usage:
+        store = ResultStore("model_th")
+        store.write("displacements/TH-X", values, items=joints, components=("U1", "U2"), steps=steps)
+        series = store["displacements/TH-X"]
+        series.item("12", "U1")  # One joint, read from every chunk
+        series.peaks()  # Reduced one chunk at a time
+
+    Attributes:
+        path (Path): The store directory.
+        chunk_steps (int): Largest number of steps written to a chunk file.
+        index (dict): Labels and chunk files of each series.
+    """
+
+    def __init__(self, path: str | Path, chunk_steps: int = 1024) -> None:
+        """Opens or creates a ResultStore.
+
+        Args:
+            path (str | Path): Directory of the store. Created if missing.
+            chunk_steps (int): Largest number of steps written to a chunk file.
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.chunk_steps = chunk_steps
+        self.index: dict[str, Any] = {"series": {}, "created": 0}
+        if (self.path / INDEX).exists():
+            self.index = json.loads((self.path / INDEX).read_text())
+
+    def __str__(self) -> str:
+        return f"Instance of Results `ResultStore` of {len(self)} series at {self.path}"
+
+    def __repr__(self) -> str:
+        return f"ResultStore(path={str(self.path)!r})"
+
+    def __len__(self) -> int:
+        return len(self.index["series"])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index["series"]
+
+    def __getitem__(self, name: str) -> TimeSeries:
+        return self.open(name)
+
+    def list_all(self) -> list[str]:
+        """Returns the names of the stored series."""
+        return list(self.index["series"])
+
+    def open(self, name: str) -> TimeSeries:
+        """Opens a stored series as memory maps.
+
+        Args:
+            name (str): Name of the series.
+
+        Returns:
+            TimeSeries: Read-only view of the series.
+        """
+        assert name in self, f"`{name}` is not in the result store at {self.path}"
+        return TimeSeries(path=self.path, name=name, entry=self.index["series"][name])
+
+    def write(
+        self,
+        name: str,
+        values: np.ndarray,
+        items: list,
+        components: tuple[str, ...],
+        steps: np.ndarray,
+    ) -> None:
+        """Writes steps of a series, appending to it if it exists.
+
+        Args:
+            name (str): Name of the series, e.g. `displacements/TH-X`.
+            values (np.ndarray): Values of shape (steps, items, components).
+            items (list): Item labels along axis 1. Must match the stored labels when appending.
+            components (tuple[str, ...]): Result components along axis 2.
+            steps (np.ndarray): StepNum of each step along axis 0.
+        """
+        values = np.asarray(values)
+        items = [_label(item) for item in items]
+        assert values.shape == (len(steps), len(items), len(components)), (
+            f"{values.shape=} does not match {len(steps)} steps, {len(items)} items "
+            f"and {len(components)} components"
+        )
+        if name not in self:
+            self.index["series"][name] = {
+                "file": f"{self.index['created']:04d}-{slugify(name)}",
+                "items": items,
+                "components": list(components),
+                "steps": [],
+                "chunks": [],
+                "dtype": values.dtype.str,
+            }
+            self.index["created"] += 1
+        entry = self.index["series"][name]
+        stored_items = [_label(item) for item in entry["items"]]
+        assert stored_items == items and entry["components"] == list(components), (
+            f"Items or components differ from those stored in `{name}`"
+        )
+        for start in range(0, len(values), self.chunk_steps):
+            chunk = f"{entry['file']}-{len(entry['chunks']):05d}.npy"
+            stored = np.lib.format.open_memmap(
+                self.path / chunk,
+                mode="w+",
+                dtype=entry["dtype"],
+                shape=values[start : start + self.chunk_steps].shape,
+            )
+            stored[...] = values[start : start + self.chunk_steps]
+            stored.flush()
+            del stored
+            entry["chunks"].append(chunk)
+        entry["steps"].extend(float(step) for step in steps)
+        self._save()
+        log.debug(f"Wrote {len(values)} steps of `{name}` to {self.path}")
+
+    def delete(self, name: str) -> None:
+        """Deletes a stored series and its chunk files.
+
+        Chunk files that cannot be deleted, e.g. while memory-mapped on Windows,
+        are left in place; the series is removed from the index regardless.
+        """
+        entry = self.index["series"].pop(name, None)
+        if entry is None:
+            return
+        self._save()
+        for chunk in entry["chunks"]:
+            try_unlink(self.path / chunk)
+
+    def rename(self, name: str, new_name: str) -> None:
+        """Renames a stored series, replacing any series of the new name.
+
+        Chunk files keep their names, so a series written under a temporary
+        name can replace another one without rewriting it.
+
+        Args:
+            name (str): Name of the stored series.
+            new_name (str): New name of the series.
+        """
+        assert name in self, f"`{name}` is not in the result store at {self.path}"
+        replaced = self.index["series"].pop(new_name, None)
+        self.index["series"][new_name] = self.index["series"].pop(name)
+        self._save()
+        for chunk in replaced["chunks"] if replaced is not None else ():
+            try_unlink(self.path / chunk)
+
+    def _save(self) -> None:
+        """Writes the index, replacing the previous one only once fully written."""
+        temporary = self.path / f"{INDEX}.tmp"
+        temporary.write_text(json.dumps(self.index))
+        os.replace(temporary, self.path / INDEX)
+
+
+def time_series(
+    columns: dict[str, np.ndarray], keys: tuple[str, ...], fields: tuple[str, ...]
+) -> tuple[np.ndarray, list, np.ndarray]:
+    """Converts the typed result columns of a single case to a dense time series.
+
+    Args:
+        columns (dict[str, np.ndarray]): Typed result columns, see `_result_columns`.
+        keys (tuple[str, ...]): Columns identifying an item, e.g. ("ObjectName",) for joints
+            or ("ObjectName", "ObjectStation") for frames.
+        fields (tuple[str, ...]): Result components.
+
+    Returns:
+        tuple[np.ndarray, list, np.ndarray]: Values of shape (steps, items, components),
+            the item labels in the order reported, and the StepNum of each step, in
+            increasing order.
+
+    Raises:
+        AssertionError: If the results are envelopes (`StepType` Max or Min), which
+            have no steps to index by.
+    """
+    enveloped = np.isin(columns["StepType"], ("Max", "Min"))
+    assert not enveloped.any(), (
+        "Results are reported as envelopes; set the time history output to step-by-step"
+    )
+    codes = [pd.factorize(columns[key]) for key in keys]
+    combined = np.zeros(len(columns[keys[0]]), dtype=np.int64)
+    for key_codes, uniques in codes:
+        combined = combined * len(uniques) + key_codes
+    item_codes, item_keys = pd.factorize(combined)
+    steps, step_codes = np.unique(columns["StepNum"], return_inverse=True)
+
+    if len(keys) == 1:
+        items = list(codes[0][1][item_keys])
+    else:
+        parts, remainder = [], np.asarray(item_keys)
+        for key_codes, uniques in reversed(codes):
+            parts.append(np.asarray(uniques)[remainder % len(uniques)])
+            remainder = remainder // len(uniques)
+        items = [_label(item) for item in zip(*reversed(parts))]
+
+    values = np.full((len(steps), len(items), len(fields)), np.nan)
+    values[step_codes, item_codes] = np.column_stack(
+        [columns[field] for field in fields]
+    )
+    return values, items, steps
+
+
+def _label(item: Any) -> Any:
+    """Returns an item label as a plain string, or a tuple of plain strings and numbers."""
+    if isinstance(item, (list, tuple)):
+        return tuple(
+            value.item() if isinstance(value, np.generic) else value for value in item
+        )
+    return item.item() if isinstance(item, np.generic) else item
@@ -0,0 +1,193 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class FrameForces:
+    """Frame internal forces as a dense (frame, station, case, component) array.
+
+    Frames have different numbers of output stations; missing stations are
+    padded with NaN, in both `values` and `stations`.
+
+    Attributes:
+        values (np.ndarray): Forces of shape (frames, stations, cases, components).
+        frames (list[str]): Frame object names along axis 0.
+        stations (np.ndarray): Station distance along each frame object, of shape (frames, stations).
+        cases (list[tuple[str, str, float]]): (LoadCase, StepType, StepNum) along axis 2.
+        components (tuple[str, ...]): Force components along axis 3.
+    """
+
+    values: np.ndarray
+    frames: list[str]
+    stations: np.ndarray
+    cases: list[tuple[str, str, float]]
+    components: tuple[str, ...]
+
+    def __str__(self) -> str:
+        return (
+            f"FrameForces of {len(self.frames)} frames, {self.stations.shape[1]} stations, "
+            f"{len(self.cases)} cases and components {self.components}"
+        )
+
+    def sel(self, frame: str, component: str | None = None) -> np.ndarray:
+        """Returns the forces of a single frame.
+
+        Args:
+            frame (str): Frame object name.
+            component (str | None): Force component, e.g. `M3`. All components if None.
+
+        Returns:
+            np.ndarray: Array of shape (stations, cases[, components]).
+        """
+        values = self.values[self.frames.index(frame)]
+        if component is None:
+            return values
+        return values[..., self.components.index(component)]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the forces as a long DataFrame indexed by (Frame, Station, LoadCase, StepNum)."""
+        f, s, c = np.nonzero(~np.isnan(self.values).all(axis=3))
+        cases = np.array(self.cases, dtype=object).reshape(-1, 3)
+        df = pd.DataFrame(
+            {
+                "Frame": np.asarray(self.frames, dtype=object)[f],
+                "Station": self.stations[f, s],
+                "LoadCase": cases[c, 0],
+                "StepType": cases[c, 1],
+                "StepNum": cases[c, 2].astype(float),
+                **dict(zip(self.components, self.values[f, s, c].T)),
+            }
+        )
+        return df.set_index(["Frame", "Station", "LoadCase", "StepNum"])
+
+
+@dataclass
+class CaseStack:
+    """Per-case extremes of a result quantity, stacked for local combination.
+
+    Multi-step cases (e.g. time histories) are reduced to their maximum and
+    minimum over steps. Single-step cases have `upper` equal to `lower`.
+    Items a case does not report are zero.
+
+    Attributes:
+        upper (np.ndarray): Maximum of each case, of shape (cases, items, components).
+        lower (np.ndarray): Minimum of each case, of the same shape.
+        cases (list[str]): Load case or combo names along axis 0.
+        items (list[str]): Item names along axis 1, e.g. joints.
+        components (tuple[str, ...]): Result components along axis 2.
+        by (str): What an item is, e.g. `Joint`.
+    """
+
+    upper: np.ndarray
+    lower: np.ndarray
+    cases: list[str]
+    items: list[str]
+    components: tuple[str, ...]
+    by: str = "Joint"
+
+    def __str__(self) -> str:
+        return (
+            f"CaseStack of {len(self.cases)} cases, {len(self.items)} items "
+            f"and components {self.components}"
+        )
+
+    def sel(self, case: str) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the (upper, lower) arrays of shape (items, components) of a case."""
+        index = self.cases.index(case)
+        return self.upper[index], self.lower[index]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the stack as a DataFrame indexed by (item, LoadCase).
+
+        Columns are (component, measure) for the measures Max and Min.
+        """
+        index = pd.MultiIndex.from_product(
+            [self.items, self.cases], names=[self.by, "LoadCase"]
+        )
+        upper = self.upper.transpose(1, 0, 2).reshape(len(index), -1)
+        lower = self.lower.transpose(1, 0, 2).reshape(len(index), -1)
+        columns = {}
+        for j, component in enumerate(self.components):
+            columns[(component, "Max")] = upper[:, j]
+            columns[(component, "Min")] = lower[:, j]
+        df = pd.DataFrame(columns, index=index)
+        df.columns = pd.MultiIndex.from_tuples(
+            df.columns, names=["Component", "Measure"]
+        )
+        return df
+
+
+@dataclass
+class ModeShapes:
+    """Mode shapes of a modal case as a dense (mode, joint, dof) array.
+
+    `values` may be a read-only memory map of a results cache file (see
+    `Results.enable_cache`), in which case modes are only read from disk as
+    they are accessed.
+
+    Attributes:
+        values (np.ndarray): Mode shapes of shape (modes, joints, dofs).
+        modes (list[int]): Mode numbers along axis 0.
+        joints (list[str]): Joint names along axis 1.
+        dofs (tuple[str, ...]): Degrees of freedom along axis 2.
+        case (str): Name of the modal load case.
+    """
+
+    values: np.ndarray
+    modes: list[int]
+    joints: list[str]
+    dofs: tuple[str, ...]
+    case: str
+
+    def __str__(self) -> str:
+        return (
+            f"ModeShapes of `{self.case}` with {len(self.modes)} modes, "
+            f"{len(self.joints)} joints and dofs {self.dofs}"
+        )
+
+    def mode(self, mode: int) -> np.ndarray:
+        """Returns the shape of a single mode, of shape (joints, dofs)."""
+        return self.values[self.modes.index(mode)]
+
+    def sel(self, joint: str, dof: str | None = None) -> np.ndarray:
+        """Returns the shapes of a single joint.
+
+        Args:
+            joint (str): Joint name.
+            dof (str | None): Degree of freedom, e.g. `U1`. All dofs if None.
+
+        Returns:
+            np.ndarray: Array of shape (modes[, dofs]).
+        """
+        values = self.values[:, self.joints.index(joint)]
+        if dof is None:
+            return values
+        return values[:, self.dofs.index(dof)]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the mode shapes as a long DataFrame indexed by (Mode, Joint)."""
+        index = pd.MultiIndex.from_product(
+            [self.modes, self.joints], names=["Mode", "Joint"]
+        )
+        values = np.asarray(self.values).reshape(len(index), len(self.dofs))
+        return pd.DataFrame(values, index=index, columns=list(self.dofs))
+
+
+@dataclass
+class ModalResults:
+    """Results of a modal load case.
+
+    Attributes:
+        periods (pd.DataFrame): Period, frequencies and eigenvalue, indexed by (LoadCase, Mode).
+        participation (pd.DataFrame): Participating mass ratios, indexed by (LoadCase, Mode).
+        shapes (ModeShapes | None): Mode shapes, if requested.
+    """
+
+    periods: pd.DataFrame
+    participation: pd.DataFrame
+    shapes: ModeShapes | None = None
+
+    def __str__(self) -> str:
+        return f"ModalResults of {len(self.periods)} modes"
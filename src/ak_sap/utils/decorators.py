@@ -1,6 +1,7 @@
 from functools import wraps
 
 from ak_sap import log
+from ak_sap.utils.revision import model_revision, output_revision
 
 
 def smooth_sap_do(func):
@@ -36,3 +37,50 @@ def smooth_sap_do(func):
             log.critical(e)
 
     return wrapper
+
+
+def modifies_model(func):
+    """Decorator for wrapper calls that change the model.
+
+    Bumps the global `model_revision` once the call returns (or fails),
+    so that cached table and result data is invalidated.
+
+    Args:
+        func (callable): The function being decorated.
+
+    Returns:
+        callable: The wrapped function.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            model_revision.bump()
+
+    return wrapper
+
+
+def modifies_output(func):
+    """Decorator for wrapper calls that change which analysis results are reported.
+
+    Bumps the global `output_revision` once the call returns (or fails), so
+    that cached result tables are invalidated while the model revision, and
+    caches of model data, are left alone.
+
+    Args:
+        func (callable): The function being decorated.
+
+    Returns:
+        callable: The wrapped function.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            output_revision.bump()
+
+    return wrapper
@@ -0,0 +1,19 @@
+"""Helpers for the files written by the on-disk caches and stores."""
+
+import re
+from pathlib import Path
+
+from .logger import log
+
+
+def slugify(value: str) -> str:
+    """Makes a name, e.g. a TableKey or a series name, safe to use in a filename."""
+    return re.sub(r"[^A-Za-z0-9]+", "_", value).strip("_")[:60]
+
+
+def try_unlink(path: Path) -> None:
+    """Deletes a file, if possible. A memory-mapped file cannot be deleted on Windows."""
+    try:
+        path.unlink(missing_ok=True)
+    except OSError as e:
+        log.debug(f"Could not delete {path}: {e}")
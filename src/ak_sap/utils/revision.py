@@ -0,0 +1,48 @@
+"""Module tracking modifications made to the model through `ak_sap`.
+
+Every wrapper call that changes the model bumps a process-wide revision
+number. Caches of data read from SAP2000 compare against it to know when
+their contents are stale. Changes to the output selection leave the model
+untouched and bump a separate output revision, which only caches of
+analysis results need to follow.
+"""
+
+
+class ModelRevision:
+    """Monotonic counter of model modifications made in this process.
+
+    Attributes:
+        value (int): The current revision number.
+
+    Example:
+        >>> revision = ModelRevision()
+        >>> revision.bump()
+        1
+    """
+
+    def __init__(self) -> None:
+        self.value: int = 0
+
+    def __repr__(self) -> str:
+        return f"ModelRevision(value={self.value})"
+
+    def bump(self) -> int:
+        """Marks the model as modified.
+
+        Returns:
+            int: The new revision number.
+        """
+        self.value += 1
+        return self.value
+
+
+model_revision = ModelRevision()
+"""Global model revision instance"""
+
+output_revision = ModelRevision()
+"""Global output revision instance, bumped when the cases or options reported in analysis results change"""
+
+
+def revisions() -> tuple[int, int]:
+    """Returns the current model and output revisions, for caches of result data."""
+    return model_revision.value, output_revision.value
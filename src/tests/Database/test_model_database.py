@@ -0,0 +1,103 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from ak_sap.Database.model_database import ModelDatabase, table_digest
+from ak_sap.Database.table_structured_data import DatabaseTable, FieldData
+from ak_sap.Database.tables import Table
+
+TABLE = DatabaseTable(
+    TableKey="Frame Section Assignments",
+    TableName="Frame Sections",
+    ImportType="importable, but not interactively importable",
+    IsEmpty=False,
+)
+FIELDS = [
+    FieldData("Frame", "Frame", "Frame label", "", True),
+    FieldData("AnalSect", "Analysis Section", "Section name", "", True),
+    FieldData("Length", "Length", "Frame length", "m", False),
+]
+DATA = pd.DataFrame(
+    {
+        "Frame": ["1", "2", "3"],
+        "AnalSect": ["W310", "W310", "W200"],
+        "Length": [3.5, 4.0, 1.0],
+    }
+)
+
+
+def test_table_digest():
+    assert table_digest(("A",), ("1", "2")) == table_digest(("A",), ("1", "2"))
+    assert table_digest(("A",), ("1", "2")) != table_digest(("A",), ("12",))
+    assert table_digest(("A", "B"), ("1",)) != table_digest(("A",), ("B", "1"))
+
+
+def test_model_database_roundtrip(tmp_path):
+    with ModelDatabase(tmp_path / "model.sqlite") as db:
+        db.write(table=TABLE, data=DATA, fields=FIELDS, digest="abc")
+        assert TABLE.TableKey in db
+        assert db.is_current(TABLE.TableKey, "abc")
+        assert not db.is_current(TABLE.TableKey, "def")
+        assert db.list_all() == [TABLE]
+        assert db.get_table_fields(TABLE.TableKey) == FIELDS
+
+    with ModelDatabase(tmp_path / "model.sqlite") as db:
+        result = db.get(
+            TABLE.TableKey,
+            fields=["Frame", "Length"],
+            where="AnalSect = ? AND Length > ?",
+            params=["W310", 3.7],
+        )
+        pd.testing.assert_frame_equal(
+            result, pd.DataFrame({"Frame": ["2"], "Length": [4.0]}), check_dtype=False
+        )
+        indexes = db.query(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ?",
+            [TABLE.TableKey],
+        )
+        assert len(indexes) == 2  # Frame, AnalSect
+
+        assert db.prune(keep=set()) == [TABLE.TableKey]
+        assert len(db) == 0
+
+
+class FakeDatabaseTables:
+    def __init__(self):
+        self.reads = 0
+
+    def GetAllTables(self):
+        return 1, [TABLE.TableKey], [TABLE.TableName], [1], [False], 0
+
+    def GetAllFieldsInTable(self, TableKey):
+        return (
+            1,
+            len(FIELDS),
+            *(
+                [getattr(field, attr) for field in FIELDS]
+                for attr in FieldData.__annotations__
+            ),
+            0,
+        )
+
+    def GetTableForDisplayArray(self, TableKey, FieldKeyList, GroupName):
+        self.reads += 1
+        headers = tuple(DATA.columns)
+        array = tuple(DATA.astype(str).to_numpy().ravel())
+        return 1, 1, headers, len(DATA), array, 0
+
+
+def test_export_sqlite_reads_tables_from_cache(tmp_path):
+    database = FakeDatabaseTables()
+    sap = SimpleNamespace(SapModel=SimpleNamespace(DatabaseTables=database))
+    table = Table(mySapObject=sap, Model=MagicMock(filepath="model.sdb"))
+
+    table.export_sqlite(tmp_path / "model.sqlite")
+    table.export_sqlite(tmp_path / "model.sqlite")
+    assert database.reads == 2  # Every table is read to compare its content
+
+    table.enable_cache()
+    table.export_sqlite(tmp_path / "model.sqlite")
+    db = table.export_sqlite(tmp_path / "model.sqlite")
+    assert database.reads == 3
+    assert db.get(TABLE.TableKey)["Frame"].tolist() == ["1", "2", "3"]
@@ -0,0 +1,90 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from ak_sap.Database.tables import Table
+
+JOINTS = pd.DataFrame({"Joint": ["1", "2"], "XorR": ["0", "3"]})
+FRAMES = pd.DataFrame({"Frame": ["1"], "JointI": ["1"], "JointJ": ["2"]})
+
+
+class FakeDatabaseTables:
+    def __init__(self, stage_ret=0, errors=0):
+        self.stage_ret = stage_ret
+        self.errors = errors
+        self.staged = []
+        self.applied = 0
+        self.cancelled = 0
+
+    def SetTableForEditingArray(self, TableKey, TableVersion, Fields, Rows, Data):
+        self.staged.append(TableKey)
+        return TableVersion, Fields, Rows, Data, self.stage_ret
+
+    def ApplyEditedTables(self, FillImportLog):
+        self.applied += 1
+        return 0, self.errors, 0, 0, "Import log", 0
+
+    def CancelTableEditing(self):
+        self.cancelled += 1
+        return 0
+
+
+def make_table(**kwargs) -> tuple[Table, FakeDatabaseTables]:
+    database = FakeDatabaseTables(**kwargs)
+    sap = SimpleNamespace(SapModel=SimpleNamespace(DatabaseTables=database))
+    return Table(mySapObject=sap, Model=None), database
+
+
+def test_batch_applies_once():
+    table, database = make_table()
+    with table.batch() as batch:
+        batch.update(TableKey="Joint Coordinates", data=JOINTS)
+        batch.update(TableKey="Connectivity - Frame", data=FRAMES)
+        assert database.applied == 0
+
+    assert database.staged == ["Joint Coordinates", "Connectivity - Frame"]
+    assert database.applied == 1
+    assert database.cancelled == 0
+    assert batch.result is not None and batch.result.ok
+
+
+def test_batch_rolls_back_on_exception():
+    table, database = make_table()
+    with pytest.raises(ValueError), table.batch() as batch:
+        batch.update(TableKey="Joint Coordinates", data=JOINTS)
+        raise ValueError("bad edit")
+
+    assert database.applied == 0
+    assert database.cancelled == 1
+    assert batch.result is None
+
+
+def test_batch_rolls_back_on_import_errors():
+    table, database = make_table(errors=1)
+    with table.batch() as batch:
+        batch.update(TableKey="Joint Coordinates", data=JOINTS)
+
+    assert database.applied == 1
+    assert database.cancelled == 1
+    assert batch.result is not None and not batch.result.ok
+
+
+def test_batch_rolls_back_on_staging_failure():
+    table, database = make_table(stage_ret=1)
+    with pytest.raises(AssertionError), table.batch() as batch:
+        batch.update(TableKey="Joint Coordinates", data=JOINTS)
+
+    assert database.applied == 0
+    assert database.cancelled == 1
+
+
+def test_update_returns_none_on_staging_failure():
+    table, database = make_table(stage_ret=1)
+    table._baselines["Joint Coordinates"] = JOINTS.iloc[:1]
+
+    assert table.update(TableKey="Joint Coordinates", data=JOINTS, diff=True) is None
+    assert database.applied == 0
+    pd.testing.assert_frame_equal(
+        table._baselines["Joint Coordinates"], JOINTS.iloc[:1]
+    )
@@ -0,0 +1,48 @@
+from ak_sap.Database.table_cache import TableCache, _sizeof
+from ak_sap.utils.revision import model_revision, output_revision
+
+
+def test_table_cache_hit_and_miss():
+    cache = TableCache()
+    assert cache.get("A") is None
+    cache.put("A", headers=("Name",), array=("1", "2"))
+    assert cache.get("A") == (("Name",), ("1", "2"))
+
+    info = cache.info
+    assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+
+
+def test_table_cache_lru_eviction():
+    headers, array = ("Name",), ("1", "2")
+    entry_size = _sizeof(headers) + _sizeof(array)
+    cache = TableCache(max_bytes=2 * entry_size)
+    cache.put("A", headers=headers, array=array)
+    cache.put("B", headers=headers, array=array)
+    cache.get("A")  # `B` is now the least recently used
+    cache.put("C", headers=headers, array=array)
+
+    assert cache.get("B") is None
+    assert cache.get("A") is not None
+    assert cache.get("C") is not None
+    assert cache.info.size_bytes == 2 * entry_size
+
+
+def test_table_cache_skips_oversized_tables():
+    cache = TableCache(max_bytes=1)
+    cache.put("A", headers=("Name",), array=("1", "2"))
+    assert len(cache) == 0
+
+
+def test_table_cache_invalidated_by_model_revision():
+    cache = TableCache()
+    cache.put("A", headers=("Name",), array=("1", "2"))
+    model_revision.bump()
+    assert cache.get("A") is None
+    assert len(cache) == 0
+
+
+def test_table_cache_invalidated_by_output_revision():
+    cache = TableCache()
+    cache.put("A", headers=("Name",), array=("1", "2"))
+    output_revision.bump()
+    assert cache.get("A") is None
@@ -0,0 +1,95 @@
+from unittest.mock import MagicMock
+
+from ak_sap.Database.table_catalog import TableCatalog
+from ak_sap.Database.table_structured_data import DatabaseTable, FieldData
+from ak_sap.Results.Setup import ResultsSetup
+from ak_sap.utils.revision import model_revision
+
+
+class FakeTable:
+    def __init__(self):
+        self.calls = 0
+
+    def list_all(self):
+        self.calls += 1
+        return [
+            DatabaseTable(
+                "Joint Coordinates", "Joint Coordinates", "Importable", False
+            ),
+            DatabaseTable(
+                "Joint Reactions", "Joint Reactions", "Not importable", False
+            ),
+            DatabaseTable(
+                "Frame Section Assignments", "Frame Sections", "Importable", True
+            ),
+        ]
+
+    def list_available(self):
+        return [
+            DatabaseTable(
+                "Joint Coordinates", "Joint Coordinates", "Importable", False
+            ),
+            DatabaseTable(
+                "Joint Reactions", "Joint Reactions", "Not importable", False
+            ),
+        ]
+
+    def get_table_fields(self, TableKey):
+        self.calls += 1
+        return [
+            FieldData("Joint", "Joint", "Joint label", "", True),
+            FieldData("XorR", "X or R", "X coordinate", "m", True),
+        ]
+
+
+def test_table_catalog_lookups_are_cached():
+    table = FakeTable()
+    catalog = TableCatalog(table)
+    assert len(catalog) == 3
+    assert [t.TableKey for t in catalog.list_available()] == [
+        "Joint Coordinates",
+        "Joint Reactions",
+    ]
+    assert catalog.resolve("Frame Sections") == "Frame Section Assignments"
+    assert catalog.field("Joint Coordinates", "X or R").FieldKey == "XorR"
+    catalog.fields("Joint Coordinates")
+    assert table.calls == 2
+
+    model_revision.bump()
+    catalog.fields("Joint Coordinates")
+    assert table.calls == 3
+
+
+def test_table_catalog_kept_across_output_selection():
+    table = FakeTable()
+    catalog = TableCatalog(table)
+    assert len(catalog) == 3
+    catalog.fields("Joint Coordinates")
+    calls = table.calls
+
+    setup = MagicMock()
+    setup.DeselectAllCasesAndCombosForOutput.return_value = 0
+    results_setup = ResultsSetup(MagicMock(**{"SapModel.Results.Setup": setup}))
+    results_setup.clear_casecombo()
+    results_setup.select_case("DEAD")
+    results_setup.select_combo("ULS")
+    results_setup.set_rxn_loc_get(0, 0, 0)
+
+    assert len(catalog) == 3
+    catalog.fields("Joint Coordinates")
+    assert table.calls == calls
+
+
+def test_table_catalog_find():
+    catalog = TableCatalog(FakeTable())
+    assert [t.TableKey for t in catalog.find("joint")] == [
+        "Joint Coordinates",
+        "Joint Reactions",
+    ]
+    assert [t.TableKey for t in catalog.find("sections")] == [
+        "Frame Section Assignments"
+    ]
+    assert catalog.find("Joint Reactoins", limit=1)[0].TableKey == "Joint Reactions"
+    assert [f.FieldKey for f in catalog.find_fields("Joint Coordinates", "x")] == [
+        "XorR"
+    ]
@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+from ak_sap.Database.table_diff import diff_tables
+
+
+def test_diff_tables():
+    old = pd.DataFrame(
+        {
+            "Frame": ["1", "2", "3", "4"],
+            "AnalSect": ["W310", "W310", "W410", "W410"],
+            "Length": ["3", "3", "4.5", ""],
+        }
+    )
+    new = old.copy()
+    new.loc[1, "AnalSect"] = "W360"
+    new.loc[3, "Length"] = "6.5"
+    new = pd.concat(
+        [new.drop(index=0), pd.DataFrame({"Frame": ["5"], "AnalSect": ["W200"]})],
+        ignore_index=True,
+    )
+
+    changes = diff_tables(old=old, new=new, keys=["Frame"])
+    assert changes.inserted.tolist() == [False, False, False, True]
+    assert changes.changed.tolist() == [True, False, True, False]
+    assert changes.changed_fields == {"AnalSect": 1, "Length": 1}
+    assert changes.removed["Frame"].tolist() == ["1"]
+    assert changes.unchanged == 1
+    assert changes.rows(new)["Frame"].tolist() == ["2", "4", "5"]
+
+
+def test_diff_tables_no_changes():
+    old = pd.DataFrame({"Joint": ["1", "2"], "Z": ["0", "3"]})
+    new = pd.DataFrame({"Joint": ["2", "1"], "Z": ["3", "0"]})
+    changes = diff_tables(old=old, new=new, keys=["Joint"])
+    assert changes.is_empty
+    assert changes.rows(new).empty
+
+
+def test_diff_tables_duplicate_keys():
+    old = pd.DataFrame({"Joint": ["1", "1"], "Z": ["0", "3"]})
+    with pytest.raises(AssertionError, match="do not identify baseline rows uniquely"):
+        diff_tables(old=old, new=old, keys=["Joint"])
@@ -0,0 +1,117 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from ak_sap.Database.table_structured_data import FieldData
+from ak_sap.Database.tables import Table
+from ak_sap.Model.constants import _UNITS
+from ak_sap.Model.model import Model
+
+JOINTS = pd.DataFrame(
+    {
+        "Joint": ["1", "2", "3", "4", "5"],
+        "XorR": ["0", "3", "6", "9", "12"],
+        "Z": ["0", "0", "0.5", "0.5", "1"],
+    }
+)
+TABLES = {
+    "Joint Coordinates": JOINTS,
+    "Joint Added Mass Assignments": pd.DataFrame(columns=["Joint", "Mass"]),
+}
+GROUPS = {"Base": ["1", "2"]}
+
+
+class FakeDatabaseTables:
+    def __init__(self):
+        self.reads = []
+
+    def GetAllFieldsInTable(self, TableKey):
+        fields = [
+            FieldData(column, column, "", "", True) for column in TABLES[TableKey]
+        ]
+        return (
+            1,
+            len(fields),
+            *(
+                [getattr(field, attr) for field in fields]
+                for attr in FieldData.__annotations__
+            ),
+            0,
+        )
+
+    def GetTableForDisplayArray(self, TableKey, FieldKeyList, GroupName):
+        self.reads.append((TableKey, FieldKeyList, GroupName))
+        data = TABLES[TableKey]
+        if GroupName:
+            data = data[data["Joint"].isin(GROUPS[GroupName])]
+        if FieldKeyList:
+            data = data[FieldKeyList]
+        headers = tuple(data.columns)
+        array = tuple(data.astype(str).to_numpy().ravel())
+        return 1, 1, headers, len(data), array, 0
+
+
+def make_table() -> tuple[Table, FakeDatabaseTables]:
+    database = FakeDatabaseTables()
+    sap = SimpleNamespace(SapModel=SimpleNamespace(DatabaseTables=database))
+    return Table(mySapObject=sap, Model=MagicMock()), database
+
+
+def test_iter_chunks_partial_last_chunk():
+    table, database = make_table()
+    chunks = list(table.iter_chunks("Joint Coordinates", rows=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert len(database.reads) == 1
+    full = table.get("Joint Coordinates")
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), full)
+    for chunk in chunks:
+        pd.testing.assert_series_equal(chunk.dtypes, full.dtypes)
+
+
+def test_iter_chunks_empty_table():
+    table, _ = make_table()
+    assert list(table.iter_chunks("Joint Added Mass Assignments", rows=2)) == []
+
+
+def test_get_pushes_fields_and_group_down():
+    table, database = make_table()
+    df = table.get("Joint Coordinates", fields=["Joint", "Z"], group="Base")
+
+    assert database.reads == [("Joint Coordinates", ["Joint", "Z"], "Base")]
+    assert list(df.columns) == ["Joint", "Z"]
+    assert df["Joint"].tolist() == ["1", "2"]
+
+
+def test_get_rejects_unknown_field():
+    table, database = make_table()
+    df = table.get("Joint Coordinates", fields=["Joint", "YorT"])
+
+    assert df.empty
+    assert database.reads == []
+
+
+class FakeSapModel:
+    def __init__(self, units: str):
+        self.DatabaseTables = FakeDatabaseTables()
+        self.present = _UNITS.index(units) + 1
+        self.switches = []
+
+    def GetPresentUnits(self):
+        return self.present
+
+    def SetPresentUnits(self, Units):
+        self.switches.append(_UNITS[Units - 1])
+        self.present = Units
+        return 0
+
+
+def test_get_many_switches_units_once():
+    sap = SimpleNamespace(SapModel=FakeSapModel(units="kip_ft_F"))
+    table = Table(mySapObject=sap, Model=Model(mySapObject=sap))
+    tables = table.get_many(list(TABLES))
+
+    assert list(tables) == list(TABLES)
+    assert len(sap.SapModel.DatabaseTables.reads) == 2
+    assert sap.SapModel.switches == ["N_m_C", "kip_ft_F"]
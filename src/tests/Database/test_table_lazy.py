@@ -0,0 +1,47 @@
+import pandas as pd
+import pytest
+
+from ak_sap.Database.table_lazy import LazyTable
+from ak_sap.Database.table_structured_data import FieldData
+
+DATA = pd.DataFrame({"Joint": ["1", "2"], "Y": ["0", "1"], "Z": ["0.5", "1"]})
+
+
+class FakeTable:
+    def __init__(self):
+        self.requests = []
+
+    def _schema(self, TableKey):
+        return [FieldData(column, column, "", "", True) for column in DATA.columns]
+
+    def get(self, TableKey, fields, group, typed):
+        self.requests.append(fields)
+        return DATA[fields]
+
+
+def test_lazy_table_batches_and_memoizes_columns():
+    table = FakeTable()
+    lazy = LazyTable(table, "Joint Coordinates")
+    assert table.requests == []
+
+    lazy.prefetch(["Z"])
+    assert lazy["Joint"].tolist() == ["1", "2"]
+    pd.testing.assert_frame_equal(lazy[["Z", "Joint"]], DATA[["Z", "Joint"]])
+    assert table.requests == [["Joint", "Z"]]
+
+    lazy.to_frame()
+    assert table.requests == [["Joint", "Z"], ["Y"]]
+
+
+def test_lazy_table_unknown_field():
+    lazy = LazyTable(FakeTable(), "Joint Coordinates")
+    with pytest.raises(KeyError):
+        lazy["X"]
+
+
+def test_lazy_table_without_fields():
+    table = FakeTable()
+    table._schema = lambda TableKey: []
+    lazy = LazyTable(table, "Unknown Table")
+    assert len(lazy) == 0
+    assert table.requests == []
@@ -0,0 +1,72 @@
+import pandas as pd
+import pytest
+
+from ak_sap.Database.table_snapshot import SnapshotWriter, TableSnapshot
+from ak_sap.Database.table_structured_data import DatabaseTable, FieldData
+
+pytest.importorskip("pyarrow")
+
+TABLES = [
+    DatabaseTable(
+        TableKey="Frame Section Assignments",
+        TableName="Frame Sections",
+        ImportType="importable, but not interactively importable",
+        IsEmpty=False,
+    ),
+    DatabaseTable(
+        TableKey="Joint Coordinates",
+        TableName="Joint Coordinates",
+        ImportType="importable, but not interactively importable",
+        IsEmpty=False,
+    ),
+]
+FIELDS = [
+    FieldData("Frame", "Frame", "Frame label", "", True),
+    FieldData("AnalSect", "Analysis Section", "Section name", "", True),
+    FieldData("Length", "Length", "Frame length", "m", False),
+]
+DATA = pd.DataFrame(
+    {
+        "Frame": ["1", "2", "3"],
+        "AnalSect": pd.Categorical(["W310", "W310", "W200"]),
+        "Length": [3.5, 4.0, 1.0],
+    }
+)
+
+
+def test_snapshot_roundtrip(tmp_path):
+    writer = SnapshotWriter(tmp_path, model="model.sdb", units="N_m_C")
+    writer.add(table=TABLES[0], data=DATA, fields=FIELDS)
+    snapshot = TableSnapshot(writer.close())
+
+    assert len(snapshot) == 1
+    assert TABLES[0].TableKey in snapshot
+    assert snapshot.units == "N_m_C"
+    assert snapshot.list_all() == [TABLES[0]]
+    assert snapshot.get_table_fields(TABLES[0].TableKey) == FIELDS
+    pd.testing.assert_frame_equal(snapshot.get(TABLES[0].TableKey), DATA)
+    pd.testing.assert_frame_equal(
+        snapshot.get(TABLES[0].TableKey, fields=["Length"]), DATA[["Length"]]
+    )
+    assert snapshot.get(TABLES[0].TableKey, dataframe=False)[0] == {
+        "Frame": "1",
+        "AnalSect": "W310",
+        "Length": 3.5,
+    }
+
+
+def test_snapshot_removes_stale_files(tmp_path):
+    writer = SnapshotWriter(tmp_path)
+    for table in TABLES:
+        writer.add(table=table, data=DATA, fields=FIELDS)
+    writer.close()
+    assert len(list(tmp_path.glob("*.feather"))) == 2
+
+    writer = SnapshotWriter(tmp_path)
+    writer.add(table=TABLES[1], data=DATA.iloc[:1], fields=FIELDS)
+    writer.add(table=TABLES[1], data=DATA, fields=FIELDS)
+    snapshot = TableSnapshot(writer.close())
+
+    assert [table.TableKey for table in snapshot.list_all()] == [TABLES[1].TableKey]
+    assert len(list(tmp_path.glob("*.feather"))) == 1
+    assert len(snapshot.get(TABLES[1].TableKey)) == 3
@@ -3,9 +3,12 @@ import unittest
 import pandas as pd
 import pytest
 
+from ak_sap.Database.table_structured_data import FieldData
 from ak_sap.Database.tables import (
+    _apply_schema,
     _array_to_list_of_dicts,
     _array_to_pandas,
+    _csv_to_pandas,
     flatten_dataframe,
 )
 
@@ -59,6 +62,45 @@ def test_array_to_list_of_dicts_invalid_length():
         _array_to_list_of_dicts(headers, data)
 
 
+def test_apply_schema():
+    def field(key: str, units: str = "") -> FieldData:
+        return FieldData(
+            FieldKey=key,
+            FieldName=key,
+            Description="",
+            UnitsStr=units,
+            isImportable=True,
+        )
+
+    schema = [field("Joint"), field("OutputCase"), field("StepNum"), field("U1", "m")]
+    headers = ("Joint", "OutputCase", "StepNum", "U1")
+    data = (
+        ("1", "DEAD", "1", "0.5")
+        + ("2", "DEAD", "2", "")
+        + ("3", "DEAD", "3", "1")
+        + ("4", "LIVE", "4", "-2.5e-3")
+    )
+    df = _apply_schema(_array_to_pandas(headers, data), schema)
+
+    assert df["Joint"].tolist() == ["1", "2", "3", "4"]
+    assert isinstance(df["OutputCase"].dtype, pd.CategoricalDtype)
+    assert df["StepNum"].dtype == "int32"
+    assert df["U1"].dtype == "float64"
+    assert df["U1"].isna().tolist() == [False, True, False, False]
+
+
+def test_apply_schema_keeps_numeric_case_and_section_names():
+    keys = ("OutputCase", "LoadCase", "LoadPat", "AnalSect", "DesignSect", "Material")
+    schema = [FieldData(key, key, "", "", True) for key in keys]
+    data = ("1", "100", "1", "100", "1", "100") + ("2", "100", "2", "200", "2", "200")
+    df = _apply_schema(_array_to_pandas(keys, data), schema)
+
+    for key in keys:
+        assert not pd.api.types.is_numeric_dtype(df[key]), key
+    assert df["OutputCase"].astype(str).tolist() == ["1", "2"]
+    assert df["LoadCase"].astype(str).tolist() == ["100", "100"]
+
+
 class TestFlattenDataFrame(unittest.TestCase):
     def test_flatten_empty_dataframe(self):
         df = pd.DataFrame()
@@ -103,5 +145,39 @@ class TestFlattenDataFrame(unittest.TestCase):
         )
 
 
+def test_csv_to_pandas_matches_array_transport(tmp_path):
+    headers = ("Joint", "CoordSys", "XorR", "SpecialJt")
+    data = ("1", "GLOBAL", "0.5", "", "2", "GLOBAL", "-1.25", "Yes")
+    csv_path = tmp_path / "table.csv"
+    csv_path.write_text(
+        "Joint,CoordSys,XorR,SpecialJt\n1,GLOBAL,0.5,\n2,GLOBAL,-1.25,Yes\n"
+    )
+    pd.testing.assert_frame_equal(
+        _csv_to_pandas(csv_path), _array_to_pandas(headers, data)
+    )
+
+
+def test_csv_to_pandas_skips_title_and_units_rows(tmp_path):
+    fields = [
+        FieldData("Joint", "Joint", "Joint label", "", True),
+        FieldData("XorR", "X or R", "X coordinate", "m", True),
+        FieldData("SpecialJt", "Special Joint", "Special joint", "", True),
+    ]
+    csv_path = tmp_path / "table.csv"
+    csv_path.write_text(
+        "TABLE:  Joint Coordinates\n"
+        "Joint,X or R,SpecialJt\n"
+        "Text,m,Yes/No\n"
+        "1,0.5,\n"
+        "2,-1.25,Yes\n"
+    )
+    df = _csv_to_pandas(csv_path, fields=fields)
+    assert df.columns.tolist() == ["Joint", "XorR", "SpecialJt"]
+    assert df["XorR"].tolist() == ["0.5", "-1.25"]
+
+    csv_path.write_text("Joint,XorR,SpecialJt\n1,0.5,\n")
+    assert _csv_to_pandas(csv_path, fields=fields)["Joint"].tolist() == ["1"]
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,19 @@
+from ak_sap.Loads.LoadCombos import combo_definition
+
+
+def test_combo_definition():
+    definition = combo_definition(
+        name="ULS",
+        combo_type=(0, 0),
+        case_list=(3, (0, 0, 1), ("DEAD", "LIVE", "WIND_ENV"), (1.25, 1.5, 0.4), 0),
+    )
+    assert definition.combo_type == "Linear Additive"
+    assert definition.cases == {"DEAD": 1.25, "LIVE": 1.5}
+    assert definition.combos == {"WIND_ENV": 0.4}
+    assert definition.factors == {"DEAD": 1.25, "LIVE": 1.5, "WIND_ENV": 0.4}
+
+    empty = combo_definition(
+        name="ENV", combo_type=(1, 0), case_list=(0, (), (), (), 0)
+    )
+    assert empty.combo_type == "Envelope"
+    assert empty.factors == {}
@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+
+from ak_sap.Model.constants import _UNITS
+from ak_sap.Model.model import Model
+
+
+class FakeSapModel:
+    def __init__(self, units: str):
+        self.present = _UNITS.index(units) + 1
+        self.switches = []
+
+    def GetPresentUnits(self):
+        return self.present
+
+    def SetPresentUnits(self, Units):
+        self.switches.append(_UNITS[Units - 1])
+        self.present = Units
+        return 0
+
+
+def make_model(units: str) -> tuple[Model, FakeSapModel]:
+    sap_model = FakeSapModel(units=units)
+    return Model(mySapObject=SimpleNamespace(SapModel=sap_model)), sap_model
+
+
+def test_units_scope_restores_units():
+    model, sap_model = make_model("kip_ft_F")
+    with model.units_scope("N_m_C"):
+        assert model.units == "N_m_C"
+    assert model.units == "kip_ft_F"
+    assert sap_model.switches == ["N_m_C", "kip_ft_F"]
+
+
+def test_units_scope_nested_same_units():
+    model, sap_model = make_model("kip_ft_F")
+    with model.units_scope("N_m_C"):
+        with model.units_scope("N_m_C"):
+            pass
+        assert sap_model.switches == ["N_m_C"]
+    assert sap_model.switches == ["N_m_C", "kip_ft_F"]
+
+
+def test_units_scope_matching_units():
+    model, sap_model = make_model("N_m_C")
+    with model.units_scope("N_m_C"):
+        pass
+    assert sap_model.switches == []
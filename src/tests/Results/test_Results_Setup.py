@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock, call
+
+from ak_sap.Results.Setup import ResultsSetup, selection_diff
+from ak_sap.utils.revision import output_revision
+
+
+def test_selection_diff():
+    to_select, to_deselect = selection_diff(
+        current={"DEAD", "WIND", "SNOW"}, requested=["LIVE", "DEAD", "LIVE", "EQ"]
+    )
+    assert to_select == ["LIVE", "EQ"]
+    assert to_deselect == ["SNOW", "WIND"]
+    assert selection_diff(current=["DEAD"], requested=["DEAD"]) == ([], [])
+
+
+def _fake_sap() -> MagicMock:
+    sap = MagicMock()
+    sap.SapModel.LoadCases.GetNameList_1.return_value = (2, ("DEAD", "LIVE"), 0)
+    sap.SapModel.RespCombo.GetNameList.return_value = (1, ("COMB1",), 0)
+    sap.SapModel.Results.Setup.GetCaseSelectedForOutput.return_value = (True, 0)
+    sap.SapModel.Results.Setup.GetComboSelectedForOutput.return_value = (False, 0)
+    sap.SapModel.Results.Setup.SetCaseSelectedForOutput.return_value = 0
+    sap.SapModel.Results.Setup.SetComboSelectedForOutput.return_value = 0
+    return sap
+
+
+def test_select():
+    sap = _fake_sap()
+    setup = ResultsSetup(mySapObject=sap)
+    revision = output_revision.value
+
+    assert setup.select(cases=["DEAD", "LIVE"]) == 0
+    assert output_revision.value == revision
+    assert setup.select(cases=["DEAD"], combos=["COMB1"]) == 2
+    assert output_revision.value == revision + 1
+    assert setup.selection() == {"cases": ["DEAD"], "combos": ["COMB1"]}
+
+    sap.SapModel.Results.Setup.SetCaseSelectedForOutput.return_value = 1
+    assert setup.select(cases=["DEAD", "LIVE"]) is None
+
+
+def test_output_scope():
+    sap = _fake_sap()
+    setup = ResultsSetup(mySapObject=sap)
+    with setup.output_scope(["LIVE", "COMB1"]):
+        assert setup.selection() == {"cases": ["LIVE"], "combos": ["COMB1"]}
+
+    assert setup.selection() == {"cases": ["DEAD", "LIVE"], "combos": []}
+    assert sap.SapModel.Results.Setup.SetComboSelectedForOutput.call_args_list == [
+        call("COMB1", True),
+        call("COMB1", False),
+    ]
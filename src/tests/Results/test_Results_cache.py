@@ -0,0 +1,157 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from ak_sap.Results.cache import ResultsCache, analysis_fingerprint
+from ak_sap.Results.main import Results, _result_columns
+from ak_sap.utils.revision import model_revision, output_revision
+
+RET = [2, ("1", "2"), ("1", "2"), ("D", "D"), (None, None), (0, 0), (1, 2), (3, 4), 0]
+STATE = {
+    "model": "model.sdb",
+    "mtime": 1.0,
+    "case_status": {"DEAD": "Finished"},
+    "selection": {"cases": ["DEAD"], "combos": []},
+    "units": 6,
+}
+
+
+def test_analysis_fingerprint():
+    assert analysis_fingerprint(**STATE) == analysis_fingerprint(**STATE)
+    saved = {**STATE, "mtime": 2.0}
+    rerun = {**STATE, "case_status": {"DEAD": "Not run"}}
+    assert analysis_fingerprint(**STATE) != analysis_fingerprint(**saved)
+    assert analysis_fingerprint(**STATE) != analysis_fingerprint(**rerun)
+
+
+def test_results_cache_roundtrip(tmp_path):
+    cache = ResultsCache(tmp_path)
+    columns = _result_columns(ret=RET, fields=("U1", "U2"))
+    fingerprint = analysis_fingerprint(**STATE)
+    key = ("JointDispl", "All", 2)
+
+    assert cache.get("model.sdb", key, fingerprint) is None
+    cache.put("model.sdb", key, fingerprint, columns)
+    cached = cache.get("model.sdb", key, fingerprint)
+    assert list(cached) == list(columns)
+    assert cached["ObjectName"].dtype == object
+    assert cached["StepType"].tolist() == [None, None]
+    np.testing.assert_array_equal(cached["U2"], [3.0, 4.0])
+
+    assert list(tmp_path.glob("*.tmp")) == []
+
+    assert cache.get("model.sdb", key, "stale") is None
+    assert not cache.path("model.sdb", key).exists()
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_results_cache_memmap(tmp_path):
+    cache = ResultsCache(tmp_path)
+    values = np.arange(24, dtype=float).reshape(2, 2, 6)
+    labels = {"modes": [1, 2], "joints": ["1", "2"]}
+    key = ("ModeShape", "MODAL", "All")
+
+    assert cache.get_array("model.sdb", key, "abc") is None
+    stored = cache.put_array("model.sdb", key, "abc", values, labels)
+    assert isinstance(stored, np.memmap)
+    cached, cached_labels = cache.get_array("model.sdb", key, "abc")
+    assert isinstance(cached, np.memmap) and not cached.flags.writeable
+    np.testing.assert_array_equal(cached, values)
+    assert cached_labels == labels
+    del stored
+
+    rerun = cache.put_array("model.sdb", key, "def", values + 1, labels)
+    np.testing.assert_array_equal(cached, values)
+    np.testing.assert_array_equal(rerun, values + 1)
+    assert len(list(tmp_path.glob("*.npy"))) == 2
+    del cached, rerun
+
+    assert cache.get_array("model.sdb", key, "stale") is None
+    assert list(tmp_path.iterdir()) == []
+    cache.clear()
+
+
+def test_results_fingerprint_memoized():
+    sap = MagicMock()
+    sap.SapModel.GetModelFilename.return_value = "model.sdb"
+    sap.SapModel.Analyze.GetCaseStatus.return_value = (1, "DEAD", 4, 0)
+    sap.SapModel.GetPresentUnits.return_value = 6
+    sap.SapModel.LoadCases.GetNameList_1.return_value = (1, ("DEAD",), 0)
+    sap.SapModel.RespCombo.GetNameList.return_value = (0, (), 0)
+    sap.SapModel.Results.Setup.GetCaseSelectedForOutput.return_value = (True, 0)
+    results = Results(mySapObject=sap)
+
+    fingerprint = results.fingerprint()
+    assert results.fingerprint() == fingerprint
+    assert sap.SapModel.LoadCases.GetNameList_1.call_count == 1
+
+    output_revision.bump()
+    assert results.fingerprint() == fingerprint
+    assert sap.SapModel.LoadCases.GetNameList_1.call_count == 2
+
+    sap.SapModel.Analyze.GetCaseStatus.return_value = (1, "DEAD", 1, 0)
+    assert results.fingerprint() != fingerprint
+
+
+def test_results_cache_skips_selection(tmp_path):
+    sap = MagicMock()
+    sap.SapModel.GetModelFilename.return_value = str(tmp_path / "model.sdb")
+    sap.SapModel.Analyze.GetCaseStatus.return_value = (1, ("DEAD",), (4,), 0)
+    sap.SapModel.GetPresentUnits.return_value = 6
+    sap.SapModel.LoadCases.GetNameList_1.return_value = (1, ("DEAD",), 0)
+    sap.SapModel.RespCombo.GetNameList.return_value = (0, (), 0)
+    sap.SapModel.Results.Setup.GetCaseSelectedForOutput.return_value = (True, 0)
+    results = Results(mySapObject=sap)
+    results.enable_cache(tmp_path)
+
+    for joint in ("1", "2"):
+        sap.SapModel.Results.JointDispl.return_value = (
+            1,
+            (joint,),
+            (joint,),
+            ("DEAD",),
+            (None,),
+            (0.0,),
+            *[(1.0,)] * 6,
+            0,
+        )
+        df = results.joint_results("displacements", selection=True)
+        assert df.index.get_level_values("Joint").tolist() == [joint]
+    assert list(tmp_path.glob("*.npz")) == []
+
+
+def test_results_delete_drops_cached_results(tmp_path):
+    sap = MagicMock()
+    sap.SapModel.GetModelFilename.return_value = str(tmp_path / "model.sdb")
+    sap.SapModel.Analyze.GetCaseStatus.return_value = (1, "DEAD", 4, 0)
+    sap.SapModel.Analyze.DeleteResults.return_value = 0
+    sap.SapModel.GetPresentUnits.return_value = 6
+    sap.SapModel.LoadCases.GetNameList_1.return_value = (1, ("DEAD",), 0)
+    sap.SapModel.RespCombo.GetNameList.return_value = (0, (), 0)
+    sap.SapModel.Results.Setup.GetCaseSelectedForOutput.return_value = (True, 0)
+    sap.SapModel.Results.JointDispl.return_value = (
+        1,
+        ("1",),
+        ("1",),
+        ("DEAD",),
+        (None,),
+        (0.0,),
+        *[(1.0,)] * 6,
+        0,
+    )
+    results = Results(mySapObject=sap)
+    results.enable_cache(tmp_path)
+
+    results.joint_results("displacements")
+    results.joint_results("displacements")
+    assert sap.SapModel.Results.JointDispl.call_count == 1
+
+    revision = model_revision.value
+    results.delete("DEAD")
+    sap.SapModel.Analyze.DeleteResults.assert_called_once_with("DEAD", False)
+    assert model_revision.value == revision + 1
+
+    sap.SapModel.Analyze.GetCaseStatus.return_value = (1, "DEAD", 1, 0)
+    results.joint_results("displacements")
+    assert sap.SapModel.Results.JointDispl.call_count == 2
+    assert (results.cache.hits, results.cache.misses) == (1, 2)
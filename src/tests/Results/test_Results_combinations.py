@@ -0,0 +1,113 @@
+from unittest.mock import MagicMock, call
+
+import numpy as np
+import pandas as pd
+
+from ak_sap.Loads.types import ComboDefinition
+from ak_sap.Results.combinations import case_stack, combine, combine_definitions
+from ak_sap.Results.main import Results
+
+
+def _stack():
+    results = pd.DataFrame(
+        {
+            "Joint": ["1", "2", "1", "2", "1", "1", "2", "2"],
+            "LoadCase": ["DEAD", "DEAD", "LIVE", "LIVE", "TH", "TH", "TH", "TH"],
+            "StepNum": [0.0, 0.0, 0.0, 0.0, 1.0, 2.0, 1.0, 2.0],
+            "U1": [1.0, 2.0, -1.0, 0.5, 3.0, -2.0, 1.0, 4.0],
+        }
+    ).set_index(["Joint", "LoadCase", "StepNum"])
+    return case_stack(results, fields=("U1",))
+
+
+def test_case_stack():
+    stack = _stack()
+    assert stack.cases == ["DEAD", "LIVE", "TH"]
+    assert stack.items == ["1", "2"]
+    np.testing.assert_array_equal(
+        stack.upper[..., 0], [[1.0, 2.0], [-1.0, 0.5], [3.0, 4.0]]
+    )
+    np.testing.assert_array_equal(
+        stack.lower[..., 0], [[1.0, 2.0], [-1.0, 0.5], [-2.0, 1.0]]
+    )
+    assert stack.to_frame().loc[("1", "TH"), ("U1", "Min")] == -2.0
+
+
+def test_combine():
+    stack = _stack()
+    factors = np.array([[1.25, 1.5, 0.0], [0.9, 0.0, -1.0]])
+
+    upper, lower = combine(stack, factors=factors, combo_type="Linear Additive")
+    np.testing.assert_allclose(upper[..., 0], [[-0.25, 3.25], [2.9, 0.8]])
+    np.testing.assert_allclose(lower[..., 0], [[-0.25, 3.25], [-2.1, -2.2]])
+
+    upper, lower = combine(stack, factors=factors, combo_type="Envelope")
+    np.testing.assert_allclose(upper[..., 0], [[1.25, 2.5], [2.0, 1.8]])
+    np.testing.assert_allclose(lower[..., 0], [[-1.5, 0.75], [-3.0, -4.0]])
+
+    upper, lower = combine(stack, factors=factors, combo_type="Absolute Additive")
+    np.testing.assert_allclose(upper[..., 0], [[2.75, 3.25], [3.9, 5.8]])
+    np.testing.assert_allclose(lower, -upper)
+
+    upper, _ = combine(stack, factors=factors, combo_type="SRSS")
+    np.testing.assert_allclose(
+        upper[..., 0],
+        [
+            [np.hypot(1.25, 1.5), np.hypot(2.5, 0.75)],
+            [np.hypot(0.9, 3.0), np.hypot(1.8, 4.0)],
+        ],
+    )
+
+    upper, lower = combine(stack, factors=factors, combo_type="Range Additive")
+    np.testing.assert_allclose(upper[..., 0], [[1.25, 3.25], [2.9, 1.8]])
+    np.testing.assert_allclose(lower[..., 0], [[-1.5, 0.0], [-3.0, -4.0]])
+
+
+def test_combine_definitions():
+    stack = _stack()
+    definitions = [
+        ComboDefinition(
+            name="ULS",
+            combo_type="Linear Additive",
+            cases={"DEAD": 1.0},
+            combos={"ENV": 1.0},
+        ),
+        ComboDefinition(
+            name="ENV", combo_type="Envelope", cases={"LIVE": 1.0, "TH": 1.0}
+        ),
+    ]
+    combos = combine_definitions(stack, definitions=definitions)
+    assert combos.cases == ["ULS", "ENV"]
+    np.testing.assert_allclose(combos.upper[..., 0], [[4.0, 6.0], [3.0, 4.0]])
+    np.testing.assert_allclose(combos.lower[..., 0], [[-1.0, 2.5], [-2.0, 0.5]])
+
+
+def test_results_combine_selects_cases():
+    sap = MagicMock()
+    sap.SapModel.LoadCases.GetNameList_1.return_value = (3, ("DEAD", "LIVE", "WIND"), 0)
+    sap.SapModel.RespCombo.GetNameList.return_value = (0, (), 0)
+    setup = sap.SapModel.Results.Setup
+    setup.GetCaseSelectedForOutput.return_value = (True, 0)
+    setup.SetCaseSelectedForOutput.return_value = 0
+    sap.SapModel.Results.JointDispl.return_value = (
+        2,
+        ("1", "1"),
+        ("1", "1"),
+        ("DEAD", "LIVE"),
+        (None, None),
+        (0.0, 0.0),
+        *[(1.0, 2.0)] * 6,
+        0,
+    )
+    combo = ComboDefinition(
+        name="ULS", combo_type="Linear Additive", cases={"DEAD": 1.25, "LIVE": 1.5}
+    )
+
+    stack = Results(mySapObject=sap).combine("displacements", combos=[combo])
+
+    assert stack.cases == ["ULS"]
+    np.testing.assert_array_equal(stack.upper[0, 0], [4.25] * 6)
+    assert setup.SetCaseSelectedForOutput.call_args_list == [
+        call("WIND", False),
+        call("WIND", True),
+    ]
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from ak_sap.Results.drift import assign_levels, story_drift
+
+
+def test_assign_levels():
+    codes, elevations = assign_levels(np.array([3.0, 0.0, 3.0004, 6.0, 0.0]))
+    assert codes.tolist() == [1, 0, 1, 2, 0]
+    np.testing.assert_array_equal(elevations, [0.0, 3.0, 6.0])
+
+
+def test_story_drift():
+    # Two column lines of three joints each, and a joint at an offset plan position
+    coordinates = pd.DataFrame(
+        {
+            "X": [0.0, 0.0, 0.0, 5.0, 5.0, 5.0, 9.0],
+            "Y": [0.0] * 7,
+            "Z": [0.0, 3.0, 6.0, 0.0, 3.0, 6.0, 6.0],
+        },
+        index=["1", "2", "3", "4", "5", "6", "7"],
+    )
+    u1 = {
+        "DEAD": [0, 0.003, 0.006, 0, 0.003, 0.006, 0.1],
+        "EQ": [0, 0.03, 0.03, 0, -0.06, -0.03, 0.1],
+    }
+    rows = [
+        (joint, case, 0.0, u, 0.0)
+        for case, values in u1.items()
+        for joint, u in zip(coordinates.index, values)
+    ]
+    displacements = pd.DataFrame(
+        rows, columns=["Joint", "LoadCase", "StepNum", "U1", "U2"]
+    ).set_index(["Joint", "LoadCase", "StepNum"])
+
+    drift = story_drift(displacements.iloc[::-1], coordinates=coordinates)
+    assert drift.index.tolist() == [3.0, 6.0]
+    np.testing.assert_allclose(drift[("U1", "Drift")], [-0.02, 0.01])
+    assert drift[("U1", "Joint")].tolist() == ["5", "6"]
+    assert drift[("U1", "LoadCase")].tolist() == ["EQ", "EQ"]
+    np.testing.assert_array_equal(drift[("U2", "Drift")], [0.0, 0.0])
+
+
+def test_story_drift_empty():
+    coordinates = pd.DataFrame({"X": [0.0], "Y": [0.0], "Z": [0.0]}, index=["1"])
+    displacements = pd.DataFrame(
+        columns=["Joint", "LoadCase", "StepNum", "U1", "U2"]
+    ).set_index(["Joint", "LoadCase", "StepNum"])
+
+    drift = story_drift(displacements, coordinates=coordinates)
+    assert drift.empty and drift.index.name == "Z"
+    assert drift.columns.tolist()[:2] == [("U1", "Drift"), ("U1", "Joint")]
+
+    # A single level has no joint below it to compute a drift ratio from
+    ground = pd.DataFrame(
+        [("1", "DEAD", 0.0, 0.1, 0.0)],
+        columns=["Joint", "LoadCase", "StepNum", "U1", "U2"],
+    ).set_index(["Joint", "LoadCase", "StepNum"])
+    assert story_drift(ground, coordinates=coordinates).empty
@@ -0,0 +1,73 @@
+from unittest.mock import MagicMock, call
+
+import numpy as np
+import pandas as pd
+
+from ak_sap.Results.envelope import envelope
+from ak_sap.Results.main import Results
+
+
+def test_envelope():
+    results = pd.DataFrame(
+        {
+            "Joint": ["1", "1", "1", "2", "2"],
+            "LoadCase": ["DEAD", "LIVE", "TH", "DEAD", "TH"],
+            "StepNum": [0.0, 0.0, 3.0, 0.0, 7.0],
+            "U1": [1.0, -4.0, 2.0, 0.5, 0.25],
+            "U2": [0.0, 1.0, -1.5, -2.0, 3.0],
+        }
+    ).set_index(["Joint", "LoadCase", "StepNum"])
+    env = envelope(results.sample(frac=1, random_state=0), fields=("U1", "U2"))
+
+    assert sorted(env.index) == ["1", "2"]
+    env = env.loc[["1", "2"]]
+    np.testing.assert_array_equal(env[("U1", "Max")], [2.0, 0.5])
+    assert env[("U1", "MaxCase")].tolist() == ["TH", "DEAD"]
+    assert env[("U1", "MaxStep")].tolist() == [3.0, 0.0]
+    np.testing.assert_array_equal(env[("U1", "Min")], [-4.0, 0.25])
+    np.testing.assert_array_equal(env[("U1", "AbsMax")], [-4.0, 0.5])
+    np.testing.assert_array_equal(env[("U2", "AbsMax")], [-1.5, 3.0])
+    assert env[("U2", "AbsMaxCase")].tolist() == ["TH", "TH"]
+    assert env[("U2", "AbsMaxStep")].tolist() == [3.0, 7.0]
+
+
+def test_envelope_skips_nan():
+    results = pd.DataFrame(
+        {
+            "Joint": ["1", "2", "1", "2", "1"],
+            "LoadCase": ["DEAD", "DEAD", "LIVE", "LIVE", "TH"],
+            "StepNum": [0.0, 0.0, 0.0, 0.0, 1.0],
+            "U1": [np.nan, np.nan, -3.0, np.nan, 2.0],
+        }
+    ).set_index(["Joint", "LoadCase", "StepNum"])
+    env = envelope(results, fields=("U1",)).loc[["1", "2"]]
+
+    np.testing.assert_array_equal(env[("U1", "Max")], [2.0, np.nan])
+    assert env[("U1", "MaxCase")].tolist() == ["TH", "DEAD"]
+    np.testing.assert_array_equal(env[("U1", "Min")], [-3.0, np.nan])
+    assert env[("U1", "MinCase")].tolist() == ["LIVE", "DEAD"]
+    np.testing.assert_array_equal(env[("U1", "AbsMax")], [-3.0, np.nan])
+
+
+def _joint_ret(joint: str, item_type: int) -> tuple:
+    return (1, (joint,), (joint,), ("DEAD",), (None,), (0.0,), *[(1.0,)] * 6, 0)
+
+
+def test_results_envelope_joints_and_cases():
+    sap = MagicMock()
+    sap.SapModel.LoadCases.GetNameList_1.return_value = (2, ("DEAD", "LIVE"), 0)
+    sap.SapModel.RespCombo.GetNameList.return_value = (0, (), 0)
+    setup = sap.SapModel.Results.Setup
+    setup.GetCaseSelectedForOutput.return_value = (True, 0)
+    setup.SetCaseSelectedForOutput.return_value = 0
+    sap.SapModel.Results.JointDispl.side_effect = _joint_ret
+    results = Results(mySapObject=sap)
+
+    env = results.envelope("displacements", items=["2", "1"], cases=["DEAD"])
+
+    assert env.index.tolist() == ["2", "1"]
+    sap.SapModel.Results.JointDispl.assert_has_calls([call("2", 0), call("1", 0)])
+    assert setup.SetCaseSelectedForOutput.call_args_list == [
+        call("LIVE", False),
+        call("LIVE", True),
+    ]
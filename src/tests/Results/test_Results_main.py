@@ -1,4 +1,20 @@
-from ak_sap.Results.main import joint_displacements_parse, joint_reactions_parse
+from unittest.mock import MagicMock, call
+
+import numpy as np
+import pytest
+
+from ak_sap.Results.constants import JOINT_RESULT_FIELDS, LINK_FORCE_FIELDS
+from ak_sap.Results.main import (
+    Results,
+    base_reactions_parse,
+    element_results_frame,
+    frame_forces_parse,
+    joint_displacements_parse,
+    joint_reactions_parse,
+    joint_results_frame,
+    parse_results,
+    step_windows,
+)
 
 
 def test_joint_reactions():
@@ -129,3 +145,202 @@ def test_joint_displacements():
             "R3": 6,
         }
     ]
+
+
+def test_joint_results_frame():
+    ret = [
+        3,
+        ("1", "2", "1"),
+        ("1", "2", "1"),
+        ("DEAD", "DEAD", "LIVE"),
+        ("", "", ""),
+        (0.0, 0.0, 0.0),
+        (1, 2, 3),
+        (0, 0, 0),
+        (0, 0, 0),
+        (0, 0, 0),
+        (0, 0, 0),
+        (0, 0, 6),
+        0,
+    ]
+    df = joint_results_frame(ret=ret, fields=("F1", "F2", "F3", "M1", "M2", "M3"))
+    assert df.index.names == ["Joint", "LoadCase", "StepNum"]
+    assert list(df.columns) == [
+        "ElementName",
+        "StepType",
+        *("F1", "F2", "F3", "M1", "M2", "M3"),
+    ]
+    assert df.loc[("1", "LIVE", 0.0), "M3"] == 6.0
+    assert df["F1"].dtype == "float64"
+
+
+def test_parse_results():
+    ret = [
+        2,
+        ("1", "2"),
+        ("1", "2"),
+        ("DEAD",) * 2,
+        ("", ""),
+        (0, 1),
+        (1, 2),
+        (3, 4),
+        0,
+    ]
+    results = parse_results(ret=ret, fields=("U1", "U2"))
+    assert results.shape == (2,)
+    assert results["StepNum"].dtype == "float64"
+    assert results["U2"].tolist() == [3.0, 4.0]
+    assert results["ObjectName"].tolist() == ["1", "2"]
+
+    ret = [1, ("1",), ("1",), ("DEAD",), ("",), (0,), (1,), (3,), 0]
+    single = parse_results(ret=ret, fields=("U1", "U2"))
+    assert single["U1"].tolist() == [1.0]
+
+
+def test_frame_forces_parse():
+    rows = [
+        (frame, station, f"{frame}-1", station, case, "", 0.0, *[station + offset] * 6)
+        for frame, stations in (("1", (0.0, 1.5, 3.0)), ("2", (0.0, 2.0)))
+        for case, offset in (("DEAD", 0.0), ("LIVE", 10.0))
+        for station in stations
+    ]
+    forces = frame_forces_parse(ret=[len(rows), *zip(*rows), 0])
+    assert forces.values.shape == (2, 3, 2, 6)
+    assert forces.frames == ["1", "2"]
+    assert forces.cases == [("DEAD", "", 0.0), ("LIVE", "", 0.0)]
+    np.testing.assert_array_equal(forces.stations[1], [0.0, 2.0, np.nan])
+    np.testing.assert_array_equal(
+        forces.sel("2", "M3"), [[0.0, 10.0], [2.0, 12.0], [np.nan, np.nan]]
+    )
+    assert len(forces.to_frame()) == len(rows)
+
+
+def test_element_results_frame():
+    ret = [2, ("L1", "L1"), ("1", "1"), ("3", "4"), ("D", "D"), ("", ""), (0, 0)]
+    ret += [(1, 2)] * 6 + [0]
+    df = element_results_frame(ret=ret, fields=LINK_FORCE_FIELDS, label="Link")
+    assert df.index.names == ["Link", "Point", "LoadCase", "StepNum"]
+    assert df.loc[("L1", "4", "D", 0.0), "P"] == 2.0
+
+
+def test_base_reactions_parse():
+    ret = [
+        2,
+        ("DEAD", "LIVE"),
+        ("", ""),
+        (0, 0),
+        *[(float(i), float(-i)) for i in range(6)],
+        1.0,
+        2.0,
+        0.0,
+        0,
+    ]
+    df = base_reactions_parse(ret=ret)
+    assert df.index.names == ["LoadCase", "StepNum"]
+    assert df.loc[("LIVE", 0.0), "MZ"] == -5.0
+    assert df.attrs["location"] == {"x": 1.0, "y": 2.0, "z": 0.0}
+
+
+def _displ_ret(steps: list[float]) -> tuple:
+    n = len(steps)
+    return (
+        n,
+        ("1",) * n,
+        ("1",) * n,
+        ("TH",) * n,
+        ("Step By Step",) * n,
+        tuple(steps),
+        *[tuple(steps)] * 6,
+        0,
+    )
+
+
+def _fake_sap() -> MagicMock:
+    sap = MagicMock()
+    sap.SapModel.LoadCases.GetNameList_1.return_value = (2, ("DEAD", "TH"), 0)
+    sap.SapModel.RespCombo.GetNameList.return_value = (0, (), 0)
+    sap.SapModel.Results.Setup.GetCaseSelectedForOutput.return_value = (True, 0)
+    sap.SapModel.Results.Setup.SetCaseSelectedForOutput.return_value = 0
+    sap.SapModel.Results.JointDispl.return_value = _displ_ret([1.0, 2.0, 3.0])
+    return sap
+
+
+def test_iter_joint_results_restores_selection_on_close():
+    sap = _fake_sap()
+    generator = Results(mySapObject=sap).iter_joint_results(
+        "displacements", cases=["DEAD", "TH"]
+    )
+    case, results = next(generator)
+    generator.close()
+
+    assert case == "DEAD" and len(results) == 3
+    assert sap.SapModel.Results.Setup.SetCaseSelectedForOutput.call_args_list == [
+        call("TH", False),
+        call("TH", True),
+    ]
+
+
+def test_iter_joint_results_restores_selection_on_exception():
+    sap = _fake_sap()
+    sap.SapModel.Results.JointDispl.side_effect = [_displ_ret([0.0]), RuntimeError]
+    generator = Results(mySapObject=sap).iter_joint_results(
+        "displacements", cases=["DEAD", "TH"]
+    )
+    next(generator)
+    with pytest.raises(RuntimeError):
+        next(generator)
+
+    assert sap.SapModel.Results.Setup.SetCaseSelectedForOutput.call_args_list == [
+        call("TH", False),
+        call("DEAD", False),
+        call("TH", True),
+        call("DEAD", True),
+    ]
+
+
+def test_iter_joint_results_windows():
+    sap = _fake_sap()
+    blocks = list(
+        Results(mySapObject=sap).iter_joint_results(
+            "displacements", cases=["TH"], window=2
+        )
+    )
+
+    assert [case for case, _ in blocks] == ["TH", "TH"]
+    assert [block["StepNum"].tolist() for _, block in blocks] == [[1.0, 2.0], [3.0]]
+
+
+def test_step_windows():
+    results = parse_results(
+        ret=_displ_ret([2.0, 1.0, 3.0, 1.0]),
+        fields=JOINT_RESULT_FIELDS["displacements"],
+    )
+    blocks = step_windows(results, window=2)
+
+    assert [block["StepNum"].tolist() for block in blocks] == [[2.0, 1.0, 1.0], [3.0]]
+    assert len(step_windows(results[:0], window=2)) == 1
+
+
+def test_base_reactions_restores_location():
+    sap = MagicMock()
+    setup = sap.SapModel.Results.Setup
+    setup.GetOptionBaseReactLoc.return_value = (1.0, 2.0, 0.0, 0)
+    setup.SetOptionBaseReactLoc.return_value = 0
+    sap.SapModel.Results.BaseReact.return_value = (
+        1,
+        ("DEAD",),
+        ("",),
+        (0.0,),
+        *[(1.0,)] * 6,
+        0.0,
+        0.0,
+        5.0,
+        0,
+    )
+
+    df = Results(mySapObject=sap).base_reactions(location=(0.0, 0.0, 5.0))
+    assert df.attrs["location"] == {"x": 0.0, "y": 0.0, "z": 5.0}
+    assert setup.SetOptionBaseReactLoc.call_args_list == [
+        call(0.0, 0.0, 5.0),
+        call(1.0, 2.0, 0.0),
+    ]
@@ -0,0 +1,88 @@
+from unittest.mock import MagicMock, call
+
+import numpy as np
+
+from ak_sap.Results.constants import (
+    CASE_HEADER_FIELDS,
+    MODAL_MASS_RATIO_FIELDS,
+    MODAL_PERIOD_FIELDS,
+    MODE_SHAPE_FIELDS,
+)
+from ak_sap.Results.main import Results, _result_columns
+from ak_sap.Results.modal import modal_frame, mode_shapes
+
+
+def test_modal_frame():
+    ret = [
+        2,
+        ("MODAL", "MODAL"),
+        ("Mode", "Mode"),
+        (1.0, 2.0),
+        (0.5, 0.25),
+        (2.0, 4.0),
+        (12.566, 25.133),
+        (157.91, 631.65),
+        0,
+    ]
+    columns = _result_columns(
+        ret=ret, fields=MODAL_PERIOD_FIELDS, header=CASE_HEADER_FIELDS
+    )
+    periods = modal_frame(columns)
+    assert periods.index.names == ["LoadCase", "Mode"]
+    assert periods.loc[("MODAL", 2), "Period"] == 0.25
+    assert list(periods.columns) == list(MODAL_PERIOD_FIELDS)
+
+
+def test_mode_shapes():
+    ret = [
+        5,
+        ("1", "2", "1", "2", "1"),
+        ("1", "2", "1", "2", "1"),
+        ("MODAL", "MODAL", "MODAL", "MODAL", "RITZ"),
+        ("Mode",) * 5,
+        (2.0, 2.0, 1.0, 1.0, 1.0),
+        *[tuple(float(i * 10 + j) for j in range(5)) for i in range(6)],
+        0,
+    ]
+    shapes = mode_shapes(
+        _result_columns(ret=ret, fields=MODE_SHAPE_FIELDS), case="MODAL"
+    )
+    assert shapes.values.shape == (2, 2, 6)
+    assert shapes.modes == [1, 2]
+    assert shapes.joints == ["1", "2"]
+    np.testing.assert_array_equal(shapes.mode(1)[:, 0], [2.0, 3.0])
+    np.testing.assert_array_equal(shapes.sel("2", "U2"), [13.0, 11.0])
+    assert shapes.to_frame().loc[(2, "1"), "R3"] == 50.0
+
+
+def _case_ret(fields: tuple[str, ...]) -> tuple:
+    return (1, ("MODAL",), ("Mode",), (1.0,), *[(0.5,)] * len(fields), 0)
+
+
+def test_modal_restores_selection():
+    sap = MagicMock()
+    sap.SapModel.LoadCases.GetNameList_1.return_value = (2, ("DEAD", "MODAL"), 0)
+    sap.SapModel.RespCombo.GetNameList.return_value = (0, (), 0)
+    setup = sap.SapModel.Results.Setup
+    setup.GetCaseSelectedForOutput.return_value = (True, 0)
+    setup.SetCaseSelectedForOutput.return_value = 0
+    sap.SapModel.Results.ModalPeriod.return_value = _case_ret(MODAL_PERIOD_FIELDS)
+    sap.SapModel.Results.ModalParticipatingMassRatios.return_value = _case_ret(
+        MODAL_MASS_RATIO_FIELDS
+    )
+    results = Results(mySapObject=sap)
+
+    modal = results.modal(case="MODAL", shapes=False)
+    assert modal.periods.loc[("MODAL", 1), "Period"] == 0.5
+    assert modal.shapes is None
+
+    sap.SapModel.Results.ModalPeriod.side_effect = RuntimeError
+    assert results.modal(case="MODAL", shapes=False) is None
+    assert (
+        setup.SetCaseSelectedForOutput.call_args_list
+        == [
+            call("DEAD", False),
+            call("DEAD", True),
+        ]
+        * 2
+    )
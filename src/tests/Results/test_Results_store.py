@@ -0,0 +1,131 @@
+from unittest.mock import MagicMock, call
+
+import numpy as np
+import pytest
+
+from ak_sap.Results.constants import (
+    FRAME_FORCE_FIELDS,
+    FRAME_RESULT_HEADER_FIELDS,
+    JOINT_RESULT_FIELDS,
+)
+from ak_sap.Results.main import Results, _result_columns
+from ak_sap.Results.store import ResultStore, time_series
+
+
+def test_result_store(tmp_path):
+    values = np.arange(10 * 2 * 3, dtype=float).reshape(10, 2, 3)
+    values[7, 1, 2] = -1000.0
+    steps = np.arange(10) * 0.01
+
+    store = ResultStore(tmp_path, chunk_steps=4)
+    for part in (slice(0, 6), slice(6, 10)):
+        store.write(
+            "displacements/TH-X",
+            values[part],
+            items=["1", "2"],
+            components=("U1", "U2", "U3"),
+            steps=steps[part],
+        )
+
+    series = ResultStore(tmp_path).open("displacements/TH-X")
+    assert series.shape == (10, 2, 3)
+    assert [len(chunk) for chunk in series.chunks] == [4, 2, 4]
+    assert isinstance(series[1:3], np.memmap)
+    np.testing.assert_array_equal(series[1:3], values[1:3])
+    np.testing.assert_array_equal(series[2:9], values[2:9])
+    np.testing.assert_array_equal(series[-1], values[-1])
+    np.testing.assert_array_equal(series[8:1:-3], values[8:1:-3])
+    np.testing.assert_array_equal(series[::-1], values[::-1])
+    assert series[5:5].shape == (0, 2, 3)
+    with pytest.raises(IndexError):
+        series[-11]
+    with pytest.raises(IndexError):
+        series[10]
+    np.testing.assert_array_equal(series.item("2", "U1"), values[:, 1, 0])
+
+    peaks = series.peaks()
+    np.testing.assert_array_equal(peaks[("U1", "AbsMax")], values[-1, :, 0])
+    assert peaks.loc["2", ("U3", "AbsMax")] == -1000.0
+    assert peaks.loc["2", ("U3", "AbsMaxStep")] == steps[7]
+
+    store.delete("displacements/TH-X")
+    assert "displacements/TH-X" not in ResultStore(tmp_path)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["index.json"]
+
+
+def test_time_series():
+    ret = [
+        4,
+        ("12", "12", "12", "12"),
+        (0.0, 1.5, 0.0, 1.5),
+        ("1", "1", "1", "1"),
+        (0.0, 1.5, 0.0, 1.5),
+        ("TH", "TH", "TH", "TH"),
+        ("Time", "Time", "Time", "Time"),
+        (0.02, 0.02, 0.01, 0.01),
+        *[(1.0 + i, 2.0 + i, 3.0 + i, 4.0 + i) for i in range(6)],
+        0,
+    ]
+    columns = _result_columns(
+        ret=ret, fields=FRAME_FORCE_FIELDS, header=FRAME_RESULT_HEADER_FIELDS
+    )
+    values, items, steps = time_series(
+        columns=columns, keys=("ObjectName", "ObjectStation"), fields=FRAME_FORCE_FIELDS
+    )
+    assert items == [("12", 0.0), ("12", 1.5)]
+    np.testing.assert_array_equal(steps, [0.01, 0.02])
+    np.testing.assert_array_equal(values[:, :, 0], [[3.0, 4.0], [1.0, 2.0]])
+
+
+def test_time_series_rejects_envelopes():
+    ret = [2, ("1", "1"), ("1", "1"), ("TH", "TH"), ("Max", "Min"), (0.0, 0.0)]
+    columns = _result_columns(ret=[*ret, (1.0, -1.0), 0], fields=("U1",))
+    with pytest.raises(AssertionError):
+        time_series(columns=columns, keys=("ObjectName",), fields=("U1",))
+
+
+def test_result_store_rename(tmp_path):
+    store = ResultStore(tmp_path)
+    for name, value in (("old", 1.0), ("new", 2.0)):
+        store.write(name, np.full((1, 1, 1), value), ["1"], ("U1",), steps=[0.0])
+    store.rename("new", "old")
+
+    assert ResultStore(tmp_path).list_all() == ["old"]
+    assert store["old"][0][0, 0] == 2.0
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+
+
+def test_store_time_history(tmp_path):
+    sap = MagicMock()
+    sap.SapModel.LoadCases.GetNameList_1.return_value = (1, ("TH",), 0)
+    sap.SapModel.RespCombo.GetNameList.return_value = (0, (), 0)
+    setup = sap.SapModel.Results.Setup
+    setup.GetCaseSelectedForOutput.return_value = (True, 0)
+    setup.GetOptionDirectHist.return_value = (1, 0)
+    setup.GetOptionModalHist.return_value = (2, 0)
+    setup.SetOptionDirectHist.return_value = 0
+    sap.SapModel.Results.JointDispl.return_value = (
+        3,
+        ("1", "1", "1"),
+        ("1", "1", "1"),
+        ("TH",) * 3,
+        ("Time",) * 3,
+        (0.0, 0.1, 0.2),
+        *[(1.0, 2.0, 3.0)] * 6,
+        0,
+    )
+    store = ResultStore(tmp_path)
+    store.write(
+        "displacements/TH",
+        np.zeros((1, 1, 6)),
+        ["1"],
+        JOINT_RESULT_FIELDS["displacements"],
+        [0.0],
+    )
+
+    Results(mySapObject=sap).store_time_history(store, "displacements", cases=["TH"])
+
+    assert store.list_all() == ["displacements/TH"]
+    np.testing.assert_array_equal(store["displacements/TH"].item("1", "U1"), [1, 2, 3])
+    assert setup.SetOptionDirectHist.call_args_list == [call(2), call(1)]
+    setup.SetOptionModalHist.assert_not_called()
@@ -1,4 +1,5 @@
-from ak_sap.utils.decorators import smooth_sap_do
+from ak_sap.utils.decorators import modifies_output, smooth_sap_do
+from ak_sap.utils.revision import model_revision, output_revision
 
 
 def test_smooth_sap_do():
@@ -61,3 +62,13 @@ def test_smooth_sap_do():
         return 1
 
     assert return_fail() is None
+
+
+def test_modifies_output():
+    @modifies_output
+    def select():
+        return 0
+
+    model, output = model_revision.value, output_revision.value
+    assert select() == 0
+    assert (model_revision.value, output_revision.value) == (model, output + 1)
@@ -0,0 +1,19 @@
+from ak_sap.utils.files import slugify, try_unlink
+
+
+def test_slugify():
+    assert slugify("displacements/TH-X") == "displacements_TH_X"
+    assert slugify("Frame Section Properties 01 - General") == (
+        "Frame_Section_Properties_01_General"
+    )
+    assert len(slugify("x" * 100)) == 60
+
+
+def test_try_unlink(tmp_path):
+    path = tmp_path / "chunk.npy"
+    path.write_bytes(b"")
+    try_unlink(path)
+    assert not path.exists()
+    try_unlink(path)
+    try_unlink(tmp_path)  # A directory raises OSError, which is only logged
+    assert tmp_path.exists()